@@ -2,44 +2,52 @@
 Smart NOTAM3 - 시간 필터링과 로컬시간 변환이 적용된 NOTAM 처리 애플리케이션
 """
 
-from flask import Flask, request, render_template, jsonify, redirect, url_for, flash, send_file
+from flask import Flask, request, render_template, jsonify, redirect, url_for, flash, send_file, make_response, stream_template
 from werkzeug.utils import secure_filename
 import os
 import subprocess
 import logging
 from datetime import datetime
+from time import perf_counter
 import json
-import glob
+import re
+import copy
+import functools
+import hashlib
+import io
+import mmap
+import threading
+import unicodedata
+from urllib.parse import quote
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # 로컬 모듈
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.pdf_converter import PDFConverter
-from src.notam_filter import NOTAMFilter  
-from src.notam_translator import NOTAMTranslator
-from src.hybrid_translator import HybridNOTAMTranslator
-from src.parallel_translator import ParallelHybridNOTAMTranslator
-from src.integrated_translator import IntegratedNOTAMTranslator
 # from src.fir_notam_filter import analyze_route_with_fir_notams  # FIR 기반 분석 비활성화
-from src.airport_notam_analyzer import analyze_flight_airports
-from src.notam_comprehensive_analyzer import analyze_flight_airports_comprehensive
-from src.flight_info_extractor import extract_flight_info_from_notams
 from dotenv import load_dotenv
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # 환경 변수 로드
 load_dotenv()
 
-# 로깅 설정
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+# GEMINI API 키는 시작 시 한 번만 읽음
+_GEMINI_API_KEY = os.getenv('GEMINI_API_KEY') or os.getenv('GOOGLE_API_KEY')
+
+# 로깅 설정 (기본 INFO, LOG_LEVEL 환경변수로 변경 가능 - 예: 운영 환경에서 WARNING)
+logging.basicConfig(level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
+                    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-# pdfminer의 DEBUG 로그 억제로 성능 향상
+# pdfminer의 DEBUG 로그 억제로 성능 향상 (하위 로거들은 상위 레벨을 상속)
 logging.getLogger('pdfminer').setLevel(logging.WARNING)
-logging.getLogger('pdfminer.psparser').setLevel(logging.WARNING)
-logging.getLogger('pdfminer.pdfinterp').setLevel(logging.WARNING)
-logging.getLogger('pdfminer.pdfdocument').setLevel(logging.WARNING)
-logging.getLogger('pdfminer.pdfpage').setLevel(logging.WARNING)
 
 # Flask 앱 설정
 app = Flask(__name__)
@@ -54,38 +62,63 @@ app.config['UPLOAD_FOLDER'] = UPLOAD_FOLDER
 app.config['TEMP_FOLDER'] = TEMP_FOLDER
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB
 
+def ojsonify(obj, status=200):
+    """orjson으로 JSON 응답 생성 (orjson이 없으면 Flask jsonify 사용)"""
+    if not ORJSON_AVAILABLE:
+        return jsonify(obj), status
+    return app.response_class(orjson.dumps(obj), status=status, mimetype='application/json')
+
+def loads_json(data):
+    """JSON 문자열/바이트 파싱 (orjson이 있으면 orjson 사용)"""
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+UPLOAD_CHUNK_SIZE = 1024 * 1024  # 1 MiB
+
+def save_uploaded_file(stream, filepath):
+    """
+    업로드 스트림(파일 파트 또는 요청 본문)을 1 MiB 단위로 디스크에 스트리밍 저장
+    저장하면서 SHA-256을 함께 계산하여 반환 (캐시 키 계산용 파일 재읽기 방지)
+    """
+    hasher = hashlib.sha256()
+    with open(filepath, 'wb', buffering=0) as out:
+        while True:
+            chunk = stream.read(UPLOAD_CHUNK_SIZE)
+            if not chunk:
+                break
+            hasher.update(chunk)
+            out.write(chunk)
+    return hasher.hexdigest()
+
 def cleanup_files(directory, max_files=5):
     """
     지정된 디렉토리에서 최대 파일 개수만 유지하고 나머지는 삭제
     파일은 생성 시간 기준으로 오래된 것부터 삭제
     """
     try:
-        if not os.path.exists(directory):
+        # 디렉토리를 한 번만 읽고 DirEntry의 캐시된 정보로 파일만 필터링 (숨김 파일, 심볼릭 링크 제외)
+        try:
+            with os.scandir(directory) as it:
+                entries = [entry for entry in it
+                           if entry.is_file(follow_symlinks=False) and not entry.name.startswith('.')]
+        except FileNotFoundError:
             return
-            
-        # 디렉토리 내 모든 파일 목록 가져오기
-        files = glob.glob(os.path.join(directory, '*'))
         
-        # 파일과 디렉토리만 필터링 (숨김 파일 제외)
-        files = [f for f in files if os.path.isfile(f) and not os.path.basename(f).startswith('.')]
-        
-        if len(files) <= max_files:
+        if len(entries) <= max_files:
             return
 
         # 파일 생성 시간 기준으로 정렬 (오래된 것부터)
-        files.sort(key=lambda x: os.path.getctime(x))
+        entries.sort(key=lambda entry: entry.stat(follow_symlinks=False).st_ctime)
         
         # 초과 파일들 삭제
-        files_to_delete = files[:-max_files]
-        for file_path in files_to_delete:
+        for entry in entries[:-max_files]:
             try:
-                os.remove(file_path)
-                logger.info(f"오래된 파일 삭제: {file_path}")
-            except Exception as e:
-                logger.error(f"파일 삭제 실패 {file_path}: {str(e)}")
+                os.unlink(entry.path)
+                logger.info(f"오래된 파일 삭제: {entry.path}")
+            except OSError as e:
+                logger.error(f"파일 삭제 실패 {entry.path}: {str(e)}")
                 
     except Exception as e:
         logger.error(f"파일 정리 중 오류 ({directory}): {str(e)}")
@@ -98,22 +131,181 @@ os.makedirs(TEMP_FOLDER, exist_ok=True)
 cleanup_files(UPLOAD_FOLDER, max_files=5)
 cleanup_files(TEMP_FOLDER, max_files=5)
 
-# 모듈 초기화
-pdf_converter = PDFConverter()
-notam_filter = NOTAMFilter()
-notam_translator = NOTAMTranslator()
-hybrid_translator = HybridNOTAMTranslator()
-parallel_translator = ParallelHybridNOTAMTranslator()
-integrated_translator = IntegratedNOTAMTranslator()
+# 모듈 초기화: 무거운 모듈은 처음 사용할 때 import/생성 (콜드 스타트 및 /health 응답 시간 단축)
+@functools.cache
+def get_pdf_converter():
+    from src.pdf_converter import PDFConverter
+    return PDFConverter()
+
+@functools.cache
+def get_notam_filter():
+    from src.notam_filter import NOTAMFilter
+    return NOTAMFilter()
+
+@functools.cache
+def get_notam_translator():
+    from src.notam_translator import NOTAMTranslator
+    return NOTAMTranslator()
+
+@functools.cache
+def get_hybrid_translator():
+    from src.hybrid_translator import HybridNOTAMTranslator
+    return HybridNOTAMTranslator()
+
+@functools.cache
+def get_parallel_translator():
+    from src.parallel_translator import ParallelHybridNOTAMTranslator
+    return ParallelHybridNOTAMTranslator()
+
+@functools.cache
+def get_integrated_translator():
+    from src.integrated_translator import IntegratedNOTAMTranslator
+    return IntegratedNOTAMTranslator()
+
+# 동일 PDF 재처리 방지용 캐시 (파일 내용 SHA-256 -> 결과)
+PDF_CACHE_SIZE = 16
+_TEXT_CACHE = OrderedDict()   # 해시 -> 분리된 NOTAM 텍스트 목록
+_NOTAM_CACHE = OrderedDict()  # 해시 -> 필터링된 NOTAM 목록
+_PACKAGE_SCAN_CACHE = OrderedDict()  # 해시 -> Package 헤더 공항 스캔 결과
+_pdf_cache_lock = threading.Lock()
+
+# 요청 내 독립 단계를 겹쳐 실행하기 위한 공용 스레드 풀
+_executor = ThreadPoolExecutor(max_workers=2)
+
+# NOTAM 로컬 시간 변환용 스레드 풀 (서로 다른 시간 조합이 이 개수 이상일 때만 사용)
+_time_executor = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+TIME_CONVERSION_PARALLEL_MIN = 64
+
+def _file_sha256(path):
+    """파일 내용의 SHA-256 해시 계산 (mmap으로 Python 측 복사 없이 OpenSSL에 전달)"""
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return hashlib.sha256(b'').hexdigest()  # 빈 파일은 mmap 불가
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return hashlib.sha256(view).hexdigest()
+
+def _cache_put(cache, key, value):
+    """LRU 캐시에 저장하고 최대 크기를 넘으면 가장 오래된 항목 삭제"""
+    cache[key] = value
+    cache.move_to_end(key)
+    while len(cache) > PDF_CACHE_SIZE:
+        cache.popitem(last=False)
+
+def collect_airport_codes(notams):
+    """NOTAM 목록에서 공항 코드 집합 추출 (NOTAMFilter가 airport_code를 항상 채움)"""
+    return {notam['airport_code'] for notam in notams}
+
+@functools.lru_cache(maxsize=4096)
+def _format_local_time(effective_time, expiry_time, airport_code, d_field):
+    """
+    NOTAM 로컬 시간 문자열 메모이제이션
+    format_notam_time_with_local은 NOTAM dict 중 d_field만 참조하므로 (시간, 공항, D) 필드)로 캐싱
+    """
+    parsed_notam = {'d_field': d_field} if d_field else None
+    return get_notam_filter().format_notam_time_with_local(effective_time, expiry_time, airport_code, parsed_notam)
+
+# 원문에서 ICAO 공항 코드 후보(앞뒤가 대문자가 아닌 4글자)를 찾는 패턴
+_ICAO_RE = re.compile(r'(?<![A-Z])([A-Z]{4})(?![A-Z])')
+
+def scan_airport_codes(text):
+    """
+    NOTAM 파싱 없이 원문에서 공항 데이터에 있는 ICAO 코드만 추출
+    공항 데이터(airports_timezones.csv)가 없으면 후보를 검증할 수 없으므로 None 반환
+    """
+    known_airports = get_notam_filter().airports_data
+    if not known_airports:
+        return None
+    return {code for code in set(_ICAO_RE.findall(text)) if code in known_airports}
+
+def _get_cached_notams(file_hash):
+    """캐시된 NOTAM 목록 반환 (없으면 None, 반환 목록은 읽기 전용으로 사용)"""
+    with _pdf_cache_lock:
+        notams = _NOTAM_CACHE.get(file_hash)
+        if notams is not None:
+            _NOTAM_CACHE.move_to_end(file_hash)
+        return notams
+
+def _get_text_and_notams(path, save_temp=True, file_hash=None):
+    """
+    PDF 텍스트 변환, NOTAM 필터링, Package 헤더 스캔 결과를 파일 해시 기준으로 캐싱하여 반환
+    같은 PDF를 /api/extract_airports와 /upload에서 두 번 처리하지 않도록 함
+    """
+    if file_hash is None:
+        file_hash = _file_sha256(path)
+    
+    with _pdf_cache_lock:
+        split_notams = _TEXT_CACHE.get(file_hash)
+        notams = _NOTAM_CACHE.get(file_hash)
+        package_scan = _PACKAGE_SCAN_CACHE.get(file_hash)
+        cache_hit = split_notams is not None and notams is not None and file_hash in _PACKAGE_SCAN_CACHE
+        if cache_hit:
+            _TEXT_CACHE.move_to_end(file_hash)
+            _NOTAM_CACHE.move_to_end(file_hash)
+            _PACKAGE_SCAN_CACHE.move_to_end(file_hash)
+    
+    if not cache_hit:
+        # fast=1 공항 추출에서 분할만 캐싱된 경우 PDF 변환 없이 재사용
+        if split_notams is None:
+            split_notams = get_pdf_converter().split_pdf_notams(path)
+        text = '\n\n'.join(split_notams) + '\n' if split_notams else ""
+        if text.strip():
+            # Package 헤더 스캔은 NOTAM 필터링 결과와 무관하므로 필터링과 동시에 실행
+            notam_filter = get_notam_filter()
+            package_scan_future = _executor.submit(notam_filter.scan_package_airports, text)
+            # 패키지 공항 순서는 요청마다 달라지므로 원문 순서로 캐싱하고 정렬은 호출 측에서 적용
+            notams = notam_filter.filter_korean_air_notams(text, sort_by_package=False)
+            package_scan = package_scan_future.result()
+        else:
+            notams = []
+            package_scan = None
+        with _pdf_cache_lock:
+            _cache_put(_TEXT_CACHE, file_hash, split_notams)
+            _cache_put(_NOTAM_CACHE, file_hash, notams)
+            _cache_put(_PACKAGE_SCAN_CACHE, file_hash, package_scan)
+    else:
+        logger.info(f"PDF 캐시 적중: {file_hash[:12]}")
+        text = '\n\n'.join(split_notams) + '\n' if split_notams else ""
+    
+    # /api/extract_flight_info가 읽는 _split.txt 파일은 캐시 적중 시에도 생성
+    if save_temp and split_notams:
+        get_pdf_converter().save_split_notams(path, split_notams)
+    
+    # 이후 단계에서 NOTAM dict를 수정하므로 캐시 원본은 복사본으로 보호
+    return text, copy.deepcopy(notams), package_scan
 
 @app.route('/')
 def index():
     return render_template('index.html')
 
+# 결과 페이지 스트리밍 시 한 번에 전송할 템플릿 조각 수
+RESULTS_STREAM_BUFFER = 5
+# 스트리밍 도중 렌더링 오류가 나면 이미 보낸 응답을 되돌릴 수 없으므로 페이지 끝에 붙이는 안내
+_RESULTS_RENDER_ERROR_HTML = (
+    '<div class="alert alert-danger">결과 페이지를 표시하는 중 오류가 발생했습니다. '
+    '<a href="/">처음 화면으로 돌아가기</a></div>'
+)
+
+def _buffer_results_stream(chunks, size=RESULTS_STREAM_BUFFER):
+    """템플릿 조각을 size개씩 묶어 전송하고, 렌더링 오류는 로그를 남긴 뒤 오류 안내 조각으로 마무리"""
+    buffer = []
+    try:
+        for chunk in chunks:
+            buffer.append(chunk)
+            if len(buffer) >= size:
+                yield ''.join(buffer)
+                buffer.clear()
+    except Exception as e:
+        logger.error("결과 페이지 렌더링 중 오류: %s", e)
+        buffer.append(_RESULTS_RENDER_ERROR_HTML)
+    if buffer:
+        yield ''.join(buffer)
+
 @app.route('/upload', methods=['POST'])
 def upload_file():
-    # 전체 처리 시간 측정 시작
-    total_start_time = datetime.now()
+    # 요청 시각은 한 번만 구해서 파일명 타임스탬프와 표시 날짜에 재사용
+    request_time = datetime.now()
+    # 전체 처리 시간 측정 시작 (경과 시간 측정은 단조 시계 사용)
+    total_start_time = perf_counter()
     processing_times = {}
     
     try:
@@ -128,26 +320,26 @@ def upload_file():
         
         if file and file.filename and allowed_file(file.filename):
             # 파일 저장 시간 측정
-            file_save_start = datetime.now()
+            file_save_start = perf_counter()
             filename = secure_filename(file.filename)
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+            timestamp = request_time.strftime('%Y%m%d_%H%M%S')
             filename = f"{timestamp}_{filename}"
             filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            file.save(filepath)
+            file_hash = save_uploaded_file(file.stream, filepath)
             
-            # 업로드 파일 정리 (최대 5개만 유지)
-            cleanup_files(app.config['UPLOAD_FOLDER'], max_files=5)
+            # 업로드 파일 정리 (최대 5개만 유지) - PDF 변환과 겹쳐서 백그라운드 실행
+            _executor.submit(cleanup_files, app.config['UPLOAD_FOLDER'], max_files=5)
             
-            processing_times['file_save'] = (datetime.now() - file_save_start).total_seconds()
+            processing_times['file_save'] = perf_counter() - file_save_start
             
-            # PDF 텍스트 변환 시간 측정
-            pdf_conversion_start = datetime.now()
-            logger.info(f"PDF 변환 시작: {filepath}")
-            text = pdf_converter.convert_pdf_to_text(filepath)
-            processing_times['pdf_conversion'] = (datetime.now() - pdf_conversion_start).total_seconds()
+            # PDF 텍스트 변환 시간 측정 (동일 파일은 캐시 사용)
+            pdf_conversion_start = perf_counter()
+            logger.info("PDF 변환 시작: %s", filepath)
+            text, temp_notams, package_scan = _get_text_and_notams(filepath, file_hash=file_hash)
+            processing_times['pdf_conversion'] = perf_counter() - pdf_conversion_start
             
-            logger.info(f"PDF 텍스트 변환 완료: {len(text)} 문자 ({processing_times['pdf_conversion']:.2f}초)")
-            logger.info(f"텍스트 내용 미리보기: {text[:200]}...")
+            logger.info("PDF 텍스트 변환 완료: %d 문자 (%.2f초)", len(text), processing_times['pdf_conversion'])
+            logger.debug("텍스트 내용 미리보기: %.200s...", text)
             
             if not text.strip():
                 logger.error("PDF에서 추출된 텍스트가 비어있습니다.")
@@ -156,162 +348,166 @@ def upload_file():
             
             # 먼저 Package 정보를 추출하여 동적 순서 설정
             logger.info("Package 정보 추출 시작")
-            temp_notams = notam_filter.filter_korean_air_notams(text)
-            all_airports = set()
-            for notam in temp_notams:
-                airport_code = notam.get('airport_code', '')
-                if airport_code:
-                    all_airports.add(airport_code)
-            
-            # Package 정보 추출하여 동적 순서로 업데이트
-            filtered_package_airports = notam_filter.extract_package_airports(text, all_airports)
-            
-            # 동적 순서가 적용된 상태에서 NOTAM 필터링 재실행
-            filtering_start = datetime.now()
-            logger.info("NOTAM 필터링 시작 (동적 순서 적용)")
-            notams = notam_filter.filter_korean_air_notams(text)
-            processing_times['notam_filtering'] = (datetime.now() - filtering_start).total_seconds()
-            logger.info(f"NOTAM 필터링 완료: {len(notams)}개 ({processing_times['notam_filtering']:.2f}초)")
+            all_airports = collect_airport_codes(temp_notams)
+            
+            # Package 정보 추출하여 동적 순서로 업데이트 (순서 갱신과 정렬은 같은 인스턴스에서 수행)
+            notam_filter = get_notam_filter()
+            filtered_package_airports = notam_filter.extract_package_airports(text, all_airports, scanned_airports=package_scan)
+            
+            # 동적 순서를 이미 필터링된 NOTAM 목록에 적용 (텍스트 재파싱 없음)
+            filtering_start = perf_counter()
+            logger.info("NOTAM 정렬 시작 (동적 순서 적용)")
+            notams = notam_filter.sort_by_package_order(temp_notams, text)
+            processing_times['notam_filtering'] = perf_counter() - filtering_start
+            logger.info("NOTAM 필터링 완료: %d개 (%.2f초)", len(notams), processing_times['notam_filtering'])
             
             # 공항 필터링 처리 시간 측정 (선택사항)
-            airport_filter_start = datetime.now()
+            airport_filter_start = perf_counter()
             airport_filter_data = request.form.get('airport_filter')
             if airport_filter_data:
                 try:
-                    airport_filter = json.loads(airport_filter_data)
+                    airport_filter = loads_json(airport_filter_data)
                     selected_airports = airport_filter.get('selected_airports', [])
                     
                     if selected_airports:
-                        logger.info(f"공항 필터 적용: {selected_airports}")
+                        logger.info("공항 필터 적용: %s", selected_airports)
+                        # 포함 여부를 O(1)로 확인하도록 한 번만 set으로 변환
+                        selected = frozenset(selected_airports)
                         # 선택된 공항과 관련된 NOTAM만 필터링 (원본 순서 유지)
-                        filtered_notams = []
-                        for i, notam in enumerate(notams):
-                            notam_airport = notam.get('airport_code', '')
-                            # 선택된 공항과 일치하면 포함
-                            if notam_airport in selected_airports:
-                                filtered_notams.append(notam)
-                                logger.debug(f"공항 필터링: NOTAM {i+1} -> {notam_airport} {notam.get('notam_number', 'N/A')} 포함")
-                        
-                        notams = filtered_notams
-                        logger.info(f"공항 필터링 후 NOTAM 수: {len(notams)}개 (원본 순서 유지)")
+                        notams = [notam for notam in notams if notam['airport_code'] in selected]
+                        logger.info("공항 필터링 후 NOTAM 수: %d개 (원본 순서 유지)", len(notams))
                         
-                        # 필터링된 NOTAM 순서 로깅
-                        logger.info("=== 공항 필터링 후 NOTAM 순서 ===")
-                        for i, notam in enumerate(notams[:10], 1):  # 첫 10개만 로깅
-                            logger.info(f"필터링 후 {i}: {notam.get('airport_code', 'N/A')} {notam.get('notam_number', 'N/A')}")
+                        # 필터링된 NOTAM 순서 로깅 (INFO 비활성화 시 문자열 생성 생략)
+                        if logger.isEnabledFor(logging.INFO):
+                            logger.info("=== 공항 필터링 후 NOTAM 순서 ===")
+                            for i, notam in enumerate(notams[:10], 1):  # 첫 10개만 로깅
+                                logger.info("필터링 후 %d: %s %s", i, notam['airport_code'], notam.get('notam_number', 'N/A'))
                         
                 except Exception as e:
-                    logger.error(f"공항 필터 파싱 오류: {str(e)}")
-            processing_times['airport_filtering'] = (datetime.now() - airport_filter_start).total_seconds()
+                    logger.error("공항 필터 파싱 오류: %s", e)
+            processing_times['airport_filtering'] = perf_counter() - airport_filter_start
             
             # NOTAM 시간을 로컬 시간으로 변환 시간 측정
-            time_conversion_start = datetime.now()
-            for i, notam in enumerate(notams):
-                airport_code = notam.get('airport_code', 'RKSI')  # 기본값: 인천공항
-                
+            time_conversion_start = perf_counter()
+            # 중복 없는 (시간, 공항, D) 필드) 조합만 변환
+            time_keys = {}
+            for notam in notams:
                 effective_time = notam.get('effective_time', '')
-                expiry_time = notam.get('expiry_time', '')
-                
-                # 로컬 시간으로 변환된 시간 문자열 생성
                 if effective_time:
-                    local_time_str = notam_filter.format_notam_time_with_local(
-                        effective_time, expiry_time, airport_code, notam
-                    )
+                    key = (effective_time, notam.get('expiry_time', ''), notam['airport_code'], notam.get('d_field', ''))
+                    time_keys.setdefault(key, []).append(notam)
+            
+            # 조합이 많으면 스레드 풀에서 병렬 변환, 적으면 스레드 전달 비용이 더 크므로 직접 변환
+            if len(time_keys) >= TIME_CONVERSION_PARALLEL_MIN:
+                local_times = _time_executor.map(lambda key: _format_local_time(*key), time_keys)
+            else:
+                local_times = (_format_local_time(*key) for key in time_keys)
+            
+            # 로컬 시간으로 변환된 시간 문자열 반영
+            for same_time_notams, local_time_str in zip(time_keys.values(), local_times):
+                for notam in same_time_notams:
                     notam['local_time_display'] = local_time_str
-            processing_times['time_conversion'] = (datetime.now() - time_conversion_start).total_seconds()
+            processing_times['time_conversion'] = perf_counter() - time_conversion_start
             
             if not notams:
                 flash('필터링된 NOTAM이 없습니다.')
                 return redirect(url_for('index'))
             
             # NOTAM 번역 및 요약 시간 측정 (병렬 번역기 사용)
-            translation_start = datetime.now()
-            logger.info(f"병렬 번역 시작: {len(notams)}개 NOTAM")
+            translation_start = perf_counter()
+            logger.info("병렬 번역 시작: %d개 NOTAM", len(notams))
             
             # 병렬 번역기로 모든 NOTAM을 처리
-            logger.info(f"번역 전 NOTAM 개수: {len(notams)}")
+            logger.info("번역 전 NOTAM 개수: %d", len(notams))
             
-            # 번역 전 NOTAM 데이터 샘플 로깅
-            for i, notam in enumerate(notams[:3]):  # 처음 3개만 로깅
-                logger.info(f"NOTAM {i+1} 번역 전: {notam.get('notam_number', 'N/A')} - {notam.get('description', '')[:100]}...")
+            # 번역 전 NOTAM 데이터 샘플 로깅 (DEBUG에서만, 운영 환경에서는 생략)
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, notam in enumerate(notams[:3]):  # 처음 3개만 로깅
+                    logger.debug("NOTAM %d 번역 전: %s - %.100s...", i + 1, notam.get('notam_number', 'N/A'), notam.get('description', ''))
             
             # 통합 번역기 사용 (개별 처리로 변경)
-            translated_notams = integrated_translator.process_notams_individual(notams)
-            processing_times['translation'] = (datetime.now() - translation_start).total_seconds()
+            translated_notams = get_integrated_translator().process_notams_individual(notams)
+            processing_times['translation'] = perf_counter() - translation_start
             
             # 번역 후 결과 샘플 로깅
-            logger.info(f"번역 후 NOTAM 개수: {len(translated_notams)}")
-            for i, notam in enumerate(translated_notams[:3]):  # 처음 3개만 로깅
-                logger.info(f"NOTAM {i+1} 번역 후: {notam.get('notam_number', 'N/A')} - 타입: {notam.get('notam_type', 'N/A')} - 한국어: {notam.get('korean_translation', 'N/A')[:50]}...")
+            logger.info("번역 후 NOTAM 개수: %d", len(translated_notams))
+            if logger.isEnabledFor(logging.DEBUG):
+                for i, notam in enumerate(translated_notams[:3]):  # 처음 3개만 로깅
+                    logger.debug("NOTAM %d 번역 후: %s - 타입: %s - 한국어: %.50s...", i + 1, notam.get('notam_number', 'N/A'), notam.get('notam_type', 'N/A'), notam.get('korean_translation', 'N/A'))
             
-            logger.info(f"병렬 번역 완료: {len(translated_notams)}개 NOTAM, {processing_times['translation']:.2f}초")
-            logger.info(f"평균 처리 시간: {processing_times['translation']/len(translated_notams):.2f}초/NOTAM")
+            logger.info("병렬 번역 완료: %d개 NOTAM, %.2f초", len(translated_notams), processing_times['translation'])
+            logger.info("평균 처리 시간: %.2f초/NOTAM", processing_times['translation']/len(translated_notams))
             
             # 결과를 원래 notams 리스트에 반영
             notams = translated_notams
             
             # 전체 처리 시간 계산
-            total_processing_time = (datetime.now() - total_start_time).total_seconds()
+            total_processing_time = perf_counter() - total_start_time
             processing_times['total'] = total_processing_time
             
             # 시간 측정 결과 로깅
             logger.info("=== 처리 시간 요약 ===")
-            logger.info(f"파일 저장: {processing_times['file_save']:.2f}초")
-            logger.info(f"PDF 변환: {processing_times['pdf_conversion']:.2f}초")
-            logger.info(f"NOTAM 필터링: {processing_times['notam_filtering']:.2f}초")
-            logger.info(f"공항 필터링: {processing_times['airport_filtering']:.2f}초")
-            logger.info(f"시간 변환: {processing_times['time_conversion']:.2f}초")
-            logger.info(f"번역: {processing_times['translation']:.2f}초")
-            logger.info(f"전체 처리 시간: {processing_times['total']:.2f}초")
+            logger.info("파일 저장: %.2f초", processing_times['file_save'])
+            logger.info("PDF 변환: %.2f초", processing_times['pdf_conversion'])
+            logger.info("NOTAM 필터링: %.2f초", processing_times['notam_filtering'])
+            logger.info("공항 필터링: %.2f초", processing_times['airport_filtering'])
+            logger.info("시간 변환: %.2f초", processing_times['time_conversion'])
+            logger.info("번역: %.2f초", processing_times['translation'])
+            logger.info("전체 처리 시간: %.2f초", processing_times['total'])
             logger.info("==================")
             
             # 템플릿에 공항 정보 전달
-            return render_template('results.html', 
-                                 notams=notams, 
-                                 current_date=datetime.now().strftime('%Y-%m-%d'),
-                                 all_airports=sorted(list(all_airports)),
-                                 package_airports=filtered_package_airports)
+            # NOTAM이 많을 때 전체 페이지를 문자열로 만들지 않고 렌더링하면서 바로 전송
+            response = stream_template(
+                'results.html',
+                notams=notams,
+                current_date=request_time.strftime('%Y-%m-%d'),
+                all_airports=sorted(all_airports),
+                package_airports=filtered_package_airports
+            )
+            response.response = _buffer_results_stream(response.response)
+            return response
         
         else:
             flash('허용되지 않는 파일 형식입니다. PDF 파일만 업로드 가능합니다.')
             return redirect(url_for('index'))
     
     except Exception as e:
-        logger.error(f"업로드 처리 중 오류: {str(e)}")
+        logger.error("업로드 처리 중 오류: %s", e)
         flash(f'파일 처리 중 오류가 발생했습니다: {str(e)}')
         return redirect(url_for('index'))
 
 @app.route('/health')
 def health_check():
-    return jsonify({'status': 'healthy', 'timestamp': datetime.now().isoformat()})
+    return ojsonify({'status': 'healthy', 'timestamp': datetime.now().isoformat()})
 
 @app.route('/api/analyze_route', methods=['POST'])
 def analyze_route():
     """GEMINI를 사용한 AI 기반 루트 분석 API (FIR 분석 포함)"""
     logger.info("analyze_route API 호출됨")
     try:
-        data = request.get_json()
+        data = loads_json(request.get_data())
         route = data.get('route', '').strip()
         notam_data = data.get('notam_data', [])
         
         if not route:
-            return jsonify({'error': '항로를 입력해주세요.'}), 400
+            return ojsonify({'error': '항로를 입력해주세요.'}, 400)
         
-        logger.info(f"분석할 항로: {route}")
-        logger.info(f"NOTAM 데이터 개수: {len(notam_data)}")
+        logger.info("분석할 항로: %s", route)
+        logger.info("NOTAM 데이터 개수: %d", len(notam_data))
         
         # GEMINI를 사용한 AI 기반 루트 분석 (기존 방식)
         gemini_analysis = analyze_route_with_gemini(route, notam_data)
         
-        return jsonify({
+        return ojsonify({
             'route': route,
             'gemini_analysis': gemini_analysis,
             'timestamp': datetime.now().isoformat()
         })
         
     except Exception as e:
-        logger.error(f"루트 분석 중 오류: {str(e)}")
-        return jsonify({'error': f'루트 분석 중 오류가 발생했습니다: {str(e)}'}), 500
+        logger.error("루트 분석 중 오류: %s", e)
+        return ojsonify({'error': f'루트 분석 중 오류가 발생했습니다: {str(e)}'}, 500)
 
 @app.route('/api/analyze_airports', methods=['POST'])
 def analyze_airports():
@@ -335,6 +531,7 @@ def analyze_airports():
         logger.info(f"NOTAM 데이터 개수: {len(notam_data)}")
         
         # 공항별 NOTAM 분석 실행
+        from src.airport_notam_analyzer import analyze_flight_airports
         analysis_result = analyze_flight_airports(
             dep=dep,
             dest=dest,
@@ -378,6 +575,7 @@ def analyze_airports_comprehensive():
         logger.info(f"NOTAM 데이터 개수: {len(notam_data)}")
         
         # 공항별 종합 NOTAM 분석 실행 (GEMINI AI)
+        from src.notam_comprehensive_analyzer import analyze_flight_airports_comprehensive
         analysis_result = analyze_flight_airports_comprehensive(
             dep=dep,
             dest=dest,
@@ -426,6 +624,7 @@ def extract_flight_info():
         logger.info(f"원본 txt 파일 읽기 완료: {len(notam_text)} 문자")
         
         # NOTAM에서 항공편 정보 추출
+        from src.flight_info_extractor import extract_flight_info_from_notams
         flight_info = extract_flight_info_from_notams(notam_text)
         
         return jsonify({
@@ -438,23 +637,8 @@ def extract_flight_info():
         logger.error(f"항공편 정보 추출 중 오류: {str(e)}")
         return jsonify({'error': f'항공편 정보 추출 중 오류가 발생했습니다: {str(e)}'}), 500
 
-def analyze_route_with_gemini(route, notam_data):
-    """GEMINI를 사용한 루트 분석 - NOTAM과 항로 연관성 중심"""
-    try:
-        import google.generativeai as genai
-        
-        # GEMINI API 키 확인
-        api_key = os.getenv('GEMINI_API_KEY') or os.getenv('GOOGLE_API_KEY')
-        if not api_key:
-            return "GEMINI API 키가 설정되지 않았습니다."
-        
-        genai.configure(api_key=api_key)
-        model = genai.GenerativeModel('gemini-2.0-flash-exp')
-        
-        # NOTAM 데이터를 문자열로 변환
-        notam_text = format_notam_data_for_analysis(notam_data)
-        
-        prompt = f"""다음 항공 항로와 관련된 NOTAM을 분석하여 항로에 미치는 영향을 평가해주세요.
+# 루트 분석 프롬프트 (요청마다 다시 만들지 않도록 모듈 상수로 유지)
+_ROUTE_PROMPT = """다음 항공 항로와 관련된 NOTAM을 분석하여 항로에 미치는 영향을 평가해주세요.
 
 분석할 항로: {route}
 
@@ -506,8 +690,37 @@ def analyze_route_with_gemini(route, notam_data):
 NOTAM 데이터가 없거나 항로와 관련이 없는 경우, 해당 사실을 명확히 명시해주세요.
 한국어로 간결하고 실용적으로 작성해주세요."""
 
-        response = model.generate_content(prompt)
-        return response.text.strip()
+@functools.cache
+def _get_route_model():
+    """루트 분석용 GEMINI 모델을 한 번만 생성하여 재사용 (API 키가 없으면 None)"""
+    import google.generativeai as genai
+    
+    if not _GEMINI_API_KEY:
+        return None
+    
+    genai.configure(api_key=_GEMINI_API_KEY)
+    return genai.GenerativeModel('gemini-2.0-flash-exp')
+
+@functools.lru_cache(maxsize=256)
+def _generate_route_analysis(model, route, notam_text):
+    """동일한 항로/NOTAM 조합은 GEMINI를 다시 호출하지 않고 캐시된 결과 반환"""
+    response = model.generate_content(_ROUTE_PROMPT.format(route=route, notam_text=notam_text))
+    return response.text.strip()
+
+def analyze_route_with_gemini(route, notam_data):
+    """GEMINI를 사용한 루트 분석 - NOTAM과 항로 연관성 중심"""
+    try:
+        # GEMINI API 키 확인
+        model = _get_route_model()
+        if model is None:
+            return "GEMINI API 키가 설정되지 않았습니다."
+        
+        # NOTAM 데이터를 문자열로 변환
+        notam_text = format_notam_data_for_analysis(notam_data)
+        
+        # 공백 차이만 있는 항로는 같은 캐시 키 사용
+        normalized_route = ' '.join(route.split()).upper()
+        return _generate_route_analysis(model, normalized_route, notam_text)
         
     except Exception as e:
         logger.error(f"GEMINI 루트 분석 중 오류: {str(e)}")
@@ -518,73 +731,119 @@ def format_notam_data_for_analysis(notam_data):
     if not notam_data:
         return "현재 NOTAM 데이터가 없습니다."
     
-    formatted_text = "NOTAM 목록:\n\n"
+    # 문자열을 반복 연결하지 않고 조각을 모아 한 번에 결합
+    parts = ["NOTAM 목록:\n\n"]
     for notam in notam_data:
-        formatted_text += f"NOTAM #{notam['index']}: {notam['notam_number']}\n"
-        formatted_text += f"공항: {', '.join(notam['airports'])}\n"
-        formatted_text += f"유효시간: {notam['effective_time']} - {notam['expiry_time']}\n"
-        formatted_text += f"내용: {notam['text']}\n"
-        formatted_text += "---\n"
+        parts.append(
+            f"NOTAM #{notam['index']}: {notam['notam_number']}\n"
+            f"공항: {', '.join(notam['airports'])}\n"
+            f"유효시간: {notam['effective_time']} - {notam['expiry_time']}\n"
+            f"내용: {notam['text']}\n"
+            "---\n"
+        )
     
-    return formatted_text
+    return "".join(parts)
 
 @app.route('/api/extract_airports', methods=['POST'])
 def extract_airports():
     """PDF에서 공항 코드를 추출하는 API"""
     logger.info("extract_airports API 호출됨")
     try:
-        logger.info(f"요청 파일: {request.files.keys()}")
-        
-        if 'file' not in request.files:
-            logger.error("파일이 요청에 포함되지 않음")
-            return jsonify({'error': '파일이 선택되지 않았습니다.'}), 400
-        
-        file = request.files['file']
-        logger.info(f"파일명: {file.filename}")
-        
-        if file.filename == '' or not allowed_file(file.filename):
-            logger.error(f"유효하지 않은 파일: {file.filename}")
-            return jsonify({'error': '유효하지 않은 파일입니다.'}), 400
+        if request.mimetype == 'application/pdf':
+            # PDF 본문을 그대로 보낸 경우 multipart 파싱 없이 요청 스트림을 바로 저장
+            filename = secure_filename(request.args.get('filename', '') or 'unknown.pdf')
+            stream = request.stream
+            logger.info("PDF 본문 업로드: %s", filename)
+        else:
+            logger.info("요청 파일: %s", request.files.keys())
+            
+            if 'file' not in request.files:
+                logger.error("파일이 요청에 포함되지 않음")
+                return ojsonify({'error': '파일이 선택되지 않았습니다.'}, 400)
+            
+            file = request.files['file']
+            logger.info("파일명: %s", file.filename)
+            
+            if file.filename == '' or not allowed_file(file.filename):
+                logger.error("유효하지 않은 파일: %s", file.filename)
+                return ojsonify({'error': '유효하지 않은 파일입니다.'}, 400)
+            
+            filename = secure_filename(file.filename or 'unknown.pdf')
+            stream = file.stream
         
         # 임시 파일 저장
-        filename = secure_filename(file.filename or 'unknown.pdf')
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         temp_filename = f"temp_{timestamp}_{filename}"
         temp_filepath = os.path.join(app.config['TEMP_FOLDER'], temp_filename)
-        file.save(temp_filepath)
+        file_hash = save_uploaded_file(stream, temp_filepath)
         
-        # 임시 파일 정리 (최대 5개만 유지)
-        cleanup_files(app.config['TEMP_FOLDER'], max_files=5)
+        # 임시 파일 정리 (최대 5개만 유지) - PDF 변환과 겹쳐서 백그라운드 실행
+        _executor.submit(cleanup_files, app.config['TEMP_FOLDER'], max_files=5)
         
         try:
-            logger.info("PDF 텍스트 변환 시작")
-            # PDF 텍스트 변환 (임시 파일 저장 비활성화)
-            text = pdf_converter.convert_pdf_to_text(temp_filepath, save_temp=False)
-            logger.info(f"PDF 텍스트 변환 완료: {len(text)} 문자")
+            # fast=1이면 NOTAM 파싱 없이 원문 스캔으로 공항만 추출 (응답 본문이 다르므로 ETag 구분)
+            fast_scan = request.args.get('fast') == '1'
+            etag = f'"{file_hash}-fast"' if fast_scan else f'"{file_hash}"'
+            
+            # 클라이언트가 같은 PDF 결과를 이미 갖고 있으면 본문 없이 304 응답
+            if request.headers.get('If-None-Match') == etag:
+                logger.info("ETag 일치: %.12s - 304 응답", file_hash)
+                return '', 304, {'ETag': etag}
+            
+            # 이전 요청(/upload 포함)에서 처리한 PDF면 변환 없이 캐시에서 바로 응답
+            cached_notams = _get_cached_notams(file_hash)
+            if cached_notams is not None:
+                logger.info("PDF 캐시 적중: %.12s - 변환/필터링 생략", file_hash)
+                all_airports = collect_airport_codes(cached_notams)
+                response = make_response(ojsonify({
+                    'airports': sorted(all_airports),
+                    'notam_count': len(cached_notams)
+                }))
+                response.headers['ETag'] = etag
+                return response
+            
+            # 공항 데이터가 없으면 원문 스캔이 불가능하므로 PDF 분할 전에 확인하고 NOTAM 필터링으로 추출
+            if fast_scan and get_notam_filter().airports_data:
+                split_notams = get_pdf_converter().split_pdf_notams(temp_filepath)
+                # 분할 결과는 캐싱해 같은 PDF의 /upload에서 다시 변환하지 않도록 함
+                with _pdf_cache_lock:
+                    _cache_put(_TEXT_CACHE, file_hash, split_notams)
+                # 텍스트가 없으면 아래 전체 처리와 같은 오류 응답을 위해 캐싱된 분할 결과로 넘어감
+                split_text = '\n\n'.join(split_notams)
+                if split_text.strip():
+                    scanned_airports = scan_airport_codes(split_text)
+                    logger.info("원문 스캔으로 공항 코드 추출: %d개", len(scanned_airports))
+                    # 전체 처리와 같은 응답 형태 (notam_count는 분할된 NOTAM 수)
+                    response = make_response(ojsonify({
+                        'airports': sorted(scanned_airports),
+                        'notam_count': len(split_notams)
+                    }))
+                    response.headers['ETag'] = etag
+                    return response
+            
+            logger.info("PDF 텍스트 변환 및 NOTAM 필터링 시작")
+            # PDF 텍스트 변환 + NOTAM 필터링 (임시 파일 저장 비활성화)
+            text, notams, _ = _get_text_and_notams(temp_filepath, save_temp=False, file_hash=file_hash)
+            logger.info("PDF 텍스트 변환 완료: %d 문자", len(text))
             
             if not text.strip():
                 logger.error("PDF에서 텍스트 추출 실패")
-                return jsonify({'error': 'PDF에서 텍스트를 추출할 수 없습니다.'}), 400
+                return ojsonify({'error': 'PDF에서 텍스트를 추출할 수 없습니다.'}, 400)
             
-            logger.info("NOTAM 필터링 시작")
-            # NOTAM 필터링하여 공항 코드 추출
-            notams = notam_filter.filter_korean_air_notams(text)
-            logger.info(f"NOTAM 필터링 완료: {len(notams)}개")
+            logger.info("NOTAM 필터링 완료: %d개", len(notams))
             
             # 모든 공항 코드 수집
-            all_airports = set()
-            for notam in notams:
-                airport_code = notam.get('airport_code', '')
-                logger.debug(f"NOTAM에서 공항 코드: {airport_code}")
-                if airport_code:
-                    all_airports.add(airport_code)
+            all_airports = collect_airport_codes(notams)
             
-            logger.info(f"추출된 공항 코드: {sorted(list(all_airports))}")
+            airports = sorted(all_airports)
+            logger.info("추출된 공항 코드: %s", airports)
             
-            return jsonify({
-                'airports': sorted(list(all_airports)),
+            response = make_response(ojsonify({
+                'airports': airports,
                 'notam_count': len(notams)
-            })
+            }))
+            response.headers['ETag'] = etag
+            return response
             
         finally:
             # 임시 파일 삭제
@@ -592,8 +851,8 @@ def extract_airports():
                 os.remove(temp_filepath)
     
     except Exception as e:
-        logger.error(f"공항 추출 중 오류: {str(e)}")
-        return jsonify({'error': f'공항 추출 중 오류가 발생했습니다: {str(e)}'}), 500
+        logger.error("공항 추출 중 오류: %s", e)
+        return ojsonify({'error': f'공항 추출 중 오류가 발생했습니다: {str(e)}'}, 500)
 
 @app.route('/google_maps')
 def google_maps():
@@ -617,6 +876,19 @@ def save_html():
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
         filename = f'NOTAM_Results_{timestamp}.html'
         
+        # 외부 리소스를 로컬로 변환
+        processed_html = process_html_for_offline(html_content)
+        
+        # inline=1이면 서버에 저장하지 않고 바로 다운로드 응답 (디스크 쓰기 및 추가 요청 생략)
+        if request.args.get('inline') == '1':
+            logger.info(f"HTML 바로 다운로드: {filename}")
+            return send_file(
+                io.BytesIO(processed_html.encode('utf-8')),
+                mimetype='text/html; charset=utf-8',
+                as_attachment=True,
+                download_name=filename
+            )
+        
         # 저장할 디렉토리 생성
         save_dir = os.path.join(os.path.dirname(__file__), 'saved_results')
         os.makedirs(save_dir, exist_ok=True)
@@ -624,9 +896,6 @@ def save_html():
         # HTML 파일 경로
         file_path = os.path.join(save_dir, filename)
         
-        # 외부 리소스를 로컬로 변환
-        processed_html = process_html_for_offline(html_content)
-        
         # 파일 저장
         with open(file_path, 'w', encoding='utf-8') as f:
             f.write(processed_html)
@@ -643,11 +912,8 @@ def save_html():
         logger.error(f"HTML 저장 중 오류: {str(e)}")
         return jsonify({'error': f'HTML 저장 중 오류가 발생했습니다: {str(e)}'}), 500
 
-def process_html_for_offline(html_content):
-    """HTML을 오프라인에서 볼 수 있도록 처리"""
-    
-    # Bootstrap CSS를 로컬로 다운로드하거나 인라인으로 포함
-    bootstrap_css = """
+# 오프라인 HTML에 인라인으로 포함할 Bootstrap CSS (간소화된 버전)
+_OFFLINE_BOOTSTRAP_CSS = """
     <style>
         /* Bootstrap 5.3.3 CSS (간소화된 버전) */
         *,*::before,*::after{box-sizing:border-box}
@@ -776,9 +1042,9 @@ def process_html_for_offline(html_content):
         }
     </style>
     """
-    
-    # Font Awesome 아이콘을 위한 CSS 추가
-    fontawesome_css = """
+
+# Font Awesome 아이콘을 위한 CSS
+_OFFLINE_FONTAWESOME_CSS = """
     <style>
         @font-face{font-family:"Font Awesome 6 Free";font-style:normal;font-weight:400;font-display:block;src:url("data:font/woff2;base64,") format("woff2")}
         .fas{font-family:"Font Awesome 6 Free";font-weight:900}
@@ -789,35 +1055,35 @@ def process_html_for_offline(html_content):
         @keyframes fa-spin{0%{transform:rotate(0deg)}100%{transform:rotate(360deg)}}
     </style>
     """
-    
-    # 외부 링크를 제거하고 로컬 스타일로 대체
-    processed_html = html_content
-    
+
+# 외부 CDN 링크/스크립트 -> 오프라인 대체 문자열
+_OFFLINE_REPLACEMENTS = {
     # Bootstrap CDN 링크 제거
-    processed_html = processed_html.replace(
-        '<link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css" rel="stylesheet">',
-        bootstrap_css
-    )
-    
+    '<link href="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css" rel="stylesheet">': _OFFLINE_BOOTSTRAP_CSS,
     # Font Awesome CDN 링크 제거
-    processed_html = processed_html.replace(
-        '<link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">',
-        fontawesome_css
-    )
-    
+    '<link href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css" rel="stylesheet">': _OFFLINE_FONTAWESOME_CSS,
     # Bootstrap JS CDN 링크 제거 (기본 기능만 유지)
-    processed_html = processed_html.replace(
-        '<script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js"></script>',
-        '<script>/* Bootstrap JS functionality removed for offline use */</script>'
-    )
-    
+    '<script src="https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js"></script>': '<script>/* Bootstrap JS functionality removed for offline use */</script>',
     # HTML 저장 버튼 비활성화 (오프라인에서는 불필요)
-    processed_html = processed_html.replace(
-        'onclick="saveAsHTML()"',
-        'onclick="alert(\'오프라인 모드에서는 사용할 수 없습니다.\')"'
-    )
-    
-    return processed_html
+    'onclick="saveAsHTML()"': 'onclick="alert(\'오프라인 모드에서는 사용할 수 없습니다.\')"',
+}
+_OFFLINE_RE = re.compile('|'.join(map(re.escape, _OFFLINE_REPLACEMENTS)))
+
+def process_html_for_offline(html_content):
+    """HTML을 오프라인에서 볼 수 있도록 처리 (외부 링크를 로컬 스타일로 한 번에 대체)"""
+    return _OFFLINE_RE.sub(lambda match: _OFFLINE_REPLACEMENTS[match.group(0)], html_content)
+
+# nginx internal location 경로 접두사 (예: /internal/saved_results/, 설정하지 않으면 Flask가 직접 전송)
+SAVED_RESULTS_ACCEL_PREFIX = os.environ.get('SAVED_RESULTS_ACCEL_PREFIX', '')
+
+def _attachment_disposition(filename):
+    """send_file과 같은 방식의 Content-Disposition 파라미터 (ASCII가 아닌 파일명은 filename*=UTF-8''... 추가)"""
+    try:
+        filename.encode('ascii')
+    except UnicodeEncodeError:
+        simple = unicodedata.normalize('NFKD', filename).encode('ascii', 'ignore').decode('ascii')
+        return {'filename': simple, 'filename*': f"UTF-8''{quote(filename, safe='!#$&+^`|~')}"}
+    return {'filename': filename}
 
 @app.route('/download_html/<filename>')
 def download_html(filename):
@@ -829,7 +1095,18 @@ def download_html(filename):
         if not os.path.exists(file_path):
             return jsonify({'error': '파일을 찾을 수 없습니다.'}), 404
         
-        return send_file(file_path, as_attachment=True, download_name=filename)
+        # nginx 뒤에서 실행 중이면 파일 전송을 nginx에 위임 (internal location 경로 접두사 설정 시)
+        if SAVED_RESULTS_ACCEL_PREFIX:
+            response = make_response('')
+            # 공백, %, 한글 파일명도 nginx가 올바른 경로로 해석하도록 퍼센트 인코딩
+            response.headers['X-Accel-Redirect'] = f"{SAVED_RESULTS_ACCEL_PREFIX.rstrip('/')}/{quote(filename)}"
+            response.headers['Content-Type'] = 'text/html; charset=utf-8'
+            response.headers.set('Content-Disposition', 'attachment', **_attachment_disposition(filename))
+            return response
+        
+        # 조건부 요청(If-Modified-Since 등) 지원, 파일 전체를 메모리에 올리지 않고
+        # WSGI 서버의 file_wrapper(sendfile) 또는 8KB 청크 단위로 스트리밍 전송
+        return send_file(file_path, as_attachment=True, download_name=filename, conditional=True)
         
     except Exception as e:
         logger.error(f"HTML 다운로드 중 오류: {str(e)}")
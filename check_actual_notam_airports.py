@@ -7,14 +7,14 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.fir_notam_filter import FIRNotamFilter
+from src.fir_notam_filter import get_default_filter
 
 def check_actual_notam_airports():
     """실제 NOTAM 데이터의 공항 코드 확인"""
     print("=== 실제 NOTAM 데이터 공항 코드 확인 ===")
     
     # FIR 필터링 인스턴스
-    filter_instance = FIRNotamFilter()
+    filter_instance = get_default_filter()
     
     # 사용자가 제공한 분석 결과에서 추출한 공항 코드들
     actual_airports = [
@@ -7,14 +7,14 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.fir_notam_filter import FIRNotamFilter
+from src.fir_notam_filter import get_default_filter
 
 def debug_fir_filtering():
     """FIR 필터링 디버깅"""
     print("=== FIR 필터링 디버깅 ===")
     
-    # FIR 필터링 인스턴스 생성
-    filter_instance = FIRNotamFilter()
+    # FIR 필터링 인스턴스 (전역 인스턴스 재사용)
+    filter_instance = get_default_filter()
     
     # 테스트 NOTAM 데이터
     test_notams = [
@@ -7,14 +7,14 @@ import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
-from src.fir_notam_filter import FIRNotamFilter
+from src.fir_notam_filter import get_default_filter
 
 def debug_notam_counting():
     """NOTAM 카운팅 디버깅"""
     print("=== NOTAM 카운팅 디버깅 ===")
     
-    # FIR 필터링 인스턴스 생성
-    filter_instance = FIRNotamFilter()
+    # FIR 필터링 인스턴스 (전역 인스턴스 재사용)
+    filter_instance = get_default_filter()
     
     # 실제 NOTAM 데이터 구조로 테스트
     test_notams = [
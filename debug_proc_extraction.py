@@ -5,20 +5,33 @@ PROC 추출 원인 디버깅
 
 import sys
 import os
+import re
 sys.path.append('src')
 
 from flight_info_extractor import FlightInfoExtractor
 
+# 키워드가 포함된 줄 전체 (대소문자 무시, 줄 단위)
+PROC_LINE_RE = re.compile(r'^.*PROC.*$', re.IGNORECASE | re.MULTILINE)
+AIRPORT_KEYWORD_LINE_RE = re.compile(r'^.*(?:DEP:|DEST:|ALTN:).*$', re.IGNORECASE | re.MULTILINE)
+
+def iter_matching_lines(pattern, content):
+    """패턴에 맞는 줄을 (줄 번호, 줄) 형태로 생성 (전체 텍스트에 finditer 한 번)"""
+    line_no = 1
+    pos = 0
+    for match in pattern.finditer(content):
+        line_no += content.count('\n', pos, match.start())
+        pos = match.start()
+        yield line_no, match.group()
+
 def debug_proc_extraction():
     """PROC 추출 원인 디버깅"""
     
-    # 최신 NOTAM 파일 찾기
-    temp_files = [f for f in os.listdir('temp') if f.endswith('.txt')]
-    if not temp_files:
+    # 최신 NOTAM 파일 찾기 (이름 기준 최댓값, 목록 정렬 없이 한 번 순회)
+    latest_file = max((entry.name for entry in os.scandir('temp') if entry.name.endswith('.txt')), default=None)
+    if latest_file is None:
         print("❌ temp 폴더에 NOTAM 파일이 없습니다.")
         return
     
-    latest_file = sorted(temp_files)[-1]
     file_path = os.path.join('temp', latest_file)
     
     print(f"🔍 테스트 파일: {file_path}")
@@ -33,18 +46,14 @@ def debug_proc_extraction():
     print("\n🔍 PROC 추출 원인 분석:")
     
     # 전체 텍스트에서 PROC 검색
-    lines = content.split('\n')
     print(f"\n🔍 전체 텍스트에서 'PROC' 검색:")
-    for i, line in enumerate(lines):
-        if 'PROC' in line.upper():
-            print(f"  라인 {i+1}: {line.strip()}")
+    for line_no, line in iter_matching_lines(PROC_LINE_RE, content):
+        print(f"  라인 {line_no}: {line.strip()}")
     
     # DEP, DEST, ALTN 키워드 검색
     print(f"\n🔍 DEP, DEST, ALTN 키워드 검색:")
-    for i, line in enumerate(lines):
-        line_upper = line.upper().strip()
-        if 'DEP:' in line_upper or 'DEST:' in line_upper or 'ALTN:' in line_upper:
-            print(f"  라인 {i+1}: {line.strip()}")
+    for line_no, line in iter_matching_lines(AIRPORT_KEYWORD_LINE_RE, content):
+        print(f"  라인 {line_no}: {line.strip()}")
     
     # PACKAGE별 추출 테스트
     print(f"\n🔍 PACKAGE별 추출 테스트:")
@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""
+FIR 경계 좌표 사전 파싱 스크립트
+src/fir_boundaries.py의 경계 텍스트를 수정한 뒤 다시 실행해 src/fir_polygons_data.py를 갱신
+"""
+
+import sys
+import os
+sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
+
+from src.fir_boundaries import FIRBoundaryDatabase
+
+OUTPUT_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'fir_polygons_data.py')
+
+def generate_fir_polygons():
+    """경계 텍스트를 파싱해 FIR별 (위도, 경도) 튜플 상수 모듈로 저장"""
+    boundaries = FIRBoundaryDatabase.__new__(FIRBoundaryDatabase).parse_fir_boundaries()
+    
+    lines = [
+        '"""',
+        'FIR 경계 좌표 (자동 생성 - 직접 수정하지 말 것)',
+        'generate_fir_polygons.py로 src/fir_boundaries.py의 경계 텍스트에서 생성',
+        '"""',
+        '',
+        'FIR_POLYGONS = {',
+    ]
+    for fir_code, boundary in boundaries.items():
+        lines.append(f"    {fir_code!r}: (")
+        lines.extend(f"        ({lat!r}, {lon!r})," for lat, lon in boundary.tolist())
+        lines.append("    ),")
+    lines.append('}')
+    
+    with open(OUTPUT_PATH, 'w', encoding='utf-8') as f:
+        f.write('\n'.join(lines) + '\n')
+    
+    for fir_code, boundary in boundaries.items():
+        print(f"{fir_code}: {len(boundary)}개 좌표")
+    print(f"저장 완료: {OUTPUT_PATH}")
+
+if __name__ == "__main__":
+    generate_fir_polygons()
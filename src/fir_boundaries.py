@@ -3,16 +3,167 @@ FIR 경계 좌표 데이터베이스 및 좌표-다각형 내부 판별 시스
 """
 
 import re
+import math
 from typing import List, Tuple, Dict, Optional
 
+import numpy as np
+
+# numba가 설치되어 있으면 Ray Casting 루프를 JIT 컴파일 (선택사항)
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+def _ray_cast_loop(px: float, py: float, xs: np.ndarray, ys: np.ndarray) -> bool:
+    """Ray Casting 내부 루프 (xs/ys: 꼭짓점 위도/경도 배열)"""
+    n = xs.shape[0]
+    inside = False
+    xinters = 0.0
+    
+    p1x = xs[0]
+    p1y = ys[0]
+    for i in range(1, n + 1):
+        p2x = xs[i % n]
+        p2y = ys[i % n]
+        if py > min(p1y, p2y) and py <= max(p1y, p2y) and px <= max(p1x, p2x):
+            if p1y != p2y:
+                xinters = (py - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
+            if p1x == p2x or px <= xinters:
+                inside = not inside
+        p1x = p2x
+        p1y = p2y
+    
+    return inside
+
+_ray_cast = njit(cache=True)(_ray_cast_loop) if NUMBA_AVAILABLE else None
+
+# 좌표쌍 정규식 (예: 544009N 1700000E) - 모듈 로드 시 한 번만 컴파일
+_COORD_PAIR_RE = re.compile(r'(\d{6})([NS])\s+(\d{7})([EW])')
+
+# 분/초 -> 도 변환 계수 (나눗셈 대신 곱셈)
+_INV_60 = 1.0 / 60.0
+_INV_3600 = 1.0 / 3600.0
+
+# 사전 파싱된 FIR 경계 좌표 (generate_fir_polygons.py로 생성, 없으면 경계 텍스트를 파싱)
+try:
+    from .fir_polygons_data import FIR_POLYGONS as _FIR_POLYGONS
+except ImportError:
+    _FIR_POLYGONS = None
+
 class FIRBoundaryDatabase:
     """FIR 경계 좌표 데이터베이스"""
     
     def __init__(self):
         self.fir_boundaries = self._load_fir_boundaries()
+        # 판별용 SoA 배열과 경계 박스는 로드 시 한 번만 계산
+        self.fir_polygons = self._build_fir_polygons(self.fir_boundaries)
+        self.fir_boxes = self._build_fir_boxes(self.fir_polygons)
+    
+    @staticmethod
+    def _build_fir_boxes(fir_polygons: Dict[str, List[dict]]) -> List[Tuple[str, float, float, float, float]]:
+        """
+        하위 다각형 경계 박스를 우선순위(fir_polygons) 순서의 평탄한 목록으로 변환
+        
+        Returns:
+            List: [(FIR 코드, min_lat, max_lat, min_lon, max_lon), ...]
+        """
+        return [
+            (fir_code, *part['bbox'])
+            for fir_code, parts in fir_polygons.items()
+            for part in parts
+        ]
     
-    def _load_fir_boundaries(self) -> Dict[str, List[Tuple[float, float]]]:
-        """FIR 경계 좌표 로드"""
+    @staticmethod
+    def _build_fir_polygons(fir_boundaries: Dict[str, np.ndarray]) -> Dict[str, List[dict]]:
+        """
+        FIR 경계 좌표를 날짜변경선에서 나눈 하위 다각형별 위도/경도 float64 배열(SoA)과 경계 박스로 변환
+        
+        Returns:
+            Dict: {FIR 코드: [{'lats': ndarray, 'lons': ndarray, 'bbox': (min_lat, max_lat, min_lon, max_lon)}, ...]}
+        """
+        fir_polygons = {}
+        for fir_code, boundary in fir_boundaries.items():
+            parts = []
+            for coords in FIRBoundaryDatabase._split_antimeridian(boundary):
+                lats = np.ascontiguousarray(coords[:, 0])
+                lons = np.ascontiguousarray(coords[:, 1])
+                parts.append({
+                    'lats': lats,
+                    'lons': lons,
+                    'bbox': (float(lats.min()), float(lats.max()), float(lons.min()), float(lons.max()))
+                })
+            fir_polygons[fir_code] = parts
+        return fir_polygons
+    
+    @staticmethod
+    def _split_antimeridian(boundary: np.ndarray) -> List[np.ndarray]:
+        """
+        날짜변경선(±180°)을 지나는 (N, 2) 경계를 경도 [-180, 180] 안의 하위 다각형 배열들로 분할
+        인접 꼭짓점의 경도 차이가 180°를 넘는 변을 날짜변경선 통과로 보고 경도를 이어 붙인 뒤 180°에서 자름
+        극점 꼭짓점(위도 ±90)은 경도가 정해지지 않으므로 앞뒤 꼭짓점 경도의 두 점으로 대체
+        """
+        boundary = np.asarray(boundary, dtype=np.float64).reshape(-1, 2)
+        lons = boundary[:, 1]
+        if not np.any(np.abs(np.roll(lons, -1) - lons) > 180.0):
+            return [boundary]
+        
+        # 날짜변경선을 지나는 경계는 로드 시 한 번만 처리되므로 Python 리스트로 계산
+        boundary = [tuple(coord) for coord in boundary.tolist()]
+        points = []
+        count = len(boundary)
+        for i, (lat, lon) in enumerate(boundary):
+            if abs(lat) == 90.0:
+                points.append((lat, boundary[i - 1][1]))
+                points.append((lat, boundary[(i + 1) % count][1]))
+            else:
+                points.append((lat, lon))
+        if len(points) > 1 and points[0] == points[-1]:
+            points.pop()  # 닫는 꼭짓점(첫 꼭짓점 반복) 제거
+        
+        # 변마다 짧은 쪽(|Δ경도| <= 180)으로 경도를 이어 붙임
+        unwrapped = [points[0][1]]
+        for (_, lon1), (_, lon2) in zip(points, points[1:]):
+            unwrapped.append(unwrapped[-1] + (lon2 - lon1 + 180.0) % 360.0 - 180.0)
+        closing = unwrapped[-1] + (points[0][1] - points[-1][1] + 180.0) % 360.0 - 180.0
+        span = max(unwrapped) - min(unwrapped)
+        if abs(closing - unwrapped[0]) > 1e-9 or span >= 360.0:
+            # 극점을 감싸는데 극점 꼭짓점이 없는 경계는 나눌 수 없으므로 그대로 사용
+            return [np.array(boundary, dtype=np.float64)]
+        
+        # 가장 서쪽 경도가 [-180, 180) 안에 오도록 이동
+        shift = 360.0 * np.floor((min(unwrapped) + 180.0) / 360.0)
+        points = [(lat, lon - shift) for (lat, _), lon in zip(points, unwrapped)]
+        if max(lon for _, lon in points) <= 180.0:
+            return [np.array(points, dtype=np.float64)]
+        
+        west = FIRBoundaryDatabase._clip_at_antimeridian(points, east=False)
+        east = [(lat, lon - 360.0) for lat, lon in FIRBoundaryDatabase._clip_at_antimeridian(points, east=True)]
+        return [np.array(part, dtype=np.float64) for part in (west, east) if len(part) >= 3]
+    
+    @staticmethod
+    def _clip_at_antimeridian(points: List[Tuple[float, float]], east: bool) -> List[Tuple[float, float]]:
+        """경도 180° 기준 한쪽만 남기는 Sutherland-Hodgman 다각형 자르기 (east면 180° 이상 쪽)"""
+        def inside(lon: float) -> bool:
+            return lon >= 180.0 if east else lon <= 180.0
+        
+        clipped = []
+        for (lat1, lon1), (lat2, lon2) in zip(points[-1:] + points[:-1], points):
+            if inside(lon2) != inside(lon1):
+                clipped.append((lat1 + (180.0 - lon1) * (lat2 - lat1) / (lon2 - lon1), 180.0))
+            if inside(lon2):
+                clipped.append((lat2, lon2))
+        return clipped
+    
+    def _load_fir_boundaries(self) -> Dict[str, np.ndarray]:
+        """FIR 경계 좌표 로드 (사전 파싱 모듈이 있으면 정규식 파싱 생략)"""
+        if _FIR_POLYGONS is not None:
+            return {fir_code: np.array(boundary, dtype=np.float64).reshape(-1, 2)
+                    for fir_code, boundary in _FIR_POLYGONS.items()}
+        return self.parse_fir_boundaries()
+    
+    def parse_fir_boundaries(self) -> Dict[str, np.ndarray]:
+        """하드코딩된 경계 텍스트에서 FIR 경계 좌표 파싱 (FIR별 (N, 2) [위도, 경도] 배열)"""
         return {
             'PAZA': self._parse_paza_boundary(),
             'KZAK': self._parse_kzak_boundary(), 
@@ -24,40 +175,35 @@ class FIRBoundaryDatabase:
     def _parse_coordinate_string(self, coord_str: str) -> Tuple[float, float]:
         """좌표 문자열을 (위도, 경도) 튜플로 변환"""
         # 544009N 1700000E 형식 파싱
-        # 먼저 N/S와 E/W를 분리
-        coord_str = coord_str.strip()
-        
-        # N/S 패턴 찾기
-        lat_match = re.search(r'(\d{6})([NS])', coord_str)
-        lon_match = re.search(r'(\d{7})([EW])', coord_str)
-        
-        if lat_match and lon_match:
-            lat_val = lat_match.group(1)
-            lat_dir = lat_match.group(2)
-            lon_val = lon_match.group(1)
-            lon_dir = lon_match.group(2)
-            
-            # 위도 파싱
-            lat_deg = float(lat_val[:2])
-            lat_min = float(lat_val[2:4])
-            lat_sec = float(lat_val[4:6])
-            lat = lat_deg + lat_min/60 + lat_sec/3600
-            if lat_dir == 'S':
-                lat = -lat
-            
-            # 경도 파싱
-            lon_deg = float(lon_val[:3])
-            lon_min = float(lon_val[3:5])
-            lon_sec = float(lon_val[5:7])
-            lon = lon_deg + lon_min/60 + lon_sec/3600
-            if lon_dir == 'W':
-                lon = -lon
-            
-            return (lat, lon)
+        match = _COORD_PAIR_RE.search(coord_str)
+        if match:
+            return self._coordinate_from_match(match)
         
         raise ValueError(f"좌표 파싱 실패: {coord_str}")
     
-    def _parse_paza_boundary(self) -> List[Tuple[float, float]]:
+    @staticmethod
+    def _coordinate_from_match(match: re.Match) -> Tuple[float, float]:
+        """_COORD_PAIR_RE 매치 그룹을 (위도, 경도) 튜플로 변환"""
+        lat_val, lat_dir, lon_val, lon_dir = match.groups()
+        
+        # 위도 파싱
+        lat = int(lat_val[:2]) + int(lat_val[2:4]) * _INV_60 + int(lat_val[4:6]) * _INV_3600
+        if lat_dir == 'S':
+            lat = -lat
+        
+        # 경도 파싱
+        lon = int(lon_val[:3]) + int(lon_val[3:5]) * _INV_60 + int(lon_val[5:7]) * _INV_3600
+        if lon_dir == 'W':
+            lon = -lon
+        
+        return (lat, lon)
+    
+    def _parse_boundary_text(self, boundary_text: str) -> np.ndarray:
+        """경계 텍스트에서 좌표쌍을 순서대로 추출해 (N, 2) [위도, 경도] 배열로 반환 (한 행에 여러 쌍이 있어도 처리)"""
+        coords = [self._coordinate_from_match(m) for m in _COORD_PAIR_RE.finditer(boundary_text)]
+        return np.array(coords, dtype=np.float64).reshape(-1, 2)
+    
+    def _parse_paza_boundary(self) -> np.ndarray:
         """PAZA (Anchorage Oceanic) FIR 경계 파싱 - 제공된 공식 좌표 사용"""
         boundary_text = """
         544009N 1700000E
@@ -69,20 +215,9 @@ class FIRBoundaryDatabase:
         540000N 1690000E
         544009N 1700000E
         """
-        import re
-        cleaned = boundary_text
-        coord_pairs = re.findall(r'\d{6}[NS]\s+\d{7}[EW]', cleaned)
-        coordinates: List[Tuple[float, float]] = []
-        for pair in coord_pairs:
-            try:
-                lat, lon = self._parse_coordinate_string(pair)
-                coordinates.append((lat, lon))
-            except ValueError as e:
-                print(f"PAZA 좌표 파싱 오류: {pair} - {e}")
-                continue
-        return coordinates
+        return self._parse_boundary_text(boundary_text)
     
-    def _parse_kzak_boundary(self) -> List[Tuple[float, float]]:
+    def _parse_kzak_boundary(self) -> np.ndarray:
         """KZAK (Oakland Oceanic) FIR 경계 파싱 - 제공된 공식 좌표 사용"""
         # 사용자가 제공한 KZAK 공식 경계 좌표를 그대로 사용합니다.
         # 일부 항목에 "N/S", "W/E"가 포함되어 있어 전처리로 각각 N, E로 치환합니다
@@ -130,21 +265,9 @@ class FIRBoundaryDatabase:
         cleaned = boundary_text.replace('N/S', 'N').replace('W/E', 'E')
         
         # 행 내에 좌표쌍이 2개 있는 경우(예: "560000N 1530000W 564542N 1514500W")도 처리
-        import re
-        coord_pairs = re.findall(r'\d{6}[NS]\s+\d{7}[EW]', cleaned)
-        coordinates: List[Tuple[float, float]] = []
-        
-        for pair in coord_pairs:
-            try:
-                lat, lon = self._parse_coordinate_string(pair)
-                coordinates.append((lat, lon))
-            except ValueError as e:
-                print(f"KZAK 좌표 파싱 오류: {pair} - {e}")
-                continue
-        
-        return coordinates
+        return self._parse_boundary_text(cleaned)
     
-    def _parse_rjjj_boundary(self) -> List[Tuple[float, float]]:
+    def _parse_rjjj_boundary(self) -> np.ndarray:
         """RJJJ (Fukuoka) FIR 경계 파싱 - 제공된 공식 좌표 사용"""
         # 사용자가 제공한 RJJJ 공식 경계 좌표를 사용합니다
         boundary_text = """
@@ -166,21 +289,9 @@ class FIRBoundaryDatabase:
         210000N 1213000E
         """
         
-        import re
-        coord_pairs = re.findall(r'\d{6}[NS]\s+\d{7}[EW]', boundary_text)
-        coordinates: List[Tuple[float, float]] = []
-        
-        for pair in coord_pairs:
-            try:
-                lat, lon = self._parse_coordinate_string(pair)
-                coordinates.append((lat, lon))
-            except ValueError as e:
-                print(f"RJJJ 좌표 파싱 오류: {pair} - {e}")
-                continue
-        
-        return coordinates
+        return self._parse_boundary_text(boundary_text)
     
-    def _parse_nzzo_boundary(self) -> List[Tuple[float, float]]:
+    def _parse_nzzo_boundary(self) -> np.ndarray:
         """NZZO (Auckland Oceanic) FIR 경계 파싱"""
         boundary_text = """
         300000S 1310000W 900000S 0000000E 300000S 1630000E 280000S 1680000E 
@@ -188,19 +299,9 @@ class FIRBoundaryDatabase:
         050000S 1570000W 300000S 1570000W 300000S 1310000W
         """
         
-        coordinates = []
-        coord_pairs = re.findall(r'\d{6}[NS]\s+\d{7}[EW]', boundary_text)
-        
-        for coord_pair in coord_pairs:
-            try:
-                lat, lon = self._parse_coordinate_string(coord_pair)
-                coordinates.append((lat, lon))
-            except ValueError as e:
-                print(f"NZZO 좌표 파싱 오류: {coord_pair} - {e}")
-        
-        return coordinates
+        return self._parse_boundary_text(boundary_text)
     
-    def _parse_aypm_boundary(self) -> List[Tuple[float, float]]:
+    def _parse_aypm_boundary(self) -> np.ndarray:
         """AYPM (Port Moresby) FIR 경계 파싱"""
         # AYPM 경계는 매우 복잡하므로 주요 좌표만 파싱
         boundary_text = """
@@ -208,85 +309,70 @@ class FIRBoundaryDatabase:
         120000S 1440000E 000000N 1410000E 000000N 1600000E
         """
         
-        coordinates = []
-        coord_pairs = re.findall(r'\d{6}[NS]\s+\d{7}[EW]', boundary_text)
-        
-        for coord_pair in coord_pairs:
-            try:
-                lat, lon = self._parse_coordinate_string(coord_pair)
-                coordinates.append((lat, lon))
-            except ValueError as e:
-                print(f"AYPM 좌표 파싱 오류: {coord_pair} - {e}")
-        
-        return coordinates
+        return self._parse_boundary_text(boundary_text)
 
 class PointInPolygonChecker:
     """점-다각형 내부 판별 알고리즘"""
     
     @staticmethod
-    def is_point_in_polygon(point: Tuple[float, float], polygon: List[Tuple[float, float]]) -> bool:
+    def is_point_in_polygon(point: Tuple[float, float], polygon: np.ndarray) -> bool:
         """
         Ray Casting 알고리즘을 사용하여 점이 다각형 내부에 있는지 판별
         
         Args:
             point: (위도, 경도) 튜플
-            polygon: 다각형 꼭짓점들의 리스트 [(위도, 경도), ...]
+            polygon: 다각형 꼭짓점 (N, 2) [위도, 경도] 배열 (꼭짓점 튜플 리스트도 가능)
             
         Returns:
             bool: 점이 다각형 내부에 있으면 True
         """
         x, y = point
-        n = len(polygon)
-        inside = False
-        
-        p1x, p1y = polygon[0]
-        for i in range(1, n + 1):
-            p2x, p2y = polygon[i % n]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-        
-        return inside
+        coords = np.asarray(polygon, dtype=np.float64).reshape(-1, 2)
+        xs = np.ascontiguousarray(coords[:, 0])
+        ys = np.ascontiguousarray(coords[:, 1])
+        
+        if NUMBA_AVAILABLE:
+            return bool(_ray_cast(x, y, xs, ys))
+        return PointInPolygonChecker._ray_cast_vectorized(x, y, xs, ys)
     
     @staticmethod
-    def is_point_in_polygon_simple(point: Tuple[float, float], polygon: List[Tuple[float, float]]) -> bool:
+    def _ray_cast_vectorized(x: float, y: float, xs: np.ndarray, ys: np.ndarray) -> bool:
+        """Ray Casting 알고리즘: 각 변 (p1 -> p2)에 대해 교차 여부를 배열로 계산"""
+        p2x = np.roll(xs, -1)
+        p2y = np.roll(ys, -1)
+        crosses = (y > np.minimum(ys, p2y)) & (y <= np.maximum(ys, p2y)) & (x <= np.maximum(xs, p2x))
+        # 수평 변(p1y == p2y)은 위 조건에서 이미 제외되므로 분모를 1로 바꿔 0 나눗셈만 방지
+        dy = np.where(ys != p2y, p2y - ys, 1.0)
+        xinters = (y - ys) * (p2x - xs) / dy + xs
+        crosses &= (xs == p2x) | (x <= xinters)
+        
+        return bool(np.count_nonzero(crosses) % 2)
+    
+    @staticmethod
+    def is_point_in_polygon_simple(point: Tuple[float, float], xs: np.ndarray, ys: np.ndarray,
+                                   bbox: Optional[Tuple[float, float, float, float]] = None) -> bool:
         """
-        간단한 경계 박스 검사 + Ray Casting
+        간단한 경계 박스 검사 + Ray Casting (꼭짓점 좌표 배열을 받아 모든 변을 한 번에 계산)
+        
+        Args:
+            point: (위도, 경도) 튜플
+            xs: 꼭짓점 위도 배열 (FIRBoundaryDatabase.fir_polygons[fir]['lats'])
+            ys: 꼭짓점 경도 배열 (FIRBoundaryDatabase.fir_polygons[fir]['lons'])
+            bbox: 미리 계산된 경계 박스 (FIRBoundaryDatabase.fir_polygons[fir]['bbox']), 없으면 배열에서 계산
         """
         x, y = point
         
-        # 경계 박스 검사
-        min_x = min(p[0] for p in polygon)
-        max_x = max(p[0] for p in polygon)
-        min_y = min(p[1] for p in polygon)
-        max_y = max(p[1] for p in polygon)
-        
+        # 경계 박스 검사 (대부분의 점은 여기서 float 비교 4번으로 끝남)
+        if bbox is None:
+            bbox = (xs.min(), xs.max(), ys.min(), ys.max())
+        min_x, max_x, min_y, max_y = bbox
         if x < min_x or x > max_x or y < min_y or y > max_y:
             return False
         
-        # Ray Casting 알고리즘
-        n = len(polygon)
-        inside = False
-        
-        p1x, p1y = polygon[0]
-        for i in range(1, n + 1):
-            p2x, p2y = polygon[i % n]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-        
-        return inside
-
+        if NUMBA_AVAILABLE:
+            return bool(_ray_cast(x, y, xs, ys))
+        return PointInPolygonChecker._ray_cast_vectorized(x, y, xs, ys)
+    
 class FIRIdentifier:
     """FIR 식별기"""
     
@@ -305,47 +391,53 @@ class FIRIdentifier:
         Returns:
             str: FIR 코드 (예: 'PAZA', 'KZAK', 'NZZO', 'AYPM') 또는 None
         """
-        for fir_code, boundary in self.boundary_db.fir_boundaries.items():
-            # 경계 박스 검사 (날짜변경선 처리 포함)
-            if self._is_point_in_fir_boundary_box((lat, lon), boundary):
+        # 미리 평탄화한 하위 다각형 경계 박스를 우선순위 순서로 검사 (날짜변경선은 로드 시 분할됨)
+        for fir_code, min_lat, max_lat, min_lon, max_lon in self.boundary_db.fir_boxes:
+            if min_lat <= lat <= max_lat and min_lon <= lon <= max_lon:
                 return fir_code
         
         return None
     
-    def _is_point_in_fir_boundary_box(self, point: Tuple[float, float], boundary: List[Tuple[float, float]]) -> bool:
+    def _is_point_in_fir_boundary_box(self, point: Tuple[float, float], bbox: Tuple[float, float, float, float]) -> bool:
         """
-        경계 박스 기반 점-다각형 내부 판별 (날짜변경선 처리)
+        경계 박스 기반 점-다각형 내부 판별
         
         Args:
             point: (위도, 경도) 튜플
-            boundary: 다각형 경계 좌표 리스트
+            bbox: 미리 계산된 하위 다각형 경계 박스 (min_lat, max_lat, min_lon, max_lon)
             
         Returns:
             bool: 점이 경계 박스 내부에 있으면 True
         """
         lat, lon = point
+        min_lat, max_lat, min_lon, max_lon = bbox
+        return min_lat <= lat <= max_lat and min_lon <= lon <= max_lon
+    
+    def identify_fir_ids(self, lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+        """
+        여러 좌표의 FIR 번호를 경계 박스 기준으로 한 번에 계산 (identify_fir_by_coordinate의 배열 버전)
         
-        # 경계 박스 계산
-        min_lat = min(p[0] for p in boundary)
-        max_lat = max(p[0] for p in boundary)
-        min_lon = min(p[1] for p in boundary)
-        max_lon = max(p[1] for p in boundary)
-        
-        # 날짜변경선 처리
-        if min_lon < 0 and max_lon > 0:  # 날짜변경선을 넘나드는 경우
-            # 동경과 서경 모두 고려
-            return (min_lat <= lat <= max_lat and 
-                   (min_lon <= lon <= 180.0 or -180.0 <= lon <= max_lon))
-        else:
-            # 일반적인 경우
-            return min_lat <= lat <= max_lat and min_lon <= lon <= max_lon
-    
-    def analyze_upr_route(self, upr_coordinates: List[Tuple[float, float]]) -> Dict:
+        Returns:
+            ndarray: 좌표별 fir_polygons 순서의 FIR 번호, 포함되는 FIR이 없으면 -1
+        """
+        fir_codes = list(self.boundary_db.fir_polygons)
+        masks = np.empty((len(fir_codes), len(lats)), dtype=bool)
+        for row, fir_code in enumerate(fir_codes):
+            masks[row] = False
+            for part in self.boundary_db.fir_polygons[fir_code]:
+                masks[row] |= self._fir_boundary_box_mask(lats, lons, part['bbox'])
+        
+        # 좌표별 FIR: 처음으로 포함되는 FIR (identify_fir_by_coordinate와 같은 우선순위), 없으면 -1
+        return np.where(masks.any(axis=0), masks.argmax(axis=0), -1)
+    
+    def analyze_upr_route(self, upr_coordinates: List[Tuple[float, float]],
+                          labels: Optional[np.ndarray] = None) -> Dict:
         """
         UPR 좌표 구간을 분석하여 통과하는 FIR 식별
         
         Args:
             upr_coordinates: UPR 좌표 리스트 [(위도, 경도), ...]
+            labels: 미리 계산한 좌표별 FIR 번호 (identify_fir_ids 결과), 없으면 여기서 계산
             
         Returns:
             Dict: 분석 결과
@@ -356,58 +448,143 @@ class FIRIdentifier:
             'fir_segments': {}
         }
         
-        current_fir = None
-        segment_start = 0
-        
-        for i, (lat, lon) in enumerate(upr_coordinates):
-            fir = self.identify_fir_by_coordinate(lat, lon)
-            
-            coord_info = {
-                'index': i,
-                'lat': lat,
-                'lon': lon,
-                'fir': fir
-            }
-            result['coordinates'].append(coord_info)
+        if not upr_coordinates:
+            return result
+        
+        fir_codes = list(self.boundary_db.fir_polygons)
+        if labels is None:
+            # 모든 좌표를 (K,) 배열로 만들어 FIR마다 경계 박스 포함 여부를 한 번에 계산
+            coords = np.asarray(upr_coordinates, dtype=np.float64).reshape(-1, 2)
+            labels = self.identify_fir_ids(coords[:, 0], coords[:, 1])
+        # 라벨 -1은 마지막 원소(None)를 가리키도록 FIR 코드 배열 끝에 None 추가
+        firs = np.array(fir_codes + [None], dtype=object)[labels].tolist()
+        
+        result['coordinates'] = [
+            {'index': i, 'lat': lat, 'lon': lon, 'fir': fir}
+            for i, ((lat, lon), fir) in enumerate(zip(upr_coordinates, firs))
+        ]
+        
+        # FIR 변경 지점(양 끝 포함)으로 세그먼트 분할 - 루프는 변경 횟수만큼만 돎
+        boundaries = np.flatnonzero(np.concatenate(([True], labels[1:] != labels[:-1], [True]))).tolist()
+        for start, end in zip(boundaries[:-1], boundaries[1:]):
+            fir = firs[start]
+            if fir is None:
+                continue
             
-            # FIR 변경 감지
-            if fir != current_fir:
-                if current_fir is not None:
-                    # 이전 FIR 세그먼트 종료
-                    if current_fir not in result['fir_segments']:
-                        result['fir_segments'][current_fir] = []
-                    result['fir_segments'][current_fir].append({
-                        'start_index': segment_start,
-                        'end_index': i - 1,
-                        'coordinates': upr_coordinates[segment_start:i]
-                    })
-                
-                # 새 FIR 세그먼트 시작
-                current_fir = fir
-                segment_start = i
-                
-                if fir and fir not in result['traversed_firs']:
-                    result['traversed_firs'].append(fir)
-        
-        # 마지막 세그먼트 처리
-        if current_fir is not None:
-            if current_fir not in result['fir_segments']:
-                result['fir_segments'][current_fir] = []
-            result['fir_segments'][current_fir].append({
-                'start_index': segment_start,
-                'end_index': len(upr_coordinates) - 1,
-                'coordinates': upr_coordinates[segment_start:]
+            result['fir_segments'].setdefault(fir, []).append({
+                'start_index': start,
+                'end_index': end - 1,
+                'coordinates': upr_coordinates[start:end]
             })
+            if fir not in result['traversed_firs']:
+                result['traversed_firs'].append(fir)
         
         return result
+    
+    @staticmethod
+    def _fir_boundary_box_mask(lats: np.ndarray, lons: np.ndarray, bbox: Tuple[float, float, float, float]) -> np.ndarray:
+        """좌표 배열 전체에 대한 경계 박스 포함 여부 (_is_point_in_fir_boundary_box의 배열 버전)"""
+        min_lat, max_lat, min_lon, max_lon = bbox
+        return (lats >= min_lat) & (lats <= max_lat) & (lons >= min_lon) & (lons <= max_lon)
 
 # 전역 인스턴스
 fir_identifier = FIRIdentifier()
 
+# FIR 격자 색인 셀 크기 (도) 및 셀 값 (0 이상은 _FIR_GRID_CODES 번호)
+FIR_GRID_STEP_DEG = 1.0
+_GRID_NO_FIR = -1
+_GRID_AMBIGUOUS = -2
+
+def _build_fir_grid(step_deg: float = FIR_GRID_STEP_DEG) -> Tuple[np.ndarray, Tuple[str, ...]]:
+    """
+    전 지구 위도/경도 격자 색인 생성 (모듈 로드 시 한 번)
+    셀 전체가 같은 FIR로 식별되면 FIR 번호, 어느 FIR에도 속하지 않으면 _GRID_NO_FIR,
+    셀 안에 경계 박스 변이 지나가면 _GRID_AMBIGUOUS
+    
+    Returns:
+        Tuple: ((위도 셀 수, 경도 셀 수) int16 배열, FIR 코드 튜플)
+    """
+    fir_codes = tuple(fir_identifier.boundary_db.fir_polygons)
+    fir_ids = {fir_code: fir_id for fir_id, fir_code in enumerate(fir_codes)}
+    
+    lat0 = (-90.0 + np.arange(int(round(180.0 / step_deg))) * step_deg)[:, np.newaxis]
+    lon0 = (-180.0 + np.arange(int(round(360.0 / step_deg))) * step_deg)[np.newaxis, :]
+    lat1 = lat0 + step_deg
+    lon1 = lon0 + step_deg
+    
+    grid = np.full((lat0.shape[0], lon0.shape[1]), _GRID_NO_FIR, dtype=np.int16)
+    resolved = np.zeros(grid.shape, dtype=bool)
+    ambiguous = np.zeros(grid.shape, dtype=bool)
+    # 우선순위 순서로 처리하므로 셀을 처음 완전히 포함하는 박스의 FIR이 셀 값
+    for fir_code, min_lat, max_lat, min_lon, max_lon in fir_identifier.boundary_db.fir_boxes:
+        disjoint = (lat1 < min_lat) | (lat0 > max_lat) | (lon1 < min_lon) | (lon0 > max_lon)
+        inside = (min_lat <= lat0) & (lat1 <= max_lat) & (min_lon <= lon0) & (lon1 <= max_lon)
+        ambiguous |= ~(disjoint | inside)
+        grid[inside & ~resolved] = fir_ids[fir_code]
+        resolved |= inside
+    grid[ambiguous] = _GRID_AMBIGUOUS
+    return grid, fir_codes
+
+_FIR_GRID, _FIR_GRID_CODES = _build_fir_grid()
+
 def identify_fir_by_coordinate(lat: float, lon: float) -> Optional[str]:
-    """전역 함수: 좌표로 FIR 식별"""
+    """
+    전역 함수: 좌표로 FIR 식별
+    1도 격자 색인으로 바로 결정하고, 경계 박스 변이 지나가는 셀만 경계 박스 정밀 판별 사용
+    """
+    if not (math.isfinite(lat) and math.isfinite(lon)):
+        return fir_identifier.identify_fir_by_coordinate(lat, lon)
+    i = math.floor((lat + 90.0) / FIR_GRID_STEP_DEG)
+    j = math.floor((lon + 180.0) / FIR_GRID_STEP_DEG)
+    if 0 <= i < _FIR_GRID.shape[0] and 0 <= j < _FIR_GRID.shape[1]:
+        fir_id = int(_FIR_GRID[i, j])
+        if fir_id >= 0:
+            return _FIR_GRID_CODES[fir_id]
+        if fir_id == _GRID_NO_FIR:
+            return None
     return fir_identifier.identify_fir_by_coordinate(lat, lon)
 
+def identify_fir_ids_by_coordinates(lats: np.ndarray, lons: np.ndarray) -> np.ndarray:
+    """
+    전역 함수: 여러 좌표의 FIR 번호를 격자 색인 배열 인덱싱 한 번으로 계산
+    경계 박스 변이 지나가는 셀, 범위 밖/비정상 좌표만 FIRIdentifier.identify_fir_ids로 정밀 판별
+    
+    Returns:
+        ndarray: 좌표별 _FIR_GRID_CODES 번호, 포함되는 FIR이 없으면 -1
+    """
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    with np.errstate(invalid='ignore'):
+        i = np.floor((lats + 90.0) / FIR_GRID_STEP_DEG)
+        j = np.floor((lons + 180.0) / FIR_GRID_STEP_DEG)
+        in_grid = (i >= 0) & (i < _FIR_GRID.shape[0]) & (j >= 0) & (j < _FIR_GRID.shape[1])
+    
+    fir_ids = np.full(lats.shape, _GRID_AMBIGUOUS, dtype=np.intp)
+    fir_ids[in_grid] = _FIR_GRID[i[in_grid].astype(np.intp), j[in_grid].astype(np.intp)]
+    pending = fir_ids == _GRID_AMBIGUOUS
+    if pending.any():
+        fir_ids[pending] = fir_identifier.identify_fir_ids(lats[pending], lons[pending])
+    return fir_ids
+
+def identify_firs_by_coordinates(coordinates) -> np.ndarray:
+    """
+    전역 함수: 여러 좌표의 FIR 코드를 한 번에 식별 (identify_fir_by_coordinate의 배열 버전)
+    
+    Args:
+        coordinates: (N, 2) [위도, 경도] 배열 또는 좌표 튜플 리스트
+        
+    Returns:
+        ndarray: (N,) object 배열 - 좌표별 FIR 코드 또는 None
+    """
+    coords = np.asarray(coordinates, dtype=np.float64).reshape(-1, 2)
+    fir_ids = identify_fir_ids_by_coordinates(coords[:, 0], coords[:, 1])
+    # 번호 -1은 마지막 원소(None)를 가리킴
+    return np.array(_FIR_GRID_CODES + (None,), dtype=object)[fir_ids]
+
 def analyze_upr_route(upr_coordinates: List[Tuple[float, float]]) -> Dict:
-    """전역 함수: UPR 경로 분석"""
-    return fir_identifier.analyze_upr_route(upr_coordinates)
+    """전역 함수: UPR 경로 분석 (좌표별 FIR은 격자 색인으로 한 번에 계산)"""
+    if not upr_coordinates:
+        return fir_identifier.analyze_upr_route(upr_coordinates)
+    coords = np.asarray(upr_coordinates, dtype=np.float64).reshape(-1, 2)
+    labels = identify_fir_ids_by_coordinates(coords[:, 0], coords[:, 1])
+    return fir_identifier.analyze_upr_route(upr_coordinates, labels)
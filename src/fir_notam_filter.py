@@ -3,11 +3,17 @@ FIR 기반 NOTAM 필터링 시스템
 좌표 구간이 속한 FIR의 NOTAM만 선별
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+import re
+from typing import List, Dict, Any, Optional, Tuple, Collection
 from .fir_boundaries import identify_fir_by_coordinate, analyze_upr_route
 from .upr_parser import parse_route_with_waypoints
 from .nav_data_loader import get_waypoint_coordinates, estimate_waypoint_fir
 
+# 공항 코드 -> FIR 조회 결과 캐시 최대 크기 (넘으면 비움)
+FIR_CACHE_SIZE = 4096
+# NOTAM 본문의 4글자 대문자 (공항 코드 후보)
+_AIRPORT_CODE_RE = re.compile(r'\b[A-Z]{4}\b')
+
 class FIRNotamFilter:
     """FIR 기반 NOTAM 필터링 클래스"""
     
@@ -27,6 +33,20 @@ class FIRNotamFilter:
             'KSEA': 'PAZA',  # 시애틀 -> Anchorage Oceanic FIR
             'KPDX': 'PAZA',  # 포틀랜드 -> Anchorage Oceanic FIR
         }
+        
+        self._build_prefix_index()
+    
+    def _build_prefix_index(self):
+        """공항 코드 접두사 -> FIR 조회용 dict 생성 (fir_airport_mapping/specific_airport_mapping 변경 시 다시 호출)"""
+        self._prefix_to_fir = {}
+        for fir_code, prefixes in self.fir_airport_mapping.items():
+            for prefix in prefixes:
+                # 여러 FIR에 같은 접두사가 있으면 먼저 나온 FIR 우선 (기존 순차 탐색과 동일)
+                self._prefix_to_fir.setdefault(prefix, fir_code)
+        # 긴 접두사부터 확인
+        self._prefix_lens = sorted({len(prefix) for prefix in self._prefix_to_fir}, reverse=True)
+        # 공항 코드 -> FIR 조회 결과 캐시 (매핑이 바뀌면 초기화)
+        self._fir_cache = {}
     
     def filter_notams_by_fir(self, notams_data: List[Dict[str, Any]], fir_codes: List[str]) -> List[Dict[str, Any]]:
         """
@@ -39,21 +59,17 @@ class FIRNotamFilter:
         Returns:
             List[Dict[str, Any]]: 필터링된 NOTAM 리스트
         """
-        filtered_notams = []
-        
-        for notam in notams_data:
-            if self._is_notam_relevant_to_firs(notam, fir_codes):
-                filtered_notams.append(notam)
-        
-        return filtered_notams
+        # FIR 목록은 한 번만 set으로 변환해 공항마다 O(1) 확인
+        target_firs = set(fir_codes)
+        return [notam for notam in notams_data if self._is_notam_relevant_to_firs(notam, target_firs)]
     
-    def _is_notam_relevant_to_firs(self, notam: Dict[str, Any], fir_codes: List[str]) -> bool:
+    def _is_notam_relevant_to_firs(self, notam: Dict[str, Any], fir_codes: Collection[str]) -> bool:
         """
         NOTAM이 지정된 FIR들과 관련이 있는지 확인
         
         Args:
             notam: NOTAM 데이터
-            fir_codes: FIR 코드 리스트
+            fir_codes: FIR 코드 목록 (set 권장)
             
         Returns:
             bool: 관련이 있으면 True
@@ -61,13 +77,8 @@ class FIRNotamFilter:
         # NOTAM에서 공항 코드 추출
         airport_codes = self._extract_airport_codes_from_notam(notam)
         
-        # 각 공항 코드가 해당 FIR에 속하는지 확인
-        for airport_code in airport_codes:
-            airport_fir = self._get_fir_from_airport_code(airport_code)
-            if airport_fir in fir_codes:
-                return True
-        
-        return False
+        # 각 공항 코드가 해당 FIR에 속하는지 확인 (공항별 FIR은 캐시에서 조회)
+        return any(self._get_fir_from_airport_code(airport_code) in fir_codes for airport_code in airport_codes)
     
     def _extract_airport_codes_from_notam(self, notam: Dict[str, Any]) -> List[str]:
         """
@@ -92,9 +103,7 @@ class FIRNotamFilter:
         # 3. text/description 필드에서 4글자 대문자 패턴 추출
         text_field = notam.get('text', '') or notam.get('description', '')
         if text_field:
-            import re
-            codes = re.findall(r'\b[A-Z]{4}\b', text_field)
-            airport_codes.extend(codes)
+            airport_codes.extend(_AIRPORT_CODE_RE.findall(text_field))
         
         # 중복 제거 및 빈 문자열 제거
         airport_codes = [code for code in airport_codes if code and len(code) == 4]
@@ -110,6 +119,18 @@ class FIRNotamFilter:
         Returns:
             Optional[str]: FIR 코드 또는 None
         """
+        try:
+            return self._fir_cache[airport_code]
+        except KeyError:
+            pass
+        fir_code = self._lookup_fir_from_airport_code(airport_code)
+        if len(self._fir_cache) >= FIR_CACHE_SIZE:
+            self._fir_cache.clear()
+        self._fir_cache[airport_code] = fir_code
+        return fir_code
+    
+    def _lookup_fir_from_airport_code(self, airport_code: str) -> Optional[str]:
+        """_get_fir_from_airport_code의 실제 조회 (캐시 없음)"""
         if len(airport_code) < 2:
             return None
         
@@ -117,10 +138,10 @@ class FIRNotamFilter:
         if airport_code in self.specific_airport_mapping:
             return self.specific_airport_mapping[airport_code]
         
-        # 2. 일반적인 FIR 매핑 확인
-        airport_prefix = airport_code[:2]
-        for fir_code, prefixes in self.fir_airport_mapping.items():
-            if airport_prefix in prefixes:
+        # 2. 일반적인 FIR 매핑 확인 (접두사 dict 조회)
+        for prefix_len in self._prefix_lens:
+            fir_code = self._prefix_to_fir.get(airport_code[:prefix_len])
+            if fir_code:
                 return fir_code
         
         return None
@@ -361,6 +382,10 @@ class FIRNotamFilter:
 # 전역 인스턴스
 fir_notam_filter = FIRNotamFilter()
 
+def get_default_filter() -> FIRNotamFilter:
+    """전역 FIRNotamFilter 인스턴스 반환 (접두사 dict/조회 캐시를 프로세스 안에서 공유)"""
+    return fir_notam_filter
+
 def filter_notams_by_fir(notams_data: List[Dict[str, Any]], fir_codes: List[str]) -> List[Dict[str, Any]]:
     """전역 함수: FIR 기반 NOTAM 필터링"""
     return fir_notam_filter.filter_notams_by_fir(notams_data, fir_codes)
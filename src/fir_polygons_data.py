@@ -0,0 +1,95 @@
+"""
+FIR 경계 좌표 (자동 생성 - 직접 수정하지 말 것)
+generate_fir_polygons.py로 src/fir_boundaries.py의 경계 텍스트에서 생성
+"""
+
+FIR_POLYGONS = {
+    'PAZA': (
+        (54.66916666666666, 170.0),
+        (51.5, 170.0),
+        (51.083333333333336, 173.73333333333332),
+        (50.13333333333333, -176.56666666666666),
+        (45.7, 162.91666666666666),
+        (50.083333333333336, 159.0),
+        (54.0, 169.0),
+        (54.66916666666666, 170.0),
+    ),
+    'KZAK': (
+        (52.71666666666667, -135.0),
+        (51.0, -133.75),
+        (48.333333333333336, -128.0),
+        (45.0, -126.5),
+        (40.983333333333334, -126.9),
+        (40.833333333333336, -127.0),
+        (37.506388888888885, -127.0),
+        (36.46194444444445, -126.93333333333334),
+        (35.5, -125.83333333333333),
+        (36.0, -124.2),
+        (34.5, -123.25),
+        (30.75, -120.83333333333333),
+        (30.0, -120.0),
+        (3.5, -120.0),
+        (3.5, -145.0),
+        (-5.0, -155.0),
+        (-5.0, 180.0),
+        (3.5, 180.0),
+        (3.5, 160.0),
+        (0.0, 160.0),
+        (0.0, 141.0),
+        (3.5, 141.0),
+        (3.5, 133.0),
+        (7.0, 130.0),
+        (21.0, 130.0),
+        (21.0, 155.0),
+        (27.0, 155.0),
+        (27.0, 165.0),
+        (43.0, 165.0),
+        (45.7, 162.91666666666666),
+        (50.13333333333333, -176.56666666666666),
+        (51.4, -167.81666666666666),
+        (53.5, -160.0),
+        (56.0, -153.0),
+        (56.76166666666666, -151.75),
+        (53.3675, -137.0),
+        (52.71666666666667, -135.0),
+    ),
+    'RJJJ': (
+        (45.7, 162.91666666666666),
+        (43.0, 165.0),
+        (27.0, 165.0),
+        (27.0, 155.0),
+        (21.0, 155.0),
+        (21.0, 121.5),
+        (40.5, 133.65),
+        (38.63333333333333, 133.65),
+        (38.0, 133.0),
+        (37.5, 133.0),
+        (34.666666666666664, 129.16666666666666),
+        (32.5, 128.3),
+        (30.0, 125.41666666666667),
+        (26.416666666666668, 123.0),
+        (23.5, 123.0),
+        (21.0, 121.5),
+    ),
+    'NZZO': (
+        (-30.0, -131.0),
+        (-90.0, 0.0),
+        (-30.0, 163.0),
+        (-28.0, 168.0),
+        (-25.0, 171.41666666666666),
+        (-25.0, 180.0),
+        (-5.0, -171.0),
+        (-5.0, -157.0),
+        (-30.0, -157.0),
+        (-30.0, -131.0),
+    ),
+    'AYPM': (
+        (0.0, 160.0),
+        (-4.833333333333333, 160.0),
+        (-4.833333333333333, 159.0),
+        (-12.0, 155.0),
+        (-12.0, 144.0),
+        (0.0, 141.0),
+        (0.0, 160.0),
+    ),
+}
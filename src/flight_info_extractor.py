@@ -5,7 +5,30 @@ DEP, DEST, ALTN, EDTO 공항을 자동으로 추출
 """
 
 import re
-from typing import Dict, List, Optional, Any
+import functools
+from typing import Dict, List, Optional, Any, Tuple
+
+_NON_TEXT_CHAR_RE = re.compile(r'[^\w\s\.\-]')
+_WS_RE = re.compile(r'\s+')
+
+@functools.lru_cache(maxsize=4)
+def _clean_text_cached(text: str) -> str:
+    """FlightInfoExtractor._clean_text 결과 캐시 (같은 텍스트로 여러 번 호출되므로)"""
+    # 대문자 변환
+    text = text.upper()
+    
+    # 불필요한 문자 제거
+    text = _NON_TEXT_CHAR_RE.sub(' ', text)
+    
+    # 연속 공백 제거
+    text = _WS_RE.sub(' ', text)
+    
+    return text.strip()
+
+@functools.lru_cache(maxsize=4)
+def _split_upper_lines(text: str) -> Tuple[str, ...]:
+    """텍스트를 줄 단위로 나눠 대문자로 변환한 결과 캐시 (키워드별 검색에서 재사용)"""
+    return tuple(line.upper() for line in text.split('\n'))
 
 class FlightInfoExtractor:
     """NOTAM 텍스트에서 항공편 정보 추출기"""
@@ -39,6 +62,16 @@ class FlightInfoExtractor:
             # 기타
             'PANC', 'PAED', 'PASY', 'PAKN', 'PACD', 'PAZA', 'KZAK', 'RJJJ'
         }
+        
+        # 키워드 기반 공항 추출 패턴 (유형별, 키워드 순서대로 (PACKAGE 줄용, 전체 텍스트용))
+        self._keyword_airport_patterns = {
+            airport_type: [
+                (re.compile(rf'{keyword}[:\s]+({self.airport_pattern})'),
+                 re.compile(rf'{keyword}[:\s]+({self.airport_pattern})(?:\s|$|[^\w])'))
+                for keyword in keywords
+            ]
+            for airport_type, keywords in self.flight_keywords.items()
+        }
     
     def extract_flight_info(self, notam_text: str) -> Dict[str, Any]:
         """
@@ -237,55 +270,42 @@ class FlightInfoExtractor:
         return package_sections
     
     def _clean_text(self, text: str) -> str:
-        """텍스트 정리"""
-        # 대문자 변환
-        text = text.upper()
-        
-        # 불필요한 문자 제거
-        text = re.sub(r'[^\w\s\.\-]', ' ', text)
-        
-        # 연속 공백 제거
-        text = re.sub(r'\s+', ' ', text)
-        
-        return text.strip()
+        """텍스트 정리 (대문자 변환, 불필요한 문자/연속 공백 제거)"""
+        return _clean_text_cached(text)
     
     def _extract_airport_by_keyword(self, text: str, airport_type: str) -> Optional[str]:
         """키워드 기반 공항 추출"""
-        keywords = self.flight_keywords[airport_type]
+        patterns = self._keyword_airport_patterns[airport_type]
         
-        # 여러 PACKAGE에서 검색 (PACKAGE 1, 2, 3 등)
-        lines = text.split('\n')
+        # 여러 PACKAGE에서 검색 (PACKAGE 1, 2, 3 등), 줄 분리/대문자 변환은 텍스트당 한 번
+        lines = _split_upper_lines(text)
         
         # PACKAGE별로 검색
-        for i, line in enumerate(lines):
-            line_upper = line.upper()
-            
+        for i, line_upper in enumerate(lines):
             # PACKAGE 헤더 라인인지 확인
             if 'PACKAGE' in line_upper and i + 1 < len(lines):
                 # 다음 줄도 확인 (KE0041 / ICN / SEA 형태)
-                next_line = lines[i + 1].upper()
+                next_line = lines[i + 1]
                 
-                for keyword in keywords:
+                for pattern, _ in patterns:
                     # 현재 줄에서 검색
-                    pattern = rf'{keyword}[:\s]+({self.airport_pattern})'
-                    match = re.search(pattern, line_upper)
+                    match = pattern.search(line_upper)
                     if match:
                         airport_code = match.group(1)
                         if self._is_valid_airport(airport_code):
                             return airport_code
                     
                     # 다음 줄에서 검색
-                    match = re.search(pattern, next_line)
+                    match = pattern.search(next_line)
                     if match:
                         airport_code = match.group(1)
                         if self._is_valid_airport(airport_code):
                             return airport_code
         
         # PACKAGE에서 찾지 못한 경우 전체 텍스트에서 검색 (더 정확한 패턴)
-        for keyword in keywords:
+        for _, pattern in patterns:
             # 더 정확한 패턴: 키워드 뒤에 공항 코드만 오도록
-            pattern = rf'{keyword}[:\s]+({self.airport_pattern})(?:\s|$|[^\w])'
-            match = re.search(pattern, text)
+            match = pattern.search(text)
             
             if match:
                 airport_code = match.group(1)
@@ -5,16 +5,32 @@ Gemini API를 사용한 고급 NOTAM 번역 및 요약 모듈
 """
 
 import os
+import json
+import asyncio
+import concurrent.futures
+import hashlib
 import logging
-from typing import Dict, List, Optional
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 import re
 from datetime import datetime
 
 try:
     import google.generativeai as genai
     GEMINI_AVAILABLE = True
+    # 인스턴스마다 새로 만들지 않도록 생성 설정을 모듈에서 한 번만 생성
+    _GEN_CONFIG = genai.types.GenerationConfig(temperature=0.3)
 except ImportError:
     GEMINI_AVAILABLE = False
+    _GEN_CONFIG = None
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 from .constants import (
     NO_TRANSLATE_TERMS, 
@@ -24,6 +40,130 @@ from .constants import (
     COLOR_STYLES
 )
 
+# apply_color_styles용 정규식 (모듈 로드 시 한 번만 컴파일)
+_SPAN_RE = re.compile(r'<span[^>]*>|</span>')
+_RUNWAY_RE = re.compile(r'\bRunway\s+', re.IGNORECASE)
+# 빨간색 용어는 목록 순서대로 우선 (대소문자 무시, 치환 시 목록 표기 사용)
+_RED_TERMS = {}
+for _term in RED_STYLE_TERMS:
+    if _term != 'GPS RAIM':  # GPS RAIM은 공백 변형까지 별도 그룹으로 처리
+        _RED_TERMS.setdefault(_term.lower(), _term)
+_STYLE_RE = re.compile(
+    r'(?P<raim>\bGPS\s+RAIM\b)'
+    r'|(?P<red>(?i:' + '|'.join(r'\b' + re.escape(term) + r'\b' for term in _RED_TERMS.values()) + r'))'
+    r'|(?P<blue>' + '|'.join(f'(?:{pattern})' for pattern in BLUE_STYLE_PATTERNS) + r')'
+)
+
+def _style_replace(match: re.Match) -> str:
+    """_STYLE_RE 매치 그룹에 맞는 색상 스타일 적용"""
+    if match.group('raim') is not None:
+        return f'{COLOR_STYLES["red"]}GPS RAIM{COLOR_STYLES["end"]}'
+    if match.group('red') is not None:
+        return f'{COLOR_STYLES["red"]}{_RED_TERMS[match.group(0).lower()]}{COLOR_STYLES["end"]}'
+    return f'{COLOR_STYLES["blue"]}{match.group(0)}{COLOR_STYLES["end"]}'
+
+# 여러 NOTAM 동시 처리 시 Gemini 동시 요청 수 상한
+GEMINI_MAX_CONCURRENCY = int(os.getenv('GEMINI_MAX_CONCURRENCY', '8'))
+
+# 동일 NOTAM 재호출 방지용 Gemini 결과 캐시 ((종류, 입력 해시) -> 결과 문자열)
+GEMINI_CACHE_SIZE = 4096
+# 설정 시 SQLite 파일에도 저장해 프로세스 재시작 후에도 재사용 (예: cache/gemini_cache.sqlite3)
+GEMINI_CACHE_DB = os.getenv('GEMINI_CACHE_DB')
+_gemini_cache = OrderedDict()
+_gemini_cache_lock = threading.Lock()
+_gemini_db_ready = False
+
+def _gemini_cache_key(*parts: str) -> bytes:
+    """입력 텍스트의 blake2b 해시 (여러 입력은 NUL 문자로 구분)"""
+    return hashlib.blake2b('\0'.join(parts).encode('utf-8'), digest_size=16).digest()
+
+def _dumps_cache_result(result) -> str:
+    """캐시 저장용 JSON 직렬화 (orjson이 있으면 orjson 사용)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(result).decode('utf-8')
+    return json.dumps(result, ensure_ascii=False)
+
+def _loads_cache_result(cached: str):
+    """캐시 JSON 파싱 (orjson이 있으면 orjson 사용)"""
+    return orjson.loads(cached) if ORJSON_AVAILABLE else json.loads(cached)
+
+def _gemini_db_connect() -> sqlite3.Connection:
+    """캐시 DB 연결 (첫 연결 시 테이블 생성, _gemini_cache_lock 안에서 호출)"""
+    global _gemini_db_ready
+    conn = sqlite3.connect(GEMINI_CACHE_DB, timeout=5)
+    if not _gemini_db_ready:
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS gemini_cache '
+            '(hash BLOB NOT NULL, kind TEXT NOT NULL, result TEXT NOT NULL, PRIMARY KEY (hash, kind))'
+        )
+        conn.commit()
+        _gemini_db_ready = True
+    return conn
+
+def _gemini_cache_get(kind: str, key: bytes) -> Optional[str]:
+    """메모리 LRU -> SQLite 순으로 캐시 조회"""
+    with _gemini_cache_lock:
+        result = _gemini_cache.get((kind, key))
+        if result is not None:
+            _gemini_cache.move_to_end((kind, key))
+            return result
+        if not GEMINI_CACHE_DB:
+            return None
+        try:
+            conn = _gemini_db_connect()
+            try:
+                row = conn.execute(
+                    'SELECT result FROM gemini_cache WHERE hash = ? AND kind = ?', (key, kind)
+                ).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logging.getLogger(__name__).warning(f"Gemini 캐시 DB 조회 실패: {str(e)}")
+            return None
+        if row is None:
+            return None
+        _gemini_cache_store(kind, key, row[0])
+        return row[0]
+
+def _gemini_cache_store(kind: str, key: bytes, result: str):
+    """메모리 LRU에 저장하고 최대 크기를 넘으면 가장 오래된 항목 삭제 (_gemini_cache_lock 안에서 호출)"""
+    _gemini_cache[(kind, key)] = result
+    _gemini_cache.move_to_end((kind, key))
+    while len(_gemini_cache) > GEMINI_CACHE_SIZE:
+        _gemini_cache.popitem(last=False)
+
+def _gemini_cache_put(kind: str, key: bytes, result: str):
+    """Gemini 결과를 메모리 LRU와 (설정 시) SQLite에 저장"""
+    with _gemini_cache_lock:
+        _gemini_cache_store(kind, key, result)
+        if not GEMINI_CACHE_DB:
+            return
+        try:
+            conn = _gemini_db_connect()
+            try:
+                conn.execute(
+                    'INSERT OR REPLACE INTO gemini_cache (hash, kind, result) VALUES (?, ?, ?)',
+                    (key, kind, result)
+                )
+                conn.commit()
+            finally:
+                conn.close()
+        except sqlite3.Error as e:
+            logging.getLogger(__name__).warning(f"Gemini 캐시 DB 저장 실패: {str(e)}")
+
+async def _gemini_cache_get_async(kind: str, key: bytes) -> Optional[str]:
+    """_gemini_cache_get의 비동기 버전 (SQLite 캐시가 설정되면 이벤트 루프를 막지 않도록 스레드에서 조회)"""
+    if GEMINI_CACHE_DB:
+        return await asyncio.to_thread(_gemini_cache_get, kind, key)
+    return _gemini_cache_get(kind, key)
+
+async def _gemini_cache_put_async(kind: str, key: bytes, result: str):
+    """_gemini_cache_put의 비동기 버전 (SQLite 캐시가 설정되면 스레드에서 저장)"""
+    if GEMINI_CACHE_DB:
+        await asyncio.to_thread(_gemini_cache_put, kind, key, result)
+    else:
+        _gemini_cache_put(kind, key, result)
+
 class GeminiNOTAMTranslator:
     """Gemini API를 사용한 NOTAM 번역 및 요약 클래스"""
     
@@ -36,7 +176,7 @@ class GeminiNOTAMTranslator:
                 genai.configure(api_key=self.api_key)
                 self.model = genai.GenerativeModel(
                     'gemini-2.0-flash-exp',
-                    generation_config=genai.types.GenerationConfig(temperature=0.3)
+                    generation_config=_GEN_CONFIG
                 )
                 self.gemini_enabled = True
                 self.logger.info("Gemini API 초기화 완료")
@@ -59,32 +199,13 @@ class GeminiNOTAMTranslator:
             str: 스타일이 적용된 텍스트
         """
         # HTML 태그가 이미 있는지 확인하고 제거
-        text = re.sub(r'<span[^>]*>', '', text)
-        text = re.sub(r'</span>', '', text)
+        text = _SPAN_RE.sub('', text)
         
         # Runway를 RWY로 변환
-        text = re.sub(r'\bRunway\s+', 'RWY ', text, flags=re.IGNORECASE)
-        text = re.sub(r'\brunway\s+', 'RWY ', text, flags=re.IGNORECASE)
-        
-        # GPS RAIM을 하나의 단어로 처리
-        text = re.sub(
-            r'\bGPS\s+RAIM\b',
-            f'{COLOR_STYLES["red"]}GPS RAIM{COLOR_STYLES["end"]}',
-            text
-        )
+        text = _RUNWAY_RE.sub('RWY ', text)
         
-        # 빨간색 스타일 적용 (위험/주의사항)
-        for term in RED_STYLE_TERMS:
-            if term not in ['GPS RAIM']:  # GPS RAIM은 이미 처리됨
-                pattern = r'\b' + re.escape(term) + r'\b'
-                replacement = f'{COLOR_STYLES["red"]}{term}{COLOR_STYLES["end"]}'
-                text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
-        
-        # 파란색 스타일 적용 (항공시설/정보)
-        for pattern in BLUE_STYLE_PATTERNS:
-            def replace_func(match):
-                return f'{COLOR_STYLES["blue"]}{match.group(0)}{COLOR_STYLES["end"]}'
-            text = re.sub(pattern, replace_func, text)
+        # 빨간색(위험/주의사항, GPS RAIM 포함)과 파란색(항공시설/정보) 스타일을 한 번에 적용
+        text = _STYLE_RE.sub(_style_replace, text)
         
         return text
     
@@ -101,6 +222,11 @@ class GeminiNOTAMTranslator:
         if not self.gemini_enabled:
             return self.translate_with_dictionary(notam_text)
         
+        cache_key = _gemini_cache_key(notam_text)
+        cached = _gemini_cache_get('translation', cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             prompt = f"""다음 NOTAM(Notice to Airmen)을 한국어로 번역해주세요. 
 항공 전문용어는 정확하게 번역하고, 중요한 정보는 명확하게 전달해주세요.
@@ -117,7 +243,9 @@ NOTAM 원문:
 한국어 번역:"""
 
             response = self.model.generate_content(prompt)
-            return response.text.strip()
+            translation = response.text.strip()
+            _gemini_cache_put('translation', cache_key, translation)
+            return translation
             
         except Exception as e:
             self.logger.error(f"Gemini 번역 중 오류: {str(e)}")
@@ -180,6 +308,12 @@ NOTAM 원문:
         if not self.gemini_enabled:
             return self.summarize_with_template(notam_text)
         
+        # 프롬프트에는 원문과 한국어 번역만 들어가므로 두 값으로 캐시
+        cache_key = _gemini_cache_key(notam_text, korean_translation)
+        cached = _gemini_cache_get('summary', cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             prompt = f"""다음 NOTAM을 간단명료하게 요약해주세요.
 
@@ -213,7 +347,9 @@ NOTAM 원문:
 한국어 요약:"""
 
             response = self.model.generate_content(prompt)
-            return response.text.strip()
+            summary = response.text.strip()
+            _gemini_cache_put('summary', cache_key, summary)
+            return summary
             
         except Exception as e:
             self.logger.error(f"Gemini 요약 중 오류: {str(e)}")
@@ -245,40 +381,158 @@ NOTAM 원문:
         
         return " | ".join(summary_parts) if summary_parts else "항공정보 업데이트"
     
-    def process_notam_complete(self, notam_data: Dict) -> Dict:
-        """
-        NOTAM 데이터를 완전 처리 (번역 + 요약 + 스타일 적용)
+    def _build_complete_prompt(self, notam_text: str) -> str:
+        """번역 + 요약을 한 번에 요청하는 프롬프트 (JSON 응답)"""
+        return f"""다음 NOTAM(Notice to Airmen)을 한국어로 번역하고 간단명료하게 요약해주세요.
+
+번역 규칙:
+1. 항공 전문용어는 한국 항공업계 표준 용어 사용
+2. 공항 코드, 시간, 좌표는 원문 그대로 유지
+3. 중요한 안전 정보는 강조하여 번역
+4. 자연스러운 한국어로 번역하되 정확성 우선
+
+요약 규칙:
+1. 시간 정보, 문서 참조(AIRAC, AIP, AMDT, SUP), 공항 이름, 좌표는 포함하지 마세요
+2. 핵심 변경사항이나 영향, 구체적인 세부사항, 변경 이유에 집중
+3. 가능한 한 짧고 직접적으로 작성
+4. 활주로 방향은 "L/R" 형식 사용 (예: "RWY 15 L/R")
+
+NOTAM 원문:
+{notam_text}
+
+다음 JSON 형식으로만 응답하세요:
+{{"korean": "한국어 번역", "summary": "한국어 요약"}}"""
+    
+    @staticmethod
+    def _parse_complete_response(result_text: str) -> Optional[Tuple[str, str]]:
+        """통합 응답 JSON에서 (번역, 요약) 추출 (실패 시 None)"""
+        json_start = result_text.find('{')
+        json_end = result_text.rfind('}') + 1
+        if json_start == -1 or json_end <= json_start:
+            return None
+        try:
+            result = json.loads(result_text[json_start:json_end])
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(result, dict):
+            return None
+        korean, summary = result.get('korean'), result.get('summary')
+        if not isinstance(korean, str) or not isinstance(summary, str):
+            return None
+        return korean.strip(), summary.strip()
+    
+    def _translate_and_summarize_separately(self, notam_text: str) -> Tuple[str, str]:
+        """번역과 요약을 개별 호출로 처리 (사전/템플릿 폴백 포함)"""
+        korean_translation = self.translate_with_gemini(notam_text)
+        summary = self.summarize_with_gemini(notam_text, notam_text, korean_translation)
+        return korean_translation, summary
+    
+    def _translate_and_summarize(self, notam_text: str) -> Tuple[str, str]:
+        """번역 + 요약을 Gemini 1회 호출로 처리"""
+        if not self.gemini_enabled:
+            return self._translate_and_summarize_separately(notam_text)
         
-        Args:
-            notam_data (Dict): 원본 NOTAM 데이터
-            
-        Returns:
-            Dict: 처리된 NOTAM 데이터
-        """
-        processed = notam_data.copy()
+        cache_key = _gemini_cache_key(notam_text)
+        cached = _gemini_cache_get('complete', cache_key)
+        if cached is not None:
+            return tuple(_loads_cache_result(cached))
         
-        original_text = notam_data.get('description', '')
+        try:
+            response = self.model.generate_content(self._build_complete_prompt(notam_text))
+            parsed = self._parse_complete_response(response.text)
+            if parsed:
+                _gemini_cache_put('complete', cache_key, _dumps_cache_result(parsed))
+                return parsed
+            self.logger.warning("Gemini 통합 응답 파싱 실패 - 개별 번역/요약으로 재시도")
+        except Exception as e:
+            self.logger.error(f"Gemini 통합 처리 중 오류: {str(e)}")
+        return self._translate_and_summarize_separately(notam_text)
+    
+    async def _translate_and_summarize_async(self, notam_text: str) -> Tuple[str, str]:
+        """번역 + 요약을 Gemini 1회 비동기 호출로 처리"""
+        if not self.gemini_enabled:
+            return self._translate_and_summarize_separately(notam_text)
         
-        # 번역
-        korean_translation = self.translate_with_gemini(original_text)
-        processed['korean_translation'] = korean_translation
+        cache_key = _gemini_cache_key(notam_text)
+        cached = await _gemini_cache_get_async('complete', cache_key)
+        if cached is not None:
+            return tuple(_loads_cache_result(cached))
         
-        # 요약
-        summary = self.summarize_with_gemini(original_text, original_text, korean_translation)
+        try:
+            response = await self.model.generate_content_async(self._build_complete_prompt(notam_text))
+            parsed = self._parse_complete_response(response.text)
+            if parsed:
+                await _gemini_cache_put_async('complete', cache_key, _dumps_cache_result(parsed))
+                return parsed
+            self.logger.warning("Gemini 통합 응답 파싱 실패 - 개별 번역/요약으로 재시도")
+        except Exception as e:
+            self.logger.error(f"Gemini 통합 처리 중 오류: {str(e)}")
+        return await asyncio.to_thread(self._translate_and_summarize_separately, notam_text)
+    
+    def _build_processed_notam(self, notam_data: Dict, korean_translation: str, summary: str,
+                               inplace: bool = False) -> Dict:
+        """번역/요약 결과에 색상 스타일과 처리 시간을 붙여 처리된 NOTAM 생성 (inplace면 원본 dict에 기록)"""
+        processed = notam_data if inplace else notam_data.copy()
+        processed['korean_translation'] = korean_translation
         processed['summary'] = summary
         
         # 색상 스타일 적용
-        styled_korean = self.apply_color_styles(korean_translation)
-        processed['styled_korean'] = styled_korean
-        
-        styled_summary = self.apply_color_styles(summary)
-        processed['styled_summary'] = styled_summary
+        processed['styled_korean'] = self.apply_color_styles(korean_translation)
+        processed['styled_summary'] = self.apply_color_styles(summary)
         
         # 처리 시간 기록
         processed['processed_at'] = datetime.now().isoformat()
         
         return processed
     
+    def process_notam_complete(self, notam_data: Dict, inplace: bool = False) -> Dict:
+        """
+        NOTAM 데이터를 완전 처리 (번역 + 요약 + 스타일 적용)
+        
+        Args:
+            notam_data (Dict): 원본 NOTAM 데이터
+            inplace (bool): True면 복사 없이 notam_data에 결과 필드를 직접 추가
+            
+        Returns:
+            Dict: 처리된 NOTAM 데이터
+        """
+        korean_translation, summary = self._translate_and_summarize(notam_data.get('description', ''))
+        return self._build_processed_notam(notam_data, korean_translation, summary, inplace)
+    
+    async def process_notams_complete_async(self, notams: List[Dict], inplace: bool = False) -> List[Dict]:
+        """여러 NOTAM을 동시에 완전 처리 (동시 요청 수는 GEMINI_MAX_CONCURRENCY로 제한)"""
+        semaphore = asyncio.Semaphore(max(1, GEMINI_MAX_CONCURRENCY))
+        
+        async def process_one(notam_data: Dict) -> Dict:
+            async with semaphore:
+                korean_translation, summary = await self._translate_and_summarize_async(
+                    notam_data.get('description', '')
+                )
+            return self._build_processed_notam(notam_data, korean_translation, summary, inplace)
+        
+        return list(await asyncio.gather(*(process_one(notam) for notam in notams)))
+    
+    def process_notams_complete(self, notams: List[Dict], inplace: bool = False) -> List[Dict]:
+        """
+        NOTAM 리스트 완전 처리 (process_notam_complete 반복 호출 대신 요청을 동시에 전송)
+        
+        Args:
+            notams (List[Dict]): 원본 NOTAM 리스트
+            inplace (bool): True면 복사 없이 각 NOTAM dict에 결과 필드를 직접 추가
+            
+        Returns:
+            List[Dict]: 입력 순서대로 처리된 NOTAM 리스트
+        """
+        if not notams:
+            return []
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(self.process_notams_complete_async(notams, inplace))
+        # 이미 실행 중인 이벤트 루프 안에서 호출되면 asyncio.run을 쓸 수 없으므로 별도 스레드의 새 루프에서 실행
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, self.process_notams_complete_async(notams, inplace)).result()
+    
     def create_flight_briefing(self, notams: List[Dict], flight_route: Optional[List[str]] = None) -> str:
         """
         비행 브리핑용 NOTAM 요약 생성
@@ -290,11 +544,13 @@ NOTAM 원문:
         Returns:
             str: 비행 브리핑 텍스트
         """
-        briefing = "=== 대한항공 NOTAM 브리핑 ===\n\n"
-        briefing += f"생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n"
+        parts = [
+            "=== 대한항공 NOTAM 브리핑 ===\n\n",
+            f"생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n\n",
+        ]
         
         if flight_route:
-            briefing += f"비행 경로: {' → '.join(flight_route)}\n\n"
+            parts.append(f"비행 경로: {' → '.join(flight_route)}\n\n")
         
         # 우선순위별 분류
         critical_notams = []
@@ -309,20 +565,22 @@ NOTAM 원문:
         
         # 중요 NOTAM
         if critical_notams:
-            briefing += "🚨 중요 NOTAM:\n"
-            for notam in critical_notams:
-                summary = notam.get('summary', notam.get('description', ''))
-                briefing += f"- {summary[:100]}...\n"
-            briefing += "\n"
+            parts.append("🚨 중요 NOTAM:\n")
+            parts.extend(
+                f"- {notam.get('summary', notam.get('description', ''))[:100]}...\n"
+                for notam in critical_notams
+            )
+            parts.append("\n")
         
         # 일반 NOTAM
         if normal_notams:
-            briefing += "📋 일반 NOTAM:\n"
-            for notam in normal_notams:
-                summary = notam.get('summary', notam.get('description', ''))
-                briefing += f"- {summary[:100]}...\n"
+            parts.append("📋 일반 NOTAM:\n")
+            parts.extend(
+                f"- {notam.get('summary', notam.get('description', ''))[:100]}...\n"
+                for notam in normal_notams
+            )
         
-        return briefing
+        return ''.join(parts)
 
 
 # 하위 호환성을 위한 별칭
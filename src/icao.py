@@ -28,13 +28,17 @@ def _load_airport_timezones():
     csv_path = os.path.join(os.path.dirname(__file__), 'airports_timezones.csv')
     
     try:
-        with open(csv_path, 'r', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                icao_code = row.get('ident', '').upper()
-                timezone = row.get('time_zone', '')
-                if icao_code and timezone:
-                    _airport_timezones[icao_code] = timezone
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            # 행마다 dict를 만들지 않도록 헤더에서 컬럼 위치만 찾아 한 번에 등록
+            reader = csv.reader(f)
+            header = next(reader, [])
+            ident_idx = header.index('ident')
+            tz_idx = header.index('time_zone')
+            min_len = max(ident_idx, tz_idx) + 1
+            _airport_timezones.update(
+                (row[ident_idx].upper(), row[tz_idx]) for row in reader
+                if len(row) >= min_len and row[ident_idx] and row[tz_idx]
+            )
         _csv_loaded = True
         print(f"공항 시간대 정보 로드 완료: {len(_airport_timezones)}개 공항")
     except Exception as e:
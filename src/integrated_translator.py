@@ -92,6 +92,9 @@ load_dotenv()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# 번역 결과로 NOTAM에 추가되는 필드
+TRANSLATION_FIELDS = ('korean_translation', 'korean_summary', 'english_translation', 'english_summary', 'e_section')
+
 class IntegratedNOTAMTranslator:
     """통합 NOTAM 번역기 - 번역과 요약을 한 번의 API 호출로 처리"""
     
@@ -113,7 +116,7 @@ class IntegratedNOTAMTranslator:
         self.cache_enabled = True
         
         # 처리 설정 (개별 처리 최적화 - notam_translator.py 참조)
-        self.max_workers = 3  # 워커 수를 3으로 조정
+        self.max_workers = int(os.getenv('NOTAM_TRANSLATION_WORKERS', '3'))  # 동시 API 호출 수 (기본 3)
         self.batch_size = 3   # 배치 크기를 3으로 조정
         
         self.logger.info("통합 NOTAM 번역기 초기화 완료")
@@ -1086,13 +1089,24 @@ This NOTAM is about {airport_code} airport.
         # 개별 처리로 전환 (배치 처리 문제 해결)
         self.logger.info(f"개별 처리 모드로 전환: {len(notams_data)}개 NOTAM")
         
+        # 원문과 공항이 같은 NOTAM은 한 번만 번역하고 결과를 공유 (API 호출 수 감소)
+        duplicate_indices = {}
+        unique_indices = {}
+        for i, e_section in enumerate(e_sections):
+            key = (e_section, notams_data[i].get('airport_code'))
+            if key in unique_indices:
+                duplicate_indices.setdefault(unique_indices[key], []).append(i)
+            else:
+                unique_indices[key] = i
+        if duplicate_indices:
+            self.logger.info(f"중복 원문 NOTAM {sum(map(len, duplicate_indices.values()))}개는 번역 결과 재사용")
+        
         # 모든 NOTAM을 개별적으로 처리 (병렬 처리 최적화)
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 각 NOTAM에 대해 개별 처리 작업 생성
+            # 중복 없는 NOTAM에 대해 개별 처리 작업 생성
             futures = {}
-            for i, notam in enumerate(notams_data):
-                e_section = e_sections[i]
-                future = executor.submit(self.process_single_notam_complete, notam, e_section, i)
+            for i in unique_indices.values():
+                future = executor.submit(self.process_single_notam_complete, notams_data[i], e_sections[i], i)
                 futures[future] = i
             
             # 결과 수집 (완료 순서대로)
@@ -1112,6 +1126,14 @@ This NOTAM is about {airport_code} airport.
                     results[notam_idx] = self._create_fallback_result(notams_data[notam_idx], e_sections[notam_idx])
                     completed_count += 1
             
+            # 중복 NOTAM에 번역 결과 복사 (NOTAM 고유 필드는 각자 유지)
+            for source_idx, target_indices in duplicate_indices.items():
+                source = results[source_idx]
+                for target_idx in target_indices:
+                    enhanced_notam = notams_data[target_idx].copy()
+                    enhanced_notam.update({field: source[field] for field in TRANSLATION_FIELDS if field in source})
+                    results[target_idx] = enhanced_notam
+            
             # None 값 제거 (실패한 경우)
             results = [r for r in results if r is not None]
         
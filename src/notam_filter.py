@@ -5,6 +5,7 @@ import re
 from datetime import datetime, timedelta
 import json
 import csv
+import functools
 import logging
 import sys
 import os
@@ -585,6 +586,84 @@ def identify_notam_type(notam_number):
 __all__ = ['apply_color_styles', 'RED_STYLE_TERMS', 'BLUE_STYLE_PATTERNS', 'NOTAMFilter']
 
 
+# NOTAM 본문에서 제거할 추가 정보 패턴들 (한 번만 컴파일)
+_ADDITIONAL_INFO_PATTERNS = [
+    r'^\d+\.\s*COMPANY\s+RADIO\s*:',
+    r'^\d+\.\s*COMPANY\s+ADVISORY\s*:',
+    r'^\d+\.\s*RADIO\s*:',
+    r'^\d+\.\s*ADVISORY\s*:',
+    r'^\d+\.\s*[A-Z\s]+\s*:',
+    r'^\[PAX\]',
+    r'^\[JINAIR\]',
+    r'^CTC\s+TWR',
+    r'^NIL\s*$',
+    r'^COMMENT\)\s*$',
+    # 번호가 매겨진 COMPANY ADVISORY 항목들 (COAD NOTAM은 제외)
+    # r'^\d+\.\s+\d{2}[A-Z]{3}\d{2}\s+\d{2}:\d{2}\s*-\s*(?:UFN|PERM)\s+[A-Z]{4}\s+COAD\d+/\d+',  # COAD NOTAM은 유효한 NOTAM이므로 제거하지 않음
+    r'^\d+\.\s+\d{2}[A-Z]{3}\d{2}\s+\d{2}:\d{2}\s*-\s*(?:UFN|PERM)\s+[A-Z]{4}\s+(?!COAD)[A-Z]+\d+/\d+',
+    # OCR 오류 패턴들 추가
+    r'â—C¼O\s*MPANY',
+    r'â—C¼O\s*COMPANY',
+    r'â—A¼R\s*RIVAL',
+    r'â—O¼B\s*STRUCTION',
+    r'â—G¼P\s*S',
+    r'â—R¼U\s*NWAY',
+    r'â—A¼PP\s*ROACH',
+    r'â—T¼A\s*XIWAY',
+    r'â—N¼A\s*VAID',
+    r'â—D¼E\s*PARTURE',
+    r'â—R¼U\s*NWAY\s*LIGHT',
+    r'â—A¼IP',
+    r'â—O¼T\s*HER',
+    # 추가 패턴들 - 베트남 관련 내용
+    r'//REQUIRED WEATHER MINIMA IN VIETNAM//',
+    r'// SPEED LIMIT WHEN USING VDGS //',
+    r'CAAV\(CIVIL AVIATION AUTHORITY OF VIETNAM\)',
+    r'CARGO FLIGHTS ARE NOT ALLOWED TO LAND EARLIER',
+    r'PLZ DEPART TO HAN AFTER ETD ON FPL',
+    r'ANY QUESTIONS ABOUT ETD OF FLT',
+    r'CONTACT KOREANAIR DISPATCH BY CO-RADIO',
+    r'// SIMILAR CALLSIGN //',
+    r'KE\d+ AND KE\d+ MAY OPERATE ON SAME FREQ',
+    r'PLZ PAY MORE ATTENTION TO ATC COMMUNICATION',
+    r'CEILING IS ALWAYS SHOWN IN SMALLER SIZE',
+    r'MUST NOT EXCEED \d+KTS FROM STARTING POINT',
+    r'REDUCE SPEED TO STOP AT THE DESIGNATED STOP LINE',
+    # 기타 불필요한 패턴들
+    r'^\d+\.\s+ANY REVISION TO RWY CLOSURE',
+    r'^\d+\.\s+IN THE EVENT THAT THE OPERATIONAL RWY',
+    r'DEPENDENT ON THE WORK BEING CARRIED OUT',
+    r'IT MAY TAKE UP TO \d+ HRS FOR A CLOSED RWY',
+]
+_ADDITIONAL_INFO_RE = re.compile('|'.join(f'(?:{p})' for p in _ADDITIONAL_INFO_PATTERNS), re.IGNORECASE)
+
+# NOTAM이 아닌 비정보 섹션을 나타내는 문구
+_NON_NOTAM_PHRASES = ('COMPANY ADVISORY', 'OTHER INFORMATION', 'DEP:', 'DEST:', 'ALTN:', 'SECY')
+
+# 공항 정보 섹션 패턴들
+_AIRPORT_INFO_PATTERNS = [
+    r'^\d+\. RUNWAY',  # "1. RUNWAY :"
+    r'^\d+\. COMPANY RADIO',  # "2. COMPANY RADIO :"
+    r'TAKEOFF PERFORMANCE INFORMATION',
+    r'NOTAM A\d{4}/\d{2}.*NO IMPACT',  # 성능 정보 관련
+    r'CHECK RWY ID FOR TODC REQUEST',
+    r'COMPANY MINIMA FOR CAT II/III',  # 추가 패턴
+    r'131\.500.*KOREAN AIR INCHEON',  # 주파수 정보
+    r'129\.35.*ASIANA INCHEON'  # 추가 주파수 정보
+]
+_AIRPORT_INFO_RE = re.compile('|'.join(f'(?:{p})' for p in _AIRPORT_INFO_PATTERNS), re.IGNORECASE)
+
+_NOTAM_ID_RE = re.compile(r'\b([A-Z]\d{4}/\d{2})\b')
+
+@functools.lru_cache(maxsize=512)
+def _parse_utc_offset(timezone_offset):
+    """'+09:00' 형식 타임존 오프셋을 timedelta로 변환 (오프셋 종류가 적으므로 결과 캐싱)"""
+    offset_sign = 1 if timezone_offset.startswith('+') else -1
+    offset_hours = int(timezone_offset[1:3])
+    offset_minutes = int(timezone_offset[4:6])
+    return timedelta(hours=offset_hours * offset_sign, minutes=offset_minutes * offset_sign)
+
+
 class NOTAMFilter:
     """NOTAM 필터링 및 파싱 클래스"""
     
@@ -1148,60 +1227,10 @@ class NOTAMFilter:
         lines = notam_text.split('\n')
         cleaned_lines = []
         
-        # 추가 정보 패턴들
-        additional_info_patterns = [
-            r'^\d+\.\s*COMPANY\s+RADIO\s*:',
-            r'^\d+\.\s*COMPANY\s+ADVISORY\s*:',
-            r'^\d+\.\s*RADIO\s*:',
-            r'^\d+\.\s*ADVISORY\s*:',
-            r'^\d+\.\s*[A-Z\s]+\s*:',
-            r'^\[PAX\]',
-            r'^\[JINAIR\]',
-            r'^CTC\s+TWR',
-            r'^NIL\s*$',
-            r'^COMMENT\)\s*$',
-            # 번호가 매겨진 COMPANY ADVISORY 항목들 (COAD NOTAM은 제외)
-            # r'^\d+\.\s+\d{2}[A-Z]{3}\d{2}\s+\d{2}:\d{2}\s*-\s*(?:UFN|PERM)\s+[A-Z]{4}\s+COAD\d+/\d+',  # COAD NOTAM은 유효한 NOTAM이므로 제거하지 않음
-            r'^\d+\.\s+\d{2}[A-Z]{3}\d{2}\s+\d{2}:\d{2}\s*-\s*(?:UFN|PERM)\s+[A-Z]{4}\s+(?!COAD)[A-Z]+\d+/\d+',
-            # OCR 오류 패턴들 추가
-            r'â—C¼O\s*MPANY',
-            r'â—C¼O\s*COMPANY',
-            r'â—A¼R\s*RIVAL',
-            r'â—O¼B\s*STRUCTION',
-            r'â—G¼P\s*S',
-            r'â—R¼U\s*NWAY',
-            r'â—A¼PP\s*ROACH',
-            r'â—T¼A\s*XIWAY',
-            r'â—N¼A\s*VAID',
-            r'â—D¼E\s*PARTURE',
-            r'â—R¼U\s*NWAY\s*LIGHT',
-            r'â—A¼IP',
-            r'â—O¼T\s*HER',
-            # 추가 패턴들 - 베트남 관련 내용
-            r'//REQUIRED WEATHER MINIMA IN VIETNAM//',
-            r'// SPEED LIMIT WHEN USING VDGS //',
-            r'CAAV\(CIVIL AVIATION AUTHORITY OF VIETNAM\)',
-            r'CARGO FLIGHTS ARE NOT ALLOWED TO LAND EARLIER',
-            r'PLZ DEPART TO HAN AFTER ETD ON FPL',
-            r'ANY QUESTIONS ABOUT ETD OF FLT',
-            r'CONTACT KOREANAIR DISPATCH BY CO-RADIO',
-            r'// SIMILAR CALLSIGN //',
-            r'KE\d+ AND KE\d+ MAY OPERATE ON SAME FREQ',
-            r'PLZ PAY MORE ATTENTION TO ATC COMMUNICATION',
-            r'CEILING IS ALWAYS SHOWN IN SMALLER SIZE',
-            r'MUST NOT EXCEED \d+KTS FROM STARTING POINT',
-            r'REDUCE SPEED TO STOP AT THE DESIGNATED STOP LINE',
-            # 기타 불필요한 패턴들
-            r'^\d+\.\s+ANY REVISION TO RWY CLOSURE',
-            r'^\d+\.\s+IN THE EVENT THAT THE OPERATIONAL RWY',
-            r'DEPENDENT ON THE WORK BEING CARRIED OUT',
-            r'IT MAY TAKE UP TO \d+ HRS FOR A CLOSED RWY',
-        ]
-        
         for line in lines:
             line_stripped = line.strip()
             # 추가 정보 패턴에 매치되면 제거
-            if any(re.search(pattern, line_stripped, re.IGNORECASE) for pattern in additional_info_patterns):
+            if _ADDITIONAL_INFO_RE.search(line_stripped):
                 continue
             cleaned_lines.append(line)
         
@@ -1215,25 +1244,15 @@ class NOTAMFilter:
         parsed_notam = {}
         
         # NOTAM이 아닌 비정보 섹션 체크 (COMPANY ADVISORY 등)
-        if any(phrase in cleaned_text.upper() for phrase in ['COMPANY ADVISORY', 'OTHER INFORMATION', 'DEP:', 'DEST:', 'ALTN:', 'SECY']):
+        cleaned_upper = cleaned_text.upper()
+        if any(phrase in cleaned_upper for phrase in _NON_NOTAM_PHRASES):
             # 길이가 긴 경우 더 엄격한 체크
             if len(cleaned_text) > 400:
                 self.logger.debug(f"긴 비NOTAM 섹션 감지하여 건너뛰기: {cleaned_text[:100]}...")
                 return {}
         
         # 공항 정보 섹션 체크 (특별한 패턴들)
-        airport_info_patterns = [
-            r'^\d+\. RUNWAY',  # "1. RUNWAY :"
-            r'^\d+\. COMPANY RADIO',  # "2. COMPANY RADIO :"
-            r'TAKEOFF PERFORMANCE INFORMATION',
-            r'NOTAM A\d{4}/\d{2}.*NO IMPACT',  # 성능 정보 관련
-            r'CHECK RWY ID FOR TODC REQUEST',
-            r'COMPANY MINIMA FOR CAT II/III',  # 추가 패턴
-            r'131\.500.*KOREAN AIR INCHEON',  # 주파수 정보
-            r'129\.35.*ASIANA INCHEON'  # 추가 주파수 정보
-        ]
-        
-        if any(re.search(pattern, cleaned_text, re.IGNORECASE) for pattern in airport_info_patterns):
+        if _AIRPORT_INFO_RE.search(cleaned_text):
             if len(cleaned_text) > 500:  # 매우 긴 공항 정보 섹션
                 self.logger.debug(f"긴 공항 정보 섹션 감지하여 건너뛰기: {cleaned_text[:100]}...")
                 return {}
@@ -1311,7 +1330,7 @@ class NOTAMFilter:
                     parsed_notam['notam_number'] = f"COAD{coad_match.group(2)}"
                 else:
                     # 기존 패턴도 시도
-                    notam_fallback2 = re.search(r'\b([A-Z]\d{4}/\d{2})\b', cleaned_text)
+                    notam_fallback2 = _NOTAM_ID_RE.search(cleaned_text)
                     if notam_fallback2:
                         parsed_notam['notam_number'] = notam_fallback2.group(1)
         
@@ -1486,10 +1505,7 @@ class NOTAMFilter:
             effective_dt = datetime.fromisoformat(parsed_notam['effective_time'].replace('Z', '+00:00'))
             
             # 타임존 오프셋 파싱 (+09:00 형식)
-            offset_sign = 1 if timezone_offset.startswith('+') else -1
-            offset_hours = int(timezone_offset[1:3])
-            offset_minutes = int(timezone_offset[4:6])
-            offset_delta = timedelta(hours=offset_hours * offset_sign, minutes=offset_minutes * offset_sign)
+            offset_delta = _parse_utc_offset(timezone_offset)
             
             # 로컬 시간 계산
             local_start = effective_dt + offset_delta
@@ -1532,10 +1548,7 @@ class NOTAMFilter:
             effective_dt = datetime.fromisoformat(effective_time.replace('Z', '+00:00'))
             
             # 타임존 오프셋 파싱 (+09:00 형식)
-            offset_sign = 1 if timezone_offset.startswith('+') else -1
-            offset_hours = int(timezone_offset[1:3])
-            offset_minutes = int(timezone_offset[4:6])
-            offset_delta = timedelta(hours=offset_hours * offset_sign, minutes=offset_minutes * offset_sign)
+            offset_delta = _parse_utc_offset(timezone_offset)
             
             # 로컬 시간 계산
             local_start = effective_dt + offset_delta
@@ -1580,10 +1593,7 @@ class NOTAMFilter:
             from datetime import datetime, timedelta
             
             # 타임존 오프셋 파싱 (+07:00 형식)
-            offset_sign = 1 if timezone_offset.startswith('+') else -1
-            offset_hours = int(timezone_offset[1:3])
-            offset_minutes = int(timezone_offset[4:6])
-            offset_delta = timedelta(hours=offset_hours * offset_sign, minutes=offset_minutes * offset_sign)
+            offset_delta = _parse_utc_offset(timezone_offset)
             
             lines = d_field.split('\n')
             converted_lines = []
@@ -1659,8 +1669,12 @@ class NOTAMFilter:
             return 'package'
         return 'airport'
 
-    def filter_korean_air_notams(self, text):
-        """한국 항공사 노선 관련 모든 공항 NOTAM 처리 (패키지/개별 공항 자동 감지)"""
+    def filter_korean_air_notams(self, text, sort_by_package=True):
+        """
+        한국 항공사 노선 관련 모든 공항 NOTAM 처리 (패키지/개별 공항 자동 감지)
+        sort_by_package=False이면 패키지 공항 순서 정렬을 생략하고 원문 순서로 반환
+        (정렬은 이후 sort_by_package_order로 적용)
+        """
         import re
         
         # NOTAM 유형 감지
@@ -1668,7 +1682,7 @@ class NOTAMFilter:
         self.logger.info(f"NOTAM 유형 감지: {notam_type}")
         
         if notam_type == 'package':
-            return self._filter_package_notams(text)
+            return self._filter_package_notams(text, sort_by_package=sort_by_package)
         else:
             return self._filter_airport_notams(text)
 
@@ -1843,7 +1857,8 @@ class NOTAMFilter:
                 notam_dict = {
                     'id': parsed_notam.get('notam_number', 'Unknown'),
                     'notam_number': parsed_notam.get('notam_number', 'Unknown'),
-                    'airport_code': parsed_notam.get('airport_code'),
+                    'airport_code': parsed_notam['airport_code'],
+                    'airport_codes': [parsed_notam['airport_code']],
                     'effective_time': parsed_notam.get('effective_time', ''),
                     'expiry_time': parsed_notam.get('expiry_time', ''),
                     'description': description,
@@ -1934,7 +1949,7 @@ class NOTAMFilter:
         self.logger.warning(f"❌ 패턴을 찾지 못해서 원본 텍스트 반환")
         return text
 
-    def _filter_package_notams(self, text):
+    def _filter_package_notams(self, text, sort_by_package=True):
         """패키지 NOTAM 필터링 (pdf_to_txt_test_package.py 기반)"""
         import re
         
@@ -1977,7 +1992,8 @@ class NOTAMFilter:
                 notam_dict = {
                     'id': parsed_notam.get('notam_number', 'Unknown'),
                     'notam_number': parsed_notam.get('notam_number', 'Unknown'),
-                    'airport_code': parsed_notam.get('airport_code'),
+                    'airport_code': parsed_notam['airport_code'],
+                    'airport_codes': [parsed_notam['airport_code']],
                     'effective_time': parsed_notam.get('effective_time', ''),
                     'expiry_time': parsed_notam.get('expiry_time', ''),
                     'description': parsed_notam.get('e_field', section),
@@ -2001,32 +2017,51 @@ class NOTAMFilter:
                 self.logger.warning(f"패키지 섹션 {i+1}: 공항 코드를 찾을 수 없음 (섹션 시작: {section[:100]}...)")
 
         # 패키지 타입 감지 및 공항 순서 정렬
+        if sort_by_package:
+            self.sort_by_package_order(filtered_notams, text)
+        
+        self.logger.info(f"패키지 NOTAM 최종 {len(filtered_notams)}개의 NOTAM 추출 완료")
+        return filtered_notams
+
+    def sort_by_package_order(self, notams, text):
+        """
+        필터링된 NOTAM 목록을 패키지별 공항 순서(package_airport_order)로 정렬
+        extract_package_airports로 순서를 갱신한 뒤 텍스트를 다시 파싱하지 않고 재정렬할 때 사용
+        """
+        if self._detect_notam_type(text) != 'package':
+            return notams
+        
         package_type = self._detect_package_type(text)
         if package_type:
             self.logger.info(f"패키지 타입 감지: {package_type}")
-            # 공항 순서에 따라 정렬
-            filtered_notams.sort(key=lambda x: self._get_airport_priority(x.get('airport_code', ''), package_type))
+            # 공항별 우선순위를 한 번만 계산 (NOTAM마다 list.index 탐색하지 않도록)
+            priorities = {}
+            for index, code in enumerate(self.package_airport_order.get(package_type, [])):
+                priorities.setdefault(code, index)
+            
+            # 공항 순서에 따라 제자리 정렬 (안정 정렬이므로 같은 공항 내 원문 순서 유지)
+            notams.sort(key=lambda x: priorities.get(x['airport_code'], 999))
             self.logger.info(f"패키지별 공항 순서로 정렬 완료: {package_type}")
             
             # 정렬 후 순서 로깅
             self.logger.info("=== 패키지별 공항 순서로 정렬된 NOTAM ===")
-            for i, notam in enumerate(filtered_notams[:10], 1):  # 첫 10개만 로깅
-                airport = notam.get('airport_code', 'N/A')
+            for i, notam in enumerate(notams[:10], 1):  # 첫 10개만 로깅
+                airport = notam['airport_code']
                 notam_num = notam.get('notam_number', 'N/A')
-                priority = self._get_airport_priority(airport, package_type)
+                priority = priorities.get(airport, 999)
                 self.logger.info(f"정렬 후 {i}: {airport} {notam_num} (우선순위: {priority})")
         else:
             self.logger.warning("패키지 타입을 감지할 수 없음 - 원본 순서 유지")
         
-        self.logger.info(f"패키지 NOTAM 최종 {len(filtered_notams)}개의 NOTAM 추출 완료")
-        return filtered_notams
+        return notams
 
-    def extract_package_airports(self, text, all_airports):
-        """PDF 텍스트에서 Package별 공항 정보를 추출하고 순서를 동적으로 설정"""
+    def scan_package_airports(self, text):
+        """
+        PDF 텍스트의 Package 헤더(DEP/DEST/ALTN, ERA/REFILE/EDTO, FIR)에서 공항 코드 후보를 추출
+        NOTAM 필터링 결과와 무관하므로 필터링과 동시에 실행하거나 캐싱할 수 있음
+        """
         import re
         
-        package_airports = {}
-        
         # Package 1 정보 추출 - DEP, DEST, ALTN 라인에서 공항 코드 추출
         package1_airports = []
         
@@ -2046,20 +2081,6 @@ class NOTAMFilter:
             altn_airports = re.findall(r'[A-Z]{4}', altn_match.group(1))
             package1_airports.extend(altn_airports)
         
-        # 실제 존재하는 공항만 필터링 (추출한 순서 유지)
-        existing_package1 = [airport for airport in package1_airports if airport in all_airports]
-        
-        # Package 1 정의상 포함되어야 하는 공항들 중 누락된 것 추가 (순서 유지)
-        expected_package1 = ['RKSI', 'VVDN', 'VVCR']
-        for airport in expected_package1:
-            if airport in package1_airports and airport not in existing_package1:
-                existing_package1.append(airport)
-                
-        if existing_package1:
-            package_airports['package1'] = existing_package1
-            # 동적으로 추출된 순서로 package_airport_order 업데이트
-            self.package_airport_order['package1'] = existing_package1
-        
         # Package 2 정보 추출 - 다양한 ERA 패턴에서 공항 코드 추출
         package2_airports = []
         
@@ -2087,14 +2108,6 @@ class NOTAMFilter:
             edto_airports = re.findall(r'[A-Z]{4}', edto_match.group(1))
             package2_airports.extend(edto_airports)
         
-        # 중복 제거 및 실제 존재하는 공항만 필터링 (추출한 순서 유지)
-        package2_airports = list(set(package2_airports))
-        existing_package2 = [airport for airport in package2_airports if airport in all_airports]
-        if existing_package2:
-            package_airports['package2'] = existing_package2
-            # 동적으로 추출된 순서로 package_airport_order 업데이트
-            self.package_airport_order['package2'] = existing_package2
-        
         # Package 3 정보 추출 - FIR 라인에서 공항 코드 추출
         package3_airports = []
         
@@ -2104,8 +2117,47 @@ class NOTAMFilter:
             fir_airports = re.findall(r'[A-Z]{4}', fir_match.group(1))
             package3_airports.extend(fir_airports)
         
-        # 실제 존재하는 공항만 필터링 (추출한 순서 유지)
-        existing_package3 = [airport for airport in package3_airports if airport in all_airports]
+        return {
+            'package1': package1_airports,
+            'package2': package2_airports,
+            'package3': package3_airports
+        }
+
+    def extract_package_airports(self, text, all_airports, scanned_airports=None):
+        """
+        PDF 텍스트에서 Package별 공항 정보를 추출하고 순서를 동적으로 설정
+        scanned_airports: scan_package_airports 결과 (미리 계산된 경우 텍스트를 다시 스캔하지 않음)
+        """
+        if scanned_airports is None:
+            scanned_airports = self.scan_package_airports(text)
+        
+        package_airports = {}
+        
+        # Package 1: 실제 존재하는 공항만 필터링 (추출한 순서 유지)
+        package1_airports = scanned_airports['package1']
+        existing_package1 = [airport for airport in package1_airports if airport in all_airports]
+        
+        # Package 1 정의상 포함되어야 하는 공항들 중 누락된 것 추가 (순서 유지)
+        expected_package1 = ['RKSI', 'VVDN', 'VVCR']
+        for airport in expected_package1:
+            if airport in package1_airports and airport not in existing_package1:
+                existing_package1.append(airport)
+                
+        if existing_package1:
+            package_airports['package1'] = existing_package1
+            # 동적으로 추출된 순서로 package_airport_order 업데이트
+            self.package_airport_order['package1'] = existing_package1
+        
+        # Package 2: 중복 제거 및 실제 존재하는 공항만 필터링 (추출한 순서 유지)
+        package2_airports = list(set(scanned_airports['package2']))
+        existing_package2 = [airport for airport in package2_airports if airport in all_airports]
+        if existing_package2:
+            package_airports['package2'] = existing_package2
+            # 동적으로 추출된 순서로 package_airport_order 업데이트
+            self.package_airport_order['package2'] = existing_package2
+        
+        # Package 3: 실제 존재하는 공항만 필터링 (추출한 순서 유지)
+        existing_package3 = [airport for airport in scanned_airports['package3'] if airport in all_airports]
         if existing_package3:
             package_airports['package3'] = existing_package3
             # 동적으로 추출된 순서로 package_airport_order 업데이트
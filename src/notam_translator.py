@@ -2,6 +2,7 @@ import os
 import re
 import logging
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional
 import google.generativeai as genai
 from dotenv import load_dotenv
@@ -21,6 +22,10 @@ except ImportError:
 # 환경 변수 로드
 load_dotenv()
 
+# NOTAM 1건 처리 시 공항 코드/좌표를 뽑는 패턴 (번역 루프에서 NOTAM마다 사용)
+_AIRPORT_CODE_RE = re.compile(r'\b[A-Z]{4}\b')
+_COORDINATE_RE = re.compile(r'(\d{4})([NS])(\d{5})([EW])')
+
 class NOTAMTranslator:
     def __init__(self):
         """NOTAM 번역기 초기화"""
@@ -620,75 +625,89 @@ NOTAM 원문:
         processed_notams = []
         
         for i, notam_item in enumerate(notams):
-            try:
-                # 입력이 딕셔너리인지 문자열인지 확인
-                if isinstance(notam_item, dict):
-                    notam_text = notam_item.get('raw_text', '') or notam_item.get('text', '') or str(notam_item)
-                    notam_id = notam_item.get('id', f'NOTAM_{i+1}')
-                    # 필터에서 이미 추출된 시간 정보 사용
-                    effective_time = notam_item.get('effective_time', 'N/A')
-                    expiry_time = notam_item.get('expiry_time', 'N/A')
-                else:
-                    notam_text = str(notam_item)
-                    notam_id = f'NOTAM_{i+1}'
-                    effective_time = 'N/A'
-                    expiry_time = 'N/A'
-                
-                if not notam_text.strip():
-                    self.logger.warning(f"NOTAM {i+1}: 빈 텍스트, 건너뜀")
-                    continue
-                
-                # 한국어 번역
-                translation_result = self.translate_notam(notam_text, target_lang="ko", use_ai=True)
-                
-                # 요약 생성
-                summary_result = self.summarize_notam_with_gemini(
-                    notam_text,
-                    translation_result.get('english_translation', notam_text),
-                    translation_result.get('korean_translation', '번역 실패')
-                )
-                
-                processed_notam = {
-                    'id': notam_id,
-                    'original_text': notam_text,
-                    'description': notam_text,
-                    'translated_description': translation_result.get('korean_translation', '번역 실패'),
-                    'korean_translation': translation_result.get('korean_translation', '번역 실패'),
-                    'english_translation': translation_result.get('english_translation', notam_text),
-                    'korean_summary': summary_result.get('korean_summary', '요약 실패'),
-                    'english_summary': summary_result.get('english_summary', 'Summary failed'),
-                    'error_message': translation_result.get('error_message', None),
-                    'processed_at': datetime.now().isoformat(),
-                    'effective_time': effective_time,
-                    'expiry_time': expiry_time,
-                    'airport_codes': self._extract_airport_codes(notam_text),
-                    'coordinates': self._extract_coordinates(notam_text)
-                }
-                
+            processed_notam = self._translate_notam_item(i, notam_item, len(notams))
+            if processed_notam is not None:
                 processed_notams.append(processed_notam)
-                self.logger.info(f"NOTAM {i+1}/{len(notams)} 번역 및 요약 완료")
-                
-            except Exception as e:
-                self.logger.error(f"NOTAM {i+1} 처리 중 오류: {str(e)}")
-                processed_notams.append({
-                    'id': f'NOTAM_{i+1}',
-                    'original_text': notam_text if 'notam_text' in locals() else '',
-                    'korean_translation': '번역 실패',
-                    'english_translation': 'Translation failed',
-                    'korean_summary': '요약 실패',
-                    'english_summary': 'Summary failed',
-                    'error_message': str(e),
-                    'processed_at': datetime.now().isoformat(),
-                    'effective_time': 'N/A',
-                    'expiry_time': 'N/A'
-                })
         
         return processed_notams
 
+    def translate_multiple_notams_parallel(self, notams, max_workers: int = 8) -> List[Dict]:
+        """여러 NOTAM을 스레드로 동시에 번역 (Gemini 요청 대기 중에는 GIL이 풀림, 결과는 입력 순서 유지)"""
+        notams = list(notams)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                self._translate_notam_item, range(len(notams)), notams, [len(notams)] * len(notams)
+            )
+            return [processed_notam for processed_notam in results if processed_notam is not None]
+
+    def _translate_notam_item(self, i: int, notam_item, total: int) -> Optional[Dict]:
+        """NOTAM 1건 번역 및 요약 (빈 텍스트면 None)"""
+        try:
+            # 입력이 딕셔너리인지 문자열인지 확인
+            if isinstance(notam_item, dict):
+                notam_text = notam_item.get('raw_text', '') or notam_item.get('text', '') or str(notam_item)
+                notam_id = notam_item.get('id', f'NOTAM_{i+1}')
+                # 필터에서 이미 추출된 시간 정보 사용
+                effective_time = notam_item.get('effective_time', 'N/A')
+                expiry_time = notam_item.get('expiry_time', 'N/A')
+            else:
+                notam_text = str(notam_item)
+                notam_id = f'NOTAM_{i+1}'
+                effective_time = 'N/A'
+                expiry_time = 'N/A'
+            
+            if not notam_text.strip():
+                self.logger.warning(f"NOTAM {i+1}: 빈 텍스트, 건너뜀")
+                return None
+            
+            # 한국어 번역
+            translation_result = self.translate_notam(notam_text, target_lang="ko", use_ai=True)
+            
+            # 요약 생성
+            summary_result = self.summarize_notam_with_gemini(
+                notam_text,
+                translation_result.get('english_translation', notam_text),
+                translation_result.get('korean_translation', '번역 실패')
+            )
+            
+            processed_notam = {
+                'id': notam_id,
+                'original_text': notam_text,
+                'description': notam_text,
+                'translated_description': translation_result.get('korean_translation', '번역 실패'),
+                'korean_translation': translation_result.get('korean_translation', '번역 실패'),
+                'english_translation': translation_result.get('english_translation', notam_text),
+                'korean_summary': summary_result.get('korean_summary', '요약 실패'),
+                'english_summary': summary_result.get('english_summary', 'Summary failed'),
+                'error_message': translation_result.get('error_message', None),
+                'processed_at': datetime.now().isoformat(),
+                'effective_time': effective_time,
+                'expiry_time': expiry_time,
+                'airport_codes': self._extract_airport_codes(notam_text),
+                'coordinates': self._extract_coordinates(notam_text)
+            }
+            
+            self.logger.info(f"NOTAM {i+1}/{total} 번역 및 요약 완료")
+            return processed_notam
+            
+        except Exception as e:
+            self.logger.error(f"NOTAM {i+1} 처리 중 오류: {str(e)}")
+            return {
+                'id': f'NOTAM_{i+1}',
+                'original_text': notam_text if 'notam_text' in locals() else '',
+                'korean_translation': '번역 실패',
+                'english_translation': 'Translation failed',
+                'korean_summary': '요약 실패',
+                'english_summary': 'Summary failed',
+                'error_message': str(e),
+                'processed_at': datetime.now().isoformat(),
+                'effective_time': 'N/A',
+                'expiry_time': 'N/A'
+            }
+
     def _extract_airport_codes(self, notam_text: str) -> List[str]:
         """NOTAM 텍스트에서 공항 코드 추출"""
-        airport_pattern = r'\b[A-Z]{4}\b'
-        codes = re.findall(airport_pattern, notam_text)
+        codes = _AIRPORT_CODE_RE.findall(notam_text)
         # RK로 시작하는 한국 공항 코드나 CSV에서 찾을 수 있는 공항 코드만 반환
         return [code for code in codes if code.startswith('RK') or self._is_valid_airport_code(code)]
     
@@ -704,8 +723,7 @@ NOTAM 원문:
 
     def _extract_coordinates(self, notam_text: str) -> Optional[Dict]:
         """NOTAM 텍스트에서 좌표 정보 추출"""
-        coord_pattern = r'(\d{4})([NS])(\d{5})([EW])'
-        match = re.search(coord_pattern, notam_text)
+        match = _COORDINATE_RE.search(notam_text)
         if match:
             lat_deg = int(match.group(1)[:2])
             lat_min = int(match.group(1)[2:4])
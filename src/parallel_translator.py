@@ -8,46 +8,439 @@ import re
 import logging
 import google.generativeai as genai
 from dotenv import load_dotenv
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+import asyncio
+import concurrent.futures
 import time
 import hashlib
 import json
 import sys
+import threading
+import functools
+import inspect
+import sqlite3
+from collections import OrderedDict, deque
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from notam_filter import apply_color_styles
 from constants import NO_TRANSLATE_TERMS, DEFAULT_ABBR_DICT
 import csv
 
+# 요청 제한(429) 예외 분류용 (google-generativeai 설치 시 함께 설치됨)
+try:
+    from google.api_core import exceptions as google_exceptions
+    _RETRYABLE_ERRORS = (
+        google_exceptions.ResourceExhausted,
+        google_exceptions.TooManyRequests,
+        google_exceptions.ServiceUnavailable,
+        google_exceptions.DeadlineExceeded,
+    )
+    API_CORE_AVAILABLE = True
+except ImportError:
+    _RETRYABLE_ERRORS = ()
+    API_CORE_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 # 환경 변수 로드
 load_dotenv()
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 번역하지 않을 용어에 추가할 공항 코드 데이터
+AIRPORTS_CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'airports_timezones.csv')
+# 유효한 ICAO 공항 코드 (CSV ident 컬럼)
+_ICAO_IDENT_RE = re.compile(r'[A-Z0-9]{4}')
+
+# 정규식 패턴 (모듈 로드 시 한 번만 컴파일)
+# E 섹션 추출 패턴 (순서대로 시도)
+_E_SECTION_PATTERNS = [re.compile(pattern, re.DOTALL) for pattern in (
+    r'E\)\s*(.*?)(?=\s*[A-Z]\)|$)',
+    r'E\)\s*(.*?)(?=\s*[A-Z][A-Z]\)|$)',
+    r'E\)\s*(.*?)(?=\s*RMK|$)',
+    r'E\)\s*(.*?)(?=\s*COMMENT|$)',
+)]
+# 메타데이터 (CREATED:, RMK:, COMMENT) 또는 NO CURRENT NOTAMS FOUND 표시 중 가장 먼저 나오는 것부터 끝까지 제거
+_META_OR_NO_CURRENT_RE = re.compile(
+    r'(?:CREATED:|RMK:|COMMENT\)|(?i:\*{8}\s*NO CURRENT NOTAMS FOUND\s*\*{8})).*$', re.DOTALL
+)
+# 날짜 패턴 (예: 20FEB25 00:00 - UFN 또는 03SEP25 23:11 - 02OCT25 23:59)
+_PERIOD_RE = re.compile(r'\d{2}[A-Z]{3}\d{2}\s+\d{2}:\d{2}\s*-\s*(?:UFN|\d{2}[A-Z]{3}\d{2}\s+\d{2}:\d{2})')
+# 공항 코드와 NOTAM 번호 (예: RKSI COAD01/25)
+_AIRPORT_NOTAM_NUMBER_RE = re.compile(r'[A-Z]{4}\s+[A-Z0-9]+/\d{2}')
+_WS_RE = re.compile(r'\s+')
+# 본문 없이 NO CURRENT NOTAMS FOUND 표시만 있는 NOTAM (API 호출 생략 대상, 본문 뒤의 표시는 E 섹션 추출 시 제거)
+_NO_CURRENT_ONLY_RE = re.compile(r'[\s*]*NO CURRENT NOTAMS FOUND[\s*]*', re.IGNORECASE)
+_MIN_E_SECTION_LENGTH = 5
+# 번역 호출 실패 시 결과 문구 (이 문구가 들어간 결과는 캐시하지 않음)
+_TRANSLATION_ERROR_MESSAGE = "번역 중 오류가 발생했습니다."
+
+# NOTAM 번호 추출 패턴 (순서대로 시도)
+_NOTAM_NUMBER_PATTERNS = [re.compile(pattern) for pattern in (
+    r'([A-Z]{4}\s+COAD\d{2}/\d{2})',
+    r'(AIRAC\s+AIP\s+SUP\s+\d{2}/\d{2})',
+    r'([A-Z]{4}\s+AIRAC\s+AIP\s+SUP\s+\d{2}/\d{2})',
+    r'(AIP\s+SUP\s+\d{2}/\d{2})',
+    r'([A-Z]{4}\s+AIP\s+SUP\s+\d{2}/\d{2})',
+    r'([A-Z]{4}\s+[A-Z]\d{4}/\d{2})',
+    r'([A-Z]{4}\s+[A-Z]\d{3,4}/\d{2})',
+    r'([A-Z]{4}\s+\d{3,4}/\d{2})',
+    r'(COAD\d{2}/\d{2})',
+    r'([A-Z]\d{4}/\d{2})',
+    r'([A-Z]\d{3,4}/\d{2})',
+)]
+
+# NOTAM 번호 첫 글자(A-Z) -> NOTAM 타입 (ord(prefix) - 65로 인덱싱, 없는 글자는 GENERAL NOTAM)
+_NOTAM_TYPE_BY_PREFIX = {
+    'A': "AERODROME NOTAM",
+    'B': "BEACON NOTAM",
+    'C': "COMMUNICATION NOTAM",
+    'D': "DANGER AREA NOTAM",
+    'E': "ENROUTE NOTAM",
+    'F': "FLIGHT INFORMATION NOTAM",
+    'G': "GENERAL NOTAM",
+    'H': "HELIPORT NOTAM",
+    'I': "INSTRUMENT APPROACH NOTAM",
+    'L': "LIGHTING NOTAM",
+    'M': "MILITARY NOTAM",
+    'N': "NEW NOTAM",
+    'O': "OBSTACLE NOTAM",
+    'P': "PROHIBITED AREA NOTAM",
+    'R': "RESTRICTED AREA NOTAM",
+    'S': "SNOWTAM",
+    'T': "TERMINAL NOTAM",
+    'U': "UNMANNED AIRCRAFT NOTAM",
+    'V': "VOLCANIC ACTIVITY NOTAM",
+    'W': "WARNING NOTAM",
+    'X': "OTHER NOTAM",
+    'Z': "TRIGGER NOTAM"
+}
+_NOTAM_TYPES = tuple(_NOTAM_TYPE_BY_PREFIX.get(chr(65 + i), "GENERAL NOTAM") for i in range(26))
+
+# 공항 코드 추출 패턴
+_ICAO_WORD_RE = re.compile(r'\b([A-Z]{4})\b')
+_NOTAM_HEADER_AIRPORT_RE = re.compile(
+    r'\d{2}[A-Z]{3}\d{2}\s+\d{2}:\d{2}\s*-\s*\d{2}[A-Z]{3}\d{2}\s+\d{2}:\d{2}\s+([A-Z]{4})\s+[A-Z]\d{4}/\d{2}'
+)
+_AIRPORT_PATTERNS = [re.compile(pattern) for pattern in (
+    r'\b([A-Z]{4})\s+[A-Z]\d{4}/\d{2}',
+    r'\b([A-Z]{4})\s+AIP\s+SUP',
+    r'\b([A-Z]{4})\s+NOTAM',
+    r'^([A-Z]{4})\s+',
+)]
+
+# 공백이 있어 단어 경계 없이 먼저 치환하는 용어
+_SPECIAL_TERMS = [
+    "AIRAC AIP SUP", "AIP SUP", "AIP AMDT", "TRIGGER NOTAM",
+    "Eastern Standard Time"
+]
+
+# 번역하지 않을 용어 자리 표시 토큰: 유니코드 사용자 정의 영역(U+E000-U+F8FF)의 한 글자
+# 텍스트마다 등장 순서대로 0xE000부터 배정 (NO_TRANSLATE_TOKEN_숫자보다 짧고 LLM이 바꿀 여지가 적음)
+_TOKEN_BASE = 0xE000
+_TOKEN_COUNT = 0xF8FF - 0xE000 + 1
+
+# 번역 후처리 패턴
+_TOKEN_RE = re.compile('[\ue000-\uf8ff]')
+_BY_SELOE_RE = re.compile(r'--\s*BY\s+SELOE\s*--', re.IGNORECASE)
+_BY_SELOQ_RE = re.compile(r'--\s*BY\s+SELOQ\s*--', re.IGNORECASE)
+
+# 영어 번역 약어 확장 (긴 약어 우선, 대소문자 무시)
+_ABBR_LOOKUP = {abbr.upper(): expansion for abbr, expansion in DEFAULT_ABBR_DICT.items()}
+_ABBR_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(abbr) for abbr in sorted(DEFAULT_ABBR_DICT, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+
+# 요약 후처리 패턴
+# 시간 정보 패턴 (기간, 괄호로 감싼 기간, 날짜, 시각, UTC 시각) - 한 번에 제거
+_TIME_PATTERN_EN = (
+    r'\(\d{2}/\d{2}\s+\d{2}:\d{2}\s*-\s*\d{2}/\d{2}\s+\d{2}:\d{2}\)'
+    r'|\d{2}/\d{2}\s+\d{2}:\d{2}\s*-\s*\d{2}/\d{2}\s+\d{2}:\d{2}'
+    r'|\d{2}/\d{2}|\d{2}:\d{2}|\d{4}\s*UTC'
+)
+_TIME_RE_EN = re.compile(_TIME_PATTERN_EN)
+# 한국어 요약: 공항명 + 시간 정보 (한국어 날짜, 기간 표현 포함)
+_KO_AIRPORT_OR_TIME_RE = re.compile(
+    r'[가-힣]+(?:국제)?공항|' + _TIME_PATTERN_EN + r'|\d{4}년\s*\d{1,2}월\s*\d{1,2}일|~까지|부터|까지'
+)
+_STAND_PATTERNS = [re.compile(pattern) for pattern in (
+    r'STANDS?\s*(?:NR\.)?\s*(\d+)(?:\s*(?:가|changing to|to)\s*(\d+))?,?\s*(?:,\s*(\d+))?',
+    r'주기장\s*(\d+)(?:\s*(?:에서|가|changing to|to)\s*(\d+))?,?\s*(?:,\s*(\d+))?',
+    r',\s*(\d+)(?:\s*closed)?',
+)]
+_DIGITS_RE = re.compile(r'\d+')
+# 연속된 쉼표 또는 끝의 쉼표 (뒤에 공백만 남으면 제거, 아니면 쉼표 하나로)
+_EXTRA_COMMA_RE = re.compile(r'\s*,\s*$|,\s*,')
+
+# 번역에 사용할 Gemini 모델
+GEMINI_MODEL_NAME = 'gemini-2.5-flash-lite'
+
+# 번역 + 요약 통합 호출 응답 필드 / JSON 응답 모드
+_COMPLETE_RESPONSE_FIELDS = ('ko_translation', 'en_translation', 'ko_summary', 'en_summary')
+
+
+def _json_response_config() -> Optional[Dict[str, str]]:
+    """SDK의 GenerationConfig가 response_mime_type을 지원할 때만 JSON 응답 모드 설정 반환
+    (google-generativeai 0.3.x는 미지원 -> None, 이 경우 프롬프트의 JSON 형식 지시에 의존)"""
+    try:
+        fields = inspect.signature(genai.types.GenerationConfig).parameters
+    except (AttributeError, TypeError, ValueError):
+        return None
+    return {'response_mime_type': 'application/json'} if 'response_mime_type' in fields else None
+
+
+_JSON_RESPONSE_CONFIG = _json_response_config()
+
+# 프롬프트 종류별 지시문 (지원되는 SDK에서는 모델의 system_instruction으로 한 번만 설정)
+_KO_TRANSLATION_INSTRUCTION = """다음 NOTAM 텍스트를 한국어로 번역하세요. 설명, 주석, 추가 정보를 포함하지 마세요. 직접 번역만 반환하세요:
+
+중요한 번역 규칙:
+1. "-- BY SELOE--"는 반드시 "-- SELOE --"로 번역 (BY 제거)
+2. "-- BY SELOQ--"는 반드시 "-- SELOQ --"로 번역 (BY 제거)
+# 3. "BY"는 절대 번역하지 않음
+4. "REF"는 "참조"로 번역
+# 5. "PLZ"는 "제발" 또는 "부탁드립니다"로 번역
+6. 원문의 특수 기호 문자는 그대로 유지하세요
+7. "1. 2. 3. 4. 5." 같은 번호 목록이 있어도 전체 문장을 끝까지 번역하세요
+8. 번호 목록의 각 항목을 모두 번역하세요
+9. "AS FLW"는 "다음과 같습니다"로 번역하세요
+10. 번호 목록이 있어도 번역을 중단하지 마세요
+11. 반드시 전체 텍스트를 끝까지 번역하세요
+12. "FLOW CTL AS FLW"는 "흐름 통제는 다음과 같습니다"로 번역하세요
+13. 번호 목록의 각 항목을 개별적으로 번역하세요 (예: "1. RTE : A593 VIA SADLI" → "1. 노선: A593 VIA SADLI")
+14. "CEILING"은 반드시 "운고"로 번역하세요"""
+_EN_TRANSLATION_INSTRUCTION = """Translate ONLY the following NOTAM text to English. Do not add explanations, comments, or additional information. Return only the direct translation:"""
+_KO_SUMMARY_INSTRUCTION = """다음 NOTAM 번역을 한국어로 요약하되, 핵심 정보만 포함하도록 하세요:
+
+⚠️ 가장 중요한 규칙: ⚠️
+1. 절대로 다음 정보를 포함하지 마세요:
+   - 시간 정보 (날짜, 시간, 기간, UTC)
+   - 문서 참조 (AIRAC, AIP, AMDT, SUP)
+   - "새로운 정보", "정보 포함", "정보 변경" 등의 표현
+   - 공항명
+   - 좌표
+   - 불필요한 괄호나 특수문자
+   - 중복되는 단어나 구문
+
+2. 포함할 내용:
+   - 주요 변경사항 또는 영향
+   - 변경사항의 구체적 세부사항
+   - 변경 사유
+
+3. 간단명료하게 작성:
+   - 가능한 짧게 표현
+   - 직접적이고 능동적인 표현 사용
+   - 핵심 정보만 포함
+
+4. 활주로 방향 표시:
+   - 항상 "L/R" 형식을 사용하세요 (예: "활주로 15 L/R")
+   - "L/R"을 "좌/우"로 번역하지 마세요
+   - 활주로 번호와 L/R 사이에 공백을 유지하세요 (예: "활주로 15 L/R")
+
+핵심 정보를 간단히 요약해주세요."""
+_EN_SUMMARY_INSTRUCTION = """Summarize the following NOTAM translation in English, focusing on key information only:
+
+⚠️ MOST IMPORTANT RULES: ⚠️
+1. NEVER include ANY of the following:
+   - Time information (dates, times, periods, UTC)
+   - Document references (AIRAC, AIP, AMDT, SUP)
+   - Phrases like "New information is available", "Information regarding", "Information about"
+   - Airport names
+   - Coordinates
+   - Unnecessary parentheses or special characters
+   - Redundant words and phrases
+
+2. Focus on:
+   - Key changes or impacts
+   - Specific details about changes
+   - Reasons for changes
+
+3. Keep it concise and clear:
+   - Make it as short as possible
+   - Use direct and active voice
+   - Include only essential information
+
+4. For runway directions:
+   - Always use "L/R" format (e.g., "RWY 15 L/R")
+   - Do not translate "L/R" to "LEFT/RIGHT" or "좌/우"
+   - Keep the space between runway number and L/R (e.g., "RWY 15 L/R")
+
+Provide a brief summary that captures the essential information."""
+_COMPLETE_INSTRUCTION = """다음 NOTAM 텍스트를 한국어와 영어로 번역하고, 각 번역을 같은 언어로 요약하세요.
+
+번역 규칙:
+1. 설명, 주석, 추가 정보를 포함하지 말고 직접 번역만 작성하세요
+2. 원문의 특수 기호 문자는 그대로 유지하세요
+3. 번호 목록이 있어도 번역을 중단하지 말고 각 항목을 모두 끝까지 번역하세요
+4. 한국어 번역: "-- BY SELOE--"는 "-- SELOE --", "-- BY SELOQ--"는 "-- SELOQ --"로 번역 (BY 제거)
+5. 한국어 번역: "REF"는 "참조", "AS FLW"는 "다음과 같습니다", "FLOW CTL AS FLW"는 "흐름 통제는 다음과 같습니다", "CEILING"은 "운고"로 번역
+6. 한국어 번역: 번호 목록의 각 항목을 개별적으로 번역 (예: "1. RTE : A593 VIA SADLI" → "1. 노선: A593 VIA SADLI")
+
+요약 규칙:
+1. 시간 정보(날짜, 시간, 기간, UTC), 문서 참조(AIRAC, AIP, AMDT, SUP), 공항명, 좌표는 포함하지 마세요
+2. "새로운 정보", "Information regarding" 같은 표현, 불필요한 괄호나 특수문자, 중복 표현은 넣지 마세요
+3. 주요 변경사항 또는 영향, 구체적 세부사항, 변경 사유만 가능한 짧고 직접적으로 작성하세요
+4. 활주로 방향은 항상 "L/R" 형식 사용 (예: "RWY 15 L/R", "활주로 15 L/R"), "좌/우"나 "LEFT/RIGHT"로 바꾸지 마세요
+
+다음 JSON 형식으로만 응답하세요:
+{"ko_translation": "한국어 번역", "en_translation": "English translation", "ko_summary": "한국어 요약", "en_summary": "English summary"}"""
+_SYSTEM_INSTRUCTIONS = {
+    'translate_ko': _KO_TRANSLATION_INSTRUCTION,
+    'translate_en': _EN_TRANSLATION_INSTRUCTION,
+    'summary_ko': _KO_SUMMARY_INSTRUCTION,
+    'summary_en': _EN_SUMMARY_INSTRUCTION,
+    'complete': _COMPLETE_INSTRUCTION,
+}
+
+# 번역 결과 캐시: 메모리 LRU (캐시 키 -> 결과 dict) + cache_dir 안의 SQLite 파일 1개
+TRANSLATION_CACHE_SIZE = 4096
+TRANSLATION_CACHE_DB_NAME = 'translations.sqlite3'
+_translation_cache = OrderedDict()
+_translation_cache_lock = threading.Lock()
+
+
+def _dumps_cache_payload(translation_result: Dict) -> str:
+    """캐시 저장용 JSON 직렬화 (orjson이 있으면 orjson 사용)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(translation_result).decode('utf-8')
+    return json.dumps(translation_result, ensure_ascii=False, separators=(',', ':'))
+
+
+def _loads_cache_payload(payload) -> Dict:
+    """캐시 JSON 파싱 (orjson이 있으면 orjson 사용)"""
+    return orjson.loads(payload) if ORJSON_AVAILABLE else json.loads(payload)
+
+
+# Gemini 분당 최대 요청 수 (0이면 제한 없음)
+GEMINI_RPM = int(os.getenv('GEMINI_RPM', '0'))
+
+class _SlidingWindowRateLimiter:
+    """최근 window초 동안의 요청 시각을 deque로 관리하는 요청 수 제한기 (asyncio용)"""
+    
+    def __init__(self, max_requests: int, window: float = 60.0):
+        self.max_requests = max_requests
+        self.window = window
+        self._timestamps = deque()
+    
+    async def acquire(self):
+        """요청 한 건을 보낼 수 있을 때까지 대기"""
+        if self.max_requests <= 0:
+            return
+        while True:
+            now = time.monotonic()
+            while self._timestamps and now - self._timestamps[0] >= self.window:
+                self._timestamps.popleft()
+            if len(self._timestamps) < self.max_requests:
+                self._timestamps.append(now)
+                return
+            await asyncio.sleep(self.window - (now - self._timestamps[0]))
+
+# Gemini 요청 제한/일시 오류 재시도 (최대 시도 횟수, 지수 백오프 대기 범위 초)
+GEMINI_MAX_ATTEMPTS = 3
+GEMINI_RETRY_MIN_WAIT = 1.0
+GEMINI_RETRY_MAX_WAIT = 30.0
+# 동시 요청 수 AIMD 조절: 성공 윈도우마다 +AIMD_INCREASE, 요청 제한 시 ×AIMD_DECREASE
+GEMINI_MAX_CONCURRENCY = int(os.getenv('GEMINI_MAX_CONCURRENCY', '8'))
+AIMD_INCREASE = 0.5
+AIMD_DECREASE = 0.5
+# 동시에 실패한 요청들로 여러 번 연속 감소하지 않도록 감소 사이 최소 간격 (초)
+AIMD_DECREASE_INTERVAL = 1.0
+
+def _is_retryable_error(error: Exception) -> bool:
+    """요청 제한(429, 할당량 초과) 또는 일시적인 서버 오류인지 확인"""
+    if isinstance(error, _RETRYABLE_ERRORS):
+        return True
+    message = str(error).lower()
+    return '429' in message or 'quota' in message or 'resource exhausted' in message or 'rate limit' in message
+
+def _retry_delay(attempt: int) -> float:
+    """attempt번째 실패 후 대기 시간 (지수 백오프)"""
+    return min(GEMINI_RETRY_MAX_WAIT, GEMINI_RETRY_MIN_WAIT * (2 ** attempt))
+
+class _AIMDConcurrencyLimiter:
+    """
+    동시 요청 수를 AIMD로 조절하는 제한기 (asyncio용, async with로 사용)
+    현재 용량만큼 성공하면 용량을 조금 늘리고, 요청 제한 오류 시 절반으로 줄임
+    """
+    
+    def __init__(self, initial: float, maximum: int):
+        self.maximum = max(1, maximum)
+        self.capacity = min(float(self.maximum), max(1.0, float(initial)))
+        self._in_flight = 0
+        self._successes = 0
+        self._last_decrease = float('-inf')
+        self._condition = asyncio.Condition()
+    
+    async def __aenter__(self):
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.capacity))
+            self._in_flight += 1
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        async with self._condition:
+            self._in_flight -= 1
+            self._condition.notify_all()
+    
+    def on_success(self):
+        """요청 성공 기록 (현재 용량만큼 성공할 때마다 가산 증가)"""
+        self._successes += 1
+        if self._successes >= self.capacity:
+            self._successes = 0
+            self.capacity = min(float(self.maximum), self.capacity + AIMD_INCREASE)
+    
+    def on_rate_limited(self):
+        """요청 제한 기록 (승산 감소)"""
+        self._successes = 0
+        now = time.monotonic()
+        if now - self._last_decrease < AIMD_DECREASE_INTERVAL:
+            return
+        self._last_decrease = now
+        self.capacity = max(1.0, self.capacity * AIMD_DECREASE)
+
 class ParallelHybridNOTAMTranslator:
     """병렬 처리 개선된 하이브리드 NOTAM 번역기"""
     
+    # (CSV 경로, 수정 시각) -> (용어 목록, 용어->토큰 매핑, 용어 정규식), 프로세스 내 인스턴스 간 공유
+    _TERMS_CACHE = {}
+    _TERMS_CACHE_LOCK = threading.Lock()
+    
     def __init__(self):
         """초기화"""
         self.gemini_enabled = False
         self.cache_dir = "cache"
-        self.max_workers = 5  # 동시 처리할 최대 스레드 수
+        self.cache_db_path = os.path.join(self.cache_dir, TRANSLATION_CACHE_DB_NAME)
+        self._cache_db_ready = False
+        self.max_workers = 5  # 동시에 보낼 Gemini 요청 수 초기값 (이후 AIMD로 조절)
+        # AIMD로 조절된 동시 요청 수 (다음 배치에서 이어서 사용)
+        self._concurrency = float(self.max_workers)
+        # 배치가 바뀌어도 분당 요청 수가 이어서 계산되도록 인스턴스에 보관
+        self._rate_limiter = _SlidingWindowRateLimiter(GEMINI_RPM)
+        # 캐시 SQLite I/O용 스레드 풀 (처음 사용할 때 생성, 배치가 바뀌어도 재사용하고 close()에서 종료)
+        self._executor = None
+        self._executor_lock = threading.Lock()
         
         # 캐시 디렉토리 생성
         os.makedirs(self.cache_dir, exist_ok=True)
         
         # 공항 코드 로드 및 NO_TRANSLATE_TERMS 확장
-        self.no_translate_terms = self._load_airport_codes()
+        self.no_translate_terms, self._term_re = self._load_airport_codes_cached(AIRPORTS_CSV_PATH)
+        
+        # 프롬프트 종류 -> 지시문을 system_instruction으로 설정한 모델 (비어 있으면 지시문을 프롬프트에 포함)
+        self._models = {}
         
         try:
             api_key = os.getenv('GOOGLE_API_KEY')
             if api_key:
                 genai.configure(api_key=api_key)
-                self.model = genai.GenerativeModel(
-                    'gemini-2.5-flash-lite',
-                    generation_config=genai.types.GenerationConfig(temperature=0.3)
-                )
+                generation_config = genai.types.GenerationConfig(temperature=0.3)
+                self.model = genai.GenerativeModel(GEMINI_MODEL_NAME, generation_config=generation_config)
+                self._models = self._create_instruction_models(generation_config)
                 self.gemini_enabled = True
                 logger.info("병렬 처리 하이브리드 NOTAM Translator 초기화 완료 (온도: 0.3)")
             else:
@@ -56,23 +449,64 @@ class ParallelHybridNOTAMTranslator:
             logger.error(f"병렬 처리 하이브리드 NOTAM Translator 초기화 실패: {str(e)}")
             self.gemini_enabled = False
     
-    def _load_airport_codes(self):
+    @staticmethod
+    def _create_instruction_models(generation_config) -> Dict[str, Any]:
+        """
+        프롬프트 종류별 지시문을 system_instruction으로 설정한 모델 생성
+        지시문을 요청마다 보내지 않아도 됨 (system_instruction을 지원하지 않는 SDK면 빈 dict)
+        """
+        try:
+            return {
+                kind: genai.GenerativeModel(
+                    GEMINI_MODEL_NAME, generation_config=generation_config, system_instruction=instruction
+                )
+                for kind, instruction in _SYSTEM_INSTRUCTIONS.items()
+            }
+        except TypeError:
+            logger.info("system_instruction 미지원 SDK - 지시문을 프롬프트에 포함")
+            return {}
+    
+    @classmethod
+    def _load_airport_codes_cached(cls, csv_path: str):
+        """
+        공항 코드 용어 목록과 용어 정규식을 CSV 수정 시각 기준으로 캐싱
+        CSV를 다시 읽고 큰 정규식을 컴파일하는 작업은 파일이 바뀔 때만 수행
+        """
+        try:
+            mtime = os.path.getmtime(csv_path)
+        except OSError:
+            mtime = None
+        key = (csv_path, mtime)
+        
+        with cls._TERMS_CACHE_LOCK:
+            cached = cls._TERMS_CACHE.get(key)
+            if cached is None:
+                no_translate_terms = cls._load_airport_codes(csv_path)
+                cached = (no_translate_terms, cls._build_term_pattern(no_translate_terms))
+                # 같은 경로의 이전 버전은 제거
+                for stale_key in [k for k in cls._TERMS_CACHE if k[0] == csv_path]:
+                    del cls._TERMS_CACHE[stale_key]
+                cls._TERMS_CACHE[key] = cached
+        return cached
+    
+    @staticmethod
+    def _load_airport_codes(csv_path: str):
         """공항 코드를 로드하여 NO_TRANSLATE_TERMS에 추가"""
         # 기본 NO_TRANSLATE_TERMS 복사
         no_translate_terms = list(NO_TRANSLATE_TERMS)
         
         try:
             # src 폴더의 공항 데이터 사용
-            csv_path = os.path.join(os.path.dirname(__file__), 'airports_timezones.csv')
-            
             if os.path.exists(csv_path):
-                with open(csv_path, 'r', encoding='utf-8-sig') as f:
-                    reader = csv.DictReader(f)
-                    airport_codes = []
-                    for row in reader:
-                        icao_code = row.get('ident')  # CSV 파일의 실제 컬럼명
-                        if icao_code and len(icao_code) == 4:  # 유효한 ICAO 코드만
-                            airport_codes.append(icao_code)
+                with open(csv_path, 'r', encoding='utf-8-sig', newline='') as f:
+                    # 행마다 dict를 만들지 않도록 헤더에서 ident 컬럼 위치만 찾아 사용
+                    reader = csv.reader(f)
+                    idx = next(reader, []).index('ident')  # CSV 파일의 실제 컬럼명
+                    is_icao = _ICAO_IDENT_RE.fullmatch
+                    airport_codes = [
+                        row[idx] for row in reader
+                        if len(row) > idx and is_icao(row[idx])  # 유효한 ICAO 코드만
+                    ]
                     
                     # 공항 코드를 NO_TRANSLATE_TERMS에 추가
                     no_translate_terms.extend(airport_codes)
@@ -85,21 +519,65 @@ class ParallelHybridNOTAMTranslator:
         
         return no_translate_terms
     
+    @staticmethod
+    def _build_term_pattern(no_translate_terms):
+        """번역하지 않을 용어 전체를 한 번에 찾는 정규식 생성 (긴 용어를 먼저 매칭, 용어가 없으면 None)"""
+        terms = set(no_translate_terms).difference(_SPECIAL_TERMS)
+        if not terms:
+            return None
+        alternation = '|'.join(re.escape(term) for term in sorted(terms, key=len, reverse=True))
+        return re.compile(r'\b(?:' + alternation + r')\b')
+    
     def get_cache_key(self, text: str) -> str:
-        """텍스트의 캐시 키 생성"""
-        return hashlib.md5(text.encode('utf-8')).hexdigest()
+        """텍스트의 캐시 키 생성 (보안 용도가 아니므로 md5보다 빠른 blake2b 사용)"""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _cache_db_connect(self) -> sqlite3.Connection:
+        """번역 캐시 DB 연결 (첫 연결 시 테이블 생성, _translation_cache_lock 안에서 호출)"""
+        conn = sqlite3.connect(self.cache_db_path, timeout=5)
+        if not self._cache_db_ready:
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS translation_cache (key TEXT PRIMARY KEY, payload TEXT NOT NULL)'
+            )
+            conn.commit()
+            self._cache_db_ready = True
+        return conn
+    
+    @staticmethod
+    def _cache_store(cache_key: str, translation_result: Dict):
+        """메모리 LRU에 저장하고 최대 크기를 넘으면 가장 오래된 항목 삭제 (_translation_cache_lock 안에서 호출)"""
+        _translation_cache[cache_key] = translation_result
+        _translation_cache.move_to_end(cache_key)
+        while len(_translation_cache) > TRANSLATION_CACHE_SIZE:
+            _translation_cache.popitem(last=False)
     
     def get_cached_translation(self, text: str) -> Optional[Dict]:
-        """캐시된 번역 결과 조회"""
+        """캐시된 번역 결과 조회 (메모리 LRU -> SQLite 순)"""
+        return self.get_cached_translation_by_key(self.get_cache_key(text))
+    
+    def get_cached_translation_by_key(self, cache_key: str) -> Optional[Dict]:
+        """이미 계산한 캐시 키로 번역 결과 조회"""
         try:
-            cache_key = self.get_cache_key(text)
-            cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-            
-            if os.path.exists(cache_file):
-                with open(cache_file, 'r', encoding='utf-8') as f:
-                    cached_data = json.load(f)
-                    logger.debug(f"캐시에서 번역 결과 조회: {cache_key[:8]}...")
-                    return cached_data
+            with _translation_cache_lock:
+                cached_data = _translation_cache.get(cache_key)
+                if cached_data is not None:
+                    _translation_cache.move_to_end(cache_key)
+                    return dict(cached_data)
+                
+                conn = self._cache_db_connect()
+                try:
+                    row = conn.execute(
+                        'SELECT payload FROM translation_cache WHERE key = ?', (cache_key,)
+                    ).fetchone()
+                finally:
+                    conn.close()
+                if row is None:
+                    return None
+                
+                cached_data = _loads_cache_payload(row[0])
+                self._cache_store(cache_key, cached_data)
+                logger.debug(f"캐시에서 번역 결과 조회: {cache_key[:8]}...")
+                return dict(cached_data)
         except Exception as e:
             logger.warning(f"캐시 조회 중 오류: {e}")
         
@@ -107,77 +585,55 @@ class ParallelHybridNOTAMTranslator:
     
     def cache_translation(self, text: str, translation_result: Dict):
         """번역 결과 캐싱"""
+        self.cache_translation_by_key(self.get_cache_key(text), translation_result)
+    
+    def cache_translation_by_key(self, cache_key: str, translation_result: Dict):
+        """이미 계산한 캐시 키로 번역 결과 캐싱"""
         try:
-            cache_key = self.get_cache_key(text)
-            cache_file = os.path.join(self.cache_dir, f"{cache_key}.json")
-            
-            with open(cache_file, 'w', encoding='utf-8') as f:
-                json.dump(translation_result, f, ensure_ascii=False, indent=2)
+            payload = _dumps_cache_payload(translation_result)
+            with _translation_cache_lock:
+                self._cache_store(cache_key, dict(translation_result))
+                conn = self._cache_db_connect()
+                try:
+                    conn.execute(
+                        'INSERT OR REPLACE INTO translation_cache (key, payload) VALUES (?, ?)',
+                        (cache_key, payload)
+                    )
+                    conn.commit()
+                finally:
+                    conn.close()
                 logger.debug(f"번역 결과 캐싱: {cache_key[:8]}...")
         except Exception as e:
             logger.warning(f"캐싱 중 오류: {e}")
     
     def extract_e_section(self, notam_text: str) -> str:
         """NOTAM 텍스트에서 E 섹션만 추출합니다."""
-        e_section_patterns = [
-            r'E\)\s*(.*?)(?=\s*[A-Z]\)|$)',
-            r'E\)\s*(.*?)(?=\s*[A-Z][A-Z]\)|$)',
-            r'E\)\s*(.*?)(?=\s*RMK|$)',
-            r'E\)\s*(.*?)(?=\s*COMMENT|$)',
-        ]
-        
-        for pattern in e_section_patterns:
-            match = re.search(pattern, notam_text, re.DOTALL)
+        for pattern in _E_SECTION_PATTERNS:
+            match = pattern.search(notam_text)
             if match:
-                e_section = match.group(1).strip()
-                e_section = re.sub(r'CREATED:.*$', '', e_section, flags=re.DOTALL).strip()
-                e_section = re.sub(r'RMK:.*$', '', e_section, flags=re.DOTALL).strip()
-                e_section = re.sub(r'COMMENT\).*$', '', e_section, flags=re.DOTALL).strip()
+                e_section = _META_OR_NO_CURRENT_RE.sub('', match.group(1).strip()).strip()
                 
                 if e_section:
                     return e_section
         
         # E 섹션이 없는 경우, 핵심 내용만 추출
         # 날짜, 시간, 공항 코드, NOTAM 번호 제거
-        cleaned_text = notam_text.strip()
-        
-        # 날짜 패턴 제거 (예: 20FEB25 00:00 - UFN 또는 03SEP25 23:11 - 02OCT25 23:59)
-        cleaned_text = re.sub(r'\d{2}[A-Z]{3}\d{2}\s+\d{2}:\d{2}\s*-\s*(?:UFN|\d{2}[A-Z]{3}\d{2}\s+\d{2}:\d{2})', '', cleaned_text)
+        # (날짜를 먼저 지워야 그 앞뒤로 이어지는 공항 코드 + NOTAM 번호도 제거되므로 순서대로 적용)
+        cleaned_text = _PERIOD_RE.sub('', notam_text.strip())
+        cleaned_text = _AIRPORT_NOTAM_NUMBER_RE.sub('', cleaned_text)
         
-        # 공항 코드와 NOTAM 번호 제거 (예: RKSI COAD01/25)
-        cleaned_text = re.sub(r'[A-Z]{4}\s+[A-Z0-9]+/\d{2}', '', cleaned_text)
-        
-        # 메타데이터 제거
-        cleaned_text = re.sub(r'CREATED:.*$', '', cleaned_text, flags=re.DOTALL).strip()
-        cleaned_text = re.sub(r'RMK:.*$', '', cleaned_text, flags=re.DOTALL).strip()
-        cleaned_text = re.sub(r'COMMENT\).*$', '', cleaned_text, flags=re.DOTALL).strip()
-        
-        # NO CURRENT NOTAMS FOUND 이후의 내용 제거
-        cleaned_text = re.sub(r'\*{8}\s*NO CURRENT NOTAMS FOUND\s*\*{8}.*$', '', cleaned_text, flags=re.DOTALL | re.IGNORECASE).strip()
+        # 메타데이터와 NO CURRENT NOTAMS FOUND 이후의 내용 제거
+        cleaned_text = _META_OR_NO_CURRENT_RE.sub('', cleaned_text)
         
         # 연속된 공백 정리
-        cleaned_text = re.sub(r'\s+', ' ', cleaned_text).strip()
+        cleaned_text = _WS_RE.sub(' ', cleaned_text).strip()
         
         return cleaned_text
     
     def extract_notam_number(self, text: str) -> str:
         """NOTAM 텍스트에서 NOTAM 번호를 추출합니다."""
-        patterns = [
-            r'([A-Z]{4}\s+COAD\d{2}/\d{2})',
-            r'(AIRAC\s+AIP\s+SUP\s+\d{2}/\d{2})',
-            r'([A-Z]{4}\s+AIRAC\s+AIP\s+SUP\s+\d{2}/\d{2})',
-            r'(AIP\s+SUP\s+\d{2}/\d{2})',
-            r'([A-Z]{4}\s+AIP\s+SUP\s+\d{2}/\d{2})',
-            r'([A-Z]{4}\s+[A-Z]\d{4}/\d{2})',
-            r'([A-Z]{4}\s+[A-Z]\d{3,4}/\d{2})',
-            r'([A-Z]{4}\s+\d{3,4}/\d{2})',
-            r'(COAD\d{2}/\d{2})',
-            r'([A-Z]\d{4}/\d{2})',
-            r'([A-Z]\d{3,4}/\d{2})',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _NOTAM_NUMBER_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1).strip()
         
@@ -186,257 +642,394 @@ class ParallelHybridNOTAMTranslator:
     
     def identify_notam_type(self, notam_number: str) -> str:
         """NOTAM 번호를 기반으로 NOTAM 타입을 식별합니다."""
-        prefix = notam_number[0].upper()
-        
-        notam_types = {
-            'A': "AERODROME NOTAM",
-            'B': "BEACON NOTAM",
-            'C': "COMMUNICATION NOTAM",
-            'D': "DANGER AREA NOTAM",
-            'E': "ENROUTE NOTAM",
-            'F': "FLIGHT INFORMATION NOTAM",
-            'G': "GENERAL NOTAM",
-            'H': "HELIPORT NOTAM",
-            'I': "INSTRUMENT APPROACH NOTAM",
-            'L': "LIGHTING NOTAM",
-            'M': "MILITARY NOTAM",
-            'N': "NEW NOTAM",
-            'O': "OBSTACLE NOTAM",
-            'P': "PROHIBITED AREA NOTAM",
-            'R': "RESTRICTED AREA NOTAM",
-            'S': "SNOWTAM",
-            'T': "TERMINAL NOTAM",
-            'U': "UNMANNED AIRCRAFT NOTAM",
-            'V': "VOLCANIC ACTIVITY NOTAM",
-            'W': "WARNING NOTAM",
-            'X': "OTHER NOTAM",
-            'Z': "TRIGGER NOTAM"
-        }
-        
-        return notam_types.get(prefix, "GENERAL NOTAM")
+        prefix = notam_number[:1].upper()
+        if len(prefix) == 1 and 'A' <= prefix <= 'Z':
+            return _NOTAM_TYPES[ord(prefix) - 65]
+        return "GENERAL NOTAM"
     
     def extract_airport_code(self, text: str) -> str:
         """NOTAM 텍스트에서 공항 코드를 추출합니다."""
-        airport_pattern = r'\b([A-Z]{4})\b'
-        matches = re.findall(airport_pattern, text)
+        matches = _ICAO_WORD_RE.findall(text)
         
-        notam_header_pattern = r'\d{2}[A-Z]{3}\d{2}\s+\d{2}:\d{2}\s*-\s*\d{2}[A-Z]{3}\d{2}\s+\d{2}:\d{2}\s+([A-Z]{4})\s+[A-Z]\d{4}/\d{2}'
-        header_match = re.search(notam_header_pattern, text)
+        header_match = _NOTAM_HEADER_AIRPORT_RE.search(text)
         if header_match:
             return header_match.group(1)
         
-        patterns = [
-            r'\b([A-Z]{4})\s+[A-Z]\d{4}/\d{2}',
-            r'\b([A-Z]{4})\s+AIP\s+SUP',
-            r'\b([A-Z]{4})\s+NOTAM',
-            r'^([A-Z]{4})\s+',
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, text)
+        for pattern in _AIRPORT_PATTERNS:
+            match = pattern.search(text)
             if match:
                 return match.group(1)
         
         return matches[0] if matches else 'UNKNOWN'
     
-    def _preprocess_for_translation(self, text: str) -> str:
-        """번역 전 텍스트 전처리 - 번역하지 않을 용어들을 토큰으로 변환"""
-        processed_text = text
+    def _preprocess_for_translation(self, text: str) -> Tuple[str, List[str]]:
+        """
+        번역 전 텍스트 전처리 - 번역하지 않을 용어들을 토큰으로 변환
+        반환: (토큰 처리된 텍스트, 토큰 순서대로의 원래 용어 목록 - _postprocess_translation에 전달)
+        """
+        terms = []
+        term_to_token = {}
+        
+        def token_for(term: str) -> str:
+            token = term_to_token.get(term)
+            if token is None:
+                if len(terms) >= _TOKEN_COUNT:
+                    return term
+                token = term_to_token[term] = chr(_TOKEN_BASE + len(terms))
+                terms.append(term)
+            return token
+        
+        # 원문에 이미 있는 사용자 정의 영역 글자(PDF 기호 글꼴 등)도 용어로 등록해 토큰과 섞이지 않고 그대로 복원되도록 함
+        processed_text = _TOKEN_RE.sub(lambda match: token_for(match.group(0)), text)
         
         # 특별한 용어들 먼저 처리 (공백이 있는 용어들)
-        special_terms = [
-            "AIRAC AIP SUP", "AIP SUP", "AIP AMDT", "TRIGGER NOTAM",
-            "Eastern Standard Time"
-        ]
-        
-        for i, term in enumerate(special_terms):
-            token = f"NO_TRANSLATE_TOKEN_{i}"
-            processed_text = processed_text.replace(term, token)
-        
-        # 단일 단어 용어들 처리 (동적으로 로드된 공항 코드 포함)
-        for i, term in enumerate(self.no_translate_terms):
-            if term not in special_terms:  # 이미 처리한 항목 제외
-                token = f"NO_TRANSLATE_TOKEN_{len(special_terms) + i}"
-                # 단어 경계를 고려한 정확한 매칭
-                processed_text = re.sub(r'\b' + re.escape(term) + r'\b', token, processed_text)
-        
-        return processed_text
-    
-    def _postprocess_translation(self, text: str) -> str:
-        """번역 후 텍스트 후처리 - 토큰을 원래 용어로 복원"""
-        processed_text = text
-        
-        # 특별한 용어들 먼저 복원
-        special_terms = [
-            "AIRAC AIP SUP", "AIP SUP", "AIP AMDT", "TRIGGER NOTAM",
-            "Eastern Standard Time"
-        ]
-        
-        # 토큰 번호를 정확히 파싱하여 복원
-        import re
-        
-        # NO_TRANSLATE_TOKEN_숫자 패턴 찾기
-        def replace_token(match):
-            token = match.group(0)
-            token_num = int(token.split('_')[-1])
-            
-            # special_terms 범위인지 확인
-            if token_num < len(special_terms):
-                return special_terms[token_num]
-            else:
-                # no_translate_terms 범위
-                idx = token_num - len(special_terms)
-                if idx < len(self.no_translate_terms):
-                    return self.no_translate_terms[idx]
-                else:
-                    return token  # 매칭되지 않으면 원래 토큰 유지
+        for term in _SPECIAL_TERMS:
+            if term in processed_text:
+                processed_text = processed_text.replace(term, token_for(term))
         
-        # 토큰 패턴 매칭 및 교체
-        processed_text = re.sub(r'NO_TRANSLATE_TOKEN_\d+', replace_token, processed_text)
+        # 단일 단어 용어들 처리 (동적으로 로드된 공항 코드 포함) - 단어 경계 기준 한 번에 치환
+        if self._term_re is not None:
+            processed_text = self._term_re.sub(lambda match: token_for(match.group(0)), processed_text)
         
-        return processed_text
+        return processed_text, terms
+    
+    def _postprocess_translation(self, text: str, terms: Sequence[str]) -> str:
+        """번역 후 텍스트 후처리 - 토큰을 원래 용어로 복원 (terms: _preprocess_for_translation이 반환한 용어 목록)"""
+        if not terms:
+            return text
+        
+        def replace_token(match):
+            idx = ord(match.group(0)) - _TOKEN_BASE
+            # 매칭되지 않으면 원래 토큰 유지
+            return terms[idx] if idx < len(terms) else match.group(0)
+        
+        return _TOKEN_RE.sub(replace_token, text)
     
     def _expand_abbreviations(self, text: str) -> str:
         """영어 번역에서 약어를 확장합니다."""
-        expanded_text = text
+        # 약어 확장 적용 (긴 것부터 먼저 매칭, 단어 경계 기준 한 번에 치환)
+        return _ABBR_RE.sub(lambda match: _ABBR_LOOKUP[match.group(0).upper()], text)
+    
+    def _build_prompt(self, kind: str, body: str) -> str:
+        """지시문이 system_instruction으로 설정되지 않은 경우에만 프롬프트 앞에 지시문 포함"""
+        if kind in self._models:
+            return body
+        return f"{_SYSTEM_INSTRUCTIONS[kind]}\n\n{body}"
+    
+    def _build_translation_prompt(self, processed_text: str, target_lang: str) -> str:
+        """토큰 처리된 E 섹션으로 번역 프롬프트 생성"""
+        if target_lang == "en":
+            return self._build_prompt('translate_en', processed_text)
+        else:  # Korean
+            return self._build_prompt('translate_ko', f"원문: {processed_text}\n\n번역문:")
+    
+    def _finalize_translation(self, translated_text: str, target_lang: str, terms: Sequence[str]) -> str:
+        """번역 응답 후처리 - 토큰 복원, SELOE/SELOQ 정리, 약어 확장"""
+        # 번역 후 원래 용어들로 복원
+        translated_text = self._postprocess_translation(translated_text, terms)
         
-        # 약어 확장 적용 (긴 것부터 먼저 처리)
-        sorted_abbreviations = sorted(DEFAULT_ABBR_DICT.items(), key=lambda x: len(x[0]), reverse=True)
+        # 한국어 번역 시 특별 처리
+        if target_lang == "ko":
+            # "-- BY SELOE--"를 "-- SELOE --"로 변환
+            translated_text = _BY_SELOE_RE.sub('-- SELOE --', translated_text)
+            # "-- BY SELOQ--"를 "-- SELOQ --"로 변환
+            translated_text = _BY_SELOQ_RE.sub('-- SELOQ --', translated_text)
         
-        for abbr, expansion in sorted_abbreviations:
-            # 단어 경계를 고려한 정확한 매칭
-            pattern = r'\b' + re.escape(abbr) + r'\b'
-            expanded_text = re.sub(pattern, expansion, expanded_text, flags=re.IGNORECASE)
+        # 영어 번역 시 약어 확장 적용
+        if target_lang == "en":
+            translated_text = self._expand_abbreviations(translated_text)
         
-        return expanded_text
+        return translated_text
+    
+    def _generate_content(self, kind: str, prompt: str, generation_config: Optional[Dict] = None) -> str:
+        """kind 지시문이 설정된 모델로 Gemini 호출 (요청 제한/일시 오류 시 지수 백오프로 재시도)"""
+        model = self._models.get(kind, self.model)
+        for attempt in range(GEMINI_MAX_ATTEMPTS):
+            try:
+                return model.generate_content(prompt, generation_config=generation_config).text.strip()
+            except Exception as e:
+                if not _is_retryable_error(e) or attempt + 1 >= GEMINI_MAX_ATTEMPTS:
+                    raise
+                delay = _retry_delay(attempt)
+                logger.warning(f"Gemini 요청 제한/일시 오류, {delay:.0f}초 후 재시도 ({attempt + 1}/{GEMINI_MAX_ATTEMPTS - 1}): {str(e)}")
+                time.sleep(delay)
+    
+    async def _generate_content_async(self, kind: str, prompt: str, concurrency: _AIMDConcurrencyLimiter,
+                                      generation_config: Optional[Dict] = None) -> str:
+        """동시 요청 수와 분당 요청 수 제한 안에서 Gemini 비동기 호출 (요청 제한 시 동시 요청 수를 줄이고 재시도)"""
+        model = self._models.get(kind, self.model)
+        for attempt in range(GEMINI_MAX_ATTEMPTS):
+            try:
+                async with concurrency:
+                    await self._rate_limiter.acquire()
+                    response = await model.generate_content_async(prompt, generation_config=generation_config)
+                    concurrency.on_success()
+                return response.text.strip()
+            except Exception as e:
+                if not _is_retryable_error(e):
+                    raise
+                concurrency.on_rate_limited()
+                if attempt + 1 >= GEMINI_MAX_ATTEMPTS:
+                    raise
+                delay = _retry_delay(attempt)
+                logger.warning(f"Gemini 요청 제한/일시 오류, {delay:.0f}초 후 재시도 ({attempt + 1}/{GEMINI_MAX_ATTEMPTS - 1}, "
+                               f"동시 요청 수 {int(concurrency.capacity)}): {str(e)}")
+                await asyncio.sleep(delay)
+    
+    def _build_complete_prompt(self, processed_text: str) -> str:
+        """한/영 번역과 한/영 요약을 한 번에 요청하는 프롬프트 (JSON 응답)"""
+        return self._build_prompt('complete', f"원문: {processed_text}")
+    
+    @staticmethod
+    def _parse_complete_response(result_text: str) -> Optional[Dict[str, str]]:
+        """통합 응답 JSON에서 네 필드 추출 (실패 시 None)"""
+        json_start = result_text.find('{')
+        json_end = result_text.rfind('}') + 1
+        if json_start == -1 or json_end <= json_start:
+            return None
+        try:
+            result = json.loads(result_text[json_start:json_end])
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(result, dict):
+            return None
+        if not all(isinstance(result.get(field), str) for field in _COMPLETE_RESPONSE_FIELDS):
+            return None
+        return {field: result[field].strip() for field in _COMPLETE_RESPONSE_FIELDS}
+    
+    def _finalize_complete_response(self, parsed: Dict[str, str], e_section: str,
+                                    terms: Sequence[str]) -> Dict[str, str]:
+        """통합 응답을 개별 호출 결과와 같은 후처리 (토큰 복원, 색상 스타일, 요약 정리)"""
+        korean_translation = apply_color_styles(self._finalize_translation(parsed['ko_translation'], 'ko', terms))
+        english_translation = apply_color_styles(self._finalize_translation(parsed['en_translation'], 'en', terms))
+        korean_summary = self._post_process_korean_summary(
+            self._postprocess_translation(parsed['ko_summary'], terms), korean_translation
+        )
+        english_summary = self._post_process_english_summary(
+            self._postprocess_translation(parsed['en_summary'], terms), english_translation
+        )
+        return {
+            'korean_translation': korean_translation,
+            'korean_summary': korean_summary,
+            'english_translation': english_translation,
+            'english_summary': english_summary,
+            'e_section': e_section
+        }
     
-    def perform_translation(self, text: str, target_lang: str, notam_type: str) -> str:
-        """Gemini를 사용하여 NOTAM 번역 수행"""
+    def perform_translation(self, processed_text: str, target_lang: str, notam_type: str,
+                            terms: Sequence[str] = ()) -> str:
+        """
+        Gemini를 사용하여 NOTAM 번역 수행
+        processed_text, terms: E 섹션을 _preprocess_for_translation으로 토큰 처리한 결과
+        """
         try:
-            # E 섹션만 추출하여 번역
-            e_section = self.extract_e_section(text)
-            if not e_section:
+            if not processed_text:
                 return "번역할 내용이 없습니다."
 
-            # 번역하지 않을 용어들을 임시 토큰으로 변환
-            processed_text = self._preprocess_for_translation(e_section)
+            prompt = self._build_translation_prompt(processed_text, target_lang)
+            return self._finalize_translation(
+                self._generate_content(f'translate_{target_lang}', prompt), target_lang, terms
+            )
             
-            if target_lang == "en":
-                prompt = f"""Translate ONLY the following NOTAM text to English. Do not add explanations, comments, or additional information. Return only the direct translation:
-
-{processed_text}"""
-            else:  # Korean
-                prompt = f"""다음 NOTAM 텍스트를 한국어로 번역하세요. 설명, 주석, 추가 정보를 포함하지 마세요. 직접 번역만 반환하세요:
-
-중요한 번역 규칙:
-1. "-- BY SELOE--"는 반드시 "-- SELOE --"로 번역 (BY 제거)
-2. "-- BY SELOQ--"는 반드시 "-- SELOQ --"로 번역 (BY 제거)
-# 3. "BY"는 절대 번역하지 않음
-4. "REF"는 "참조"로 번역
-# 5. "PLZ"는 "제발" 또는 "부탁드립니다"로 번역
-6. "NO_TRANSLATE_TOKEN_숫자" 형태의 토큰은 절대 번역하지 말고 그대로 유지하세요
-7. "1. 2. 3. 4. 5." 같은 번호 목록이 있어도 전체 문장을 끝까지 번역하세요
-8. 번호 목록의 각 항목을 모두 번역하세요
-9. "AS FLW"는 "다음과 같습니다"로 번역하세요
-10. 번호 목록이 있어도 번역을 중단하지 마세요
-11. 반드시 전체 텍스트를 끝까지 번역하세요
-12. "FLOW CTL AS FLW"는 "흐름 통제는 다음과 같습니다"로 번역하세요
-13. 번호 목록의 각 항목을 개별적으로 번역하세요 (예: "1. RTE : A593 VIA SADLI" → "1. 노선: A593 VIA SADLI")
-14. "CEILING"은 반드시 "운고"로 번역하세요
-
-원문: {processed_text}
-
-번역문:"""
-            
-            response = self.model.generate_content(prompt)
-            translated_text = response.text.strip()
-            
-            # 번역 후 원래 용어들로 복원
-            translated_text = self._postprocess_translation(translated_text)
-            
-            # 한국어 번역 시 특별 처리
-            if target_lang == "ko":
-                # "-- BY SELOE--"를 "-- SELOE --"로 변환
-                translated_text = re.sub(r'--\s*BY\s+SELOE\s*--', '-- SELOE --', translated_text, flags=re.IGNORECASE)
-                # "-- BY SELOQ--"를 "-- SELOQ --"로 변환
-                translated_text = re.sub(r'--\s*BY\s+SELOQ\s*--', '-- SELOQ --', translated_text, flags=re.IGNORECASE)
-            
-            # 영어 번역 시 약어 확장 적용
-            if target_lang == "en":
-                translated_text = self._expand_abbreviations(translated_text)
+        except Exception as e:
+            logger.error(f"번역 수행 중 오류 발생: {str(e)}")
+            return _TRANSLATION_ERROR_MESSAGE
+    
+    async def perform_translation_async(self, processed_text: str, target_lang: str, notam_type: str,
+                                        concurrency: _AIMDConcurrencyLimiter, terms: Sequence[str] = ()) -> str:
+        """perform_translation의 비동기 버전"""
+        try:
+            if not processed_text:
+                return "번역할 내용이 없습니다."
             
-            return translated_text
+            prompt = self._build_translation_prompt(processed_text, target_lang)
+            translated_text = await self._generate_content_async(f'translate_{target_lang}', prompt, concurrency)
+            return self._finalize_translation(translated_text, target_lang, terms)
             
         except Exception as e:
             logger.error(f"번역 수행 중 오류 발생: {str(e)}")
-            return "번역 중 오류가 발생했습니다."
+            return _TRANSLATION_ERROR_MESSAGE
     
     def translate_single_notam(self, notam_data: Dict[str, Any]) -> Dict[str, Any]:
         """단일 NOTAM 번역 (병렬 처리용)"""
         try:
-            description = notam_data.get('description', '')
-            original_text = notam_data.get('original_text', description)
-            
-            # 캐시 확인 (임시로 비활성화)
-            # cached_result = self.get_cached_translation(original_text)
-            # if cached_result:
-            #     logger.debug(f"캐시된 번역 사용: {notam_data.get('notam_number', 'UNKNOWN')}")
-            #     enhanced_notam = notam_data.copy()
-            #     enhanced_notam.update(cached_result)
-            #     return enhanced_notam
-            
-            # NOTAM 번호와 타입 추출 (notam_data에서 우선 가져오기)
-            notam_number = notam_data.get('notam_number') or notam_data.get('id') or self.extract_notam_number(original_text)
-            notam_type = self.identify_notam_type(notam_number)
-            
-            # 한국어 번역
-            korean_translation = self.perform_translation(description, 'ko', notam_type)
-            # 색상 스타일 적용
-            korean_translation = apply_color_styles(korean_translation)
-            
-            # 영어 번역
-            english_translation = self.perform_translation(description, 'en', notam_type)
-            # 색상 스타일 적용
-            english_translation = apply_color_styles(english_translation)
-            
-            # 요약 생성
-            korean_summary = self.create_summary(korean_translation, 'ko')
-            english_summary = self.create_summary(english_translation, 'en')
-            
-            # 결과 구성
-            translation_result = {
-                'korean_translation': korean_translation,
-                'korean_summary': korean_summary,
-                'english_translation': english_translation,
-                'english_summary': english_summary,
-                'notam_type': notam_type,
-                'notam_number': notam_number,
-                'e_section': self.extract_e_section(description)
-            }
-            
-            # 캐시 저장
-            self.cache_translation(original_text, translation_result)
-            
-            enhanced_notam = notam_data.copy()
-            enhanced_notam.update(translation_result)
-            
-            logger.info(f"NOTAM 번역 완료: {notam_number} ({notam_type})")
-            return enhanced_notam
+            # 번역/요약(캐시 우선) 후 NOTAM 번호와 타입(notam_data에서 우선 가져오기)을 붙여 결과 구성
+            translated = self._translate_description(notam_data.get('description', ''))
+            return self._build_translation_result(notam_data, translated)
             
         except Exception as e:
             logger.error(f"NOTAM 번역 중 오류: {str(e)}")
-            enhanced_notam = notam_data.copy()
-            enhanced_notam.update({
-                'korean_translation': '번역 실패',
-                'korean_summary': '요약 실패',
-                'english_translation': 'Translation failed',
-                'english_summary': 'Summary failed',
-                'notam_type': 'UNKNOWN',
-                'notam_number': 'UNKNOWN',
-                'e_section': '',
-                'error_message': str(e)
-            })
-            return enhanced_notam
+            return self._failed_translation(notam_data, e)
+    
+    def _translate_description(self, description: str, cache_key: Optional[str] = None) -> Dict[str, str]:
+        """description 번역/요약 (캐시에 있으면 Gemini를 호출하지 않음, cache_key는 description의 키)"""
+        if cache_key is None:
+            cache_key = self.get_cache_key(description)
+        translated = self.get_cached_translation_by_key(cache_key)
+        if translated is None:
+            translated = self._request_description_translation(description)
+            if self._is_cacheable_translation(translated):
+                self.cache_translation_by_key(cache_key, translated)
+        return translated
+    
+    def _request_description_translation(self, description: str) -> Dict[str, str]:
+        """description 번역/요약 (Gemini 호출 부분) - 통합 호출 1회, 실패 시 개별 호출 4회"""
+        e_section = self.extract_e_section(description)
+        if self._is_empty_notam(description, e_section):
+            return self._empty_translation(e_section)
+        # 번역하지 않을 용어들을 임시 토큰으로 변환 (통합 호출과 개별 호출에서 함께 사용)
+        processed_text, terms = self._preprocess_for_translation(e_section)
+        if processed_text:
+            try:
+                prompt = self._build_complete_prompt(processed_text)
+                parsed = self._parse_complete_response(self._generate_content('complete', prompt, _JSON_RESPONSE_CONFIG))
+                if parsed:
+                    return self._finalize_complete_response(parsed, e_section, terms)
+                logger.warning("Gemini 통합 응답 파싱 실패 - 개별 번역/요약으로 재시도")
+            except Exception as e:
+                logger.warning(f"Gemini 통합 호출 실패 - 개별 번역/요약으로 재시도: {str(e)}")
+        return self._translate_description_separately(e_section, processed_text, terms)
+    
+    @staticmethod
+    def _is_cacheable_translation(translated: Dict[str, str]) -> bool:
+        """번역 호출이 실패한 결과는 다음 요청에서 다시 시도하도록 캐시하지 않음"""
+        return _TRANSLATION_ERROR_MESSAGE not in (translated.get('korean_translation'),
+                                                  translated.get('english_translation'))
+    
+    @staticmethod
+    def _is_empty_notam(description: str, e_section: str) -> bool:
+        """번역할 내용이 없는 NOTAM인지 확인 (빈 E 섹션, 너무 짧은 본문, NO CURRENT NOTAMS FOUND 표시만 있는 경우)"""
+        return len(e_section) < _MIN_E_SECTION_LENGTH or bool(_NO_CURRENT_ONLY_RE.fullmatch(description))
+    
+    @staticmethod
+    def _empty_translation(e_section: str) -> Dict[str, str]:
+        """번역할 내용이 없는 NOTAM의 고정 결과 (Gemini 호출 없음)"""
+        return {
+            'korean_translation': '해당 없음',
+            'korean_summary': '해당 없음',
+            'english_translation': 'N/A',
+            'english_summary': 'N/A',
+            'e_section': e_section
+        }
+    
+    def _translate_description_separately(self, e_section: str, processed_text: str,
+                                          terms: Sequence[str]) -> Dict[str, str]:
+        """E 섹션 번역/요약을 한/영 번역, 한/영 요약 개별 호출로 처리"""
+        # 색상 스타일 적용
+        korean_translation = apply_color_styles(self.perform_translation(processed_text, 'ko', '', terms))
+        english_translation = apply_color_styles(self.perform_translation(processed_text, 'en', '', terms))
+        
+        # 요약 생성
+        korean_summary = self.create_summary(korean_translation, 'ko')
+        english_summary = self.create_summary(english_translation, 'en')
+        
+        return {
+            'korean_translation': korean_translation,
+            'korean_summary': korean_summary,
+            'english_translation': english_translation,
+            'english_summary': english_summary,
+            'e_section': e_section
+        }
+    
+    async def _translate_description_async(self, description: str, concurrency: _AIMDConcurrencyLimiter,
+                                           cache_key: Optional[str] = None) -> Dict[str, str]:
+        """_translate_description의 비동기 버전 (SQLite 캐시 조회/저장은 스레드에서 실행)"""
+        if cache_key is None:
+            cache_key = self.get_cache_key(description)
+        translated = await self._run_in_executor(self.get_cached_translation_by_key, cache_key)
+        if translated is None:
+            translated = await self._request_description_translation_async(description, concurrency)
+            if self._is_cacheable_translation(translated):
+                await self._run_in_executor(self.cache_translation_by_key, cache_key, translated)
+        return translated
+    
+    async def _request_description_translation_async(self, description: str,
+                                                     concurrency: _AIMDConcurrencyLimiter) -> Dict[str, str]:
+        """_request_description_translation의 비동기 버전"""
+        e_section = self.extract_e_section(description)
+        if self._is_empty_notam(description, e_section):
+            return self._empty_translation(e_section)
+        # 번역하지 않을 용어들을 임시 토큰으로 변환 (통합 호출과 개별 호출에서 함께 사용)
+        processed_text, terms = self._preprocess_for_translation(e_section)
+        if processed_text:
+            try:
+                prompt = self._build_complete_prompt(processed_text)
+                parsed = self._parse_complete_response(
+                    await self._generate_content_async('complete', prompt, concurrency, _JSON_RESPONSE_CONFIG)
+                )
+                if parsed:
+                    return self._finalize_complete_response(parsed, e_section, terms)
+                logger.warning("Gemini 통합 응답 파싱 실패 - 개별 번역/요약으로 재시도")
+            except Exception as e:
+                logger.warning(f"Gemini 통합 호출 실패 - 개별 번역/요약으로 재시도: {str(e)}")
+        return await self._translate_description_separately_async(e_section, processed_text, terms, concurrency)
+    
+    async def _translate_description_separately_async(self, e_section: str, processed_text: str, terms: Sequence[str],
+                                                      concurrency: _AIMDConcurrencyLimiter) -> Dict[str, str]:
+        """_translate_description_separately의 비동기 버전 - 한/영 번역과 한/영 요약을 각각 동시에 요청"""
+        # 프롬프트에 NOTAM 타입은 들어가지 않으므로 결과는 description에만 의존
+        korean_translation, english_translation = await asyncio.gather(
+            self.perform_translation_async(processed_text, 'ko', '', concurrency, terms),
+            self.perform_translation_async(processed_text, 'en', '', concurrency, terms)
+        )
+        # 색상 스타일 적용
+        korean_translation = apply_color_styles(korean_translation)
+        english_translation = apply_color_styles(english_translation)
+        
+        # 요약 생성
+        korean_summary, english_summary = await asyncio.gather(
+            self.create_summary_async(korean_translation, 'ko', concurrency),
+            self.create_summary_async(english_translation, 'en', concurrency)
+        )
+        
+        return {
+            'korean_translation': korean_translation,
+            'korean_summary': korean_summary,
+            'english_translation': english_translation,
+            'english_summary': english_summary,
+            'e_section': e_section
+        }
+    
+    def _build_translation_result(self, notam_data: Dict[str, Any], translated: Dict[str, str]) -> Dict[str, Any]:
+        """description 번역 결과에 NOTAM 번호/타입을 붙여 최종 결과 생성"""
+        description = notam_data.get('description', '')
+        original_text = notam_data.get('original_text', description)
+        
+        notam_number = notam_data.get('notam_number') or notam_data.get('id') or self.extract_notam_number(original_text)
+        notam_type = self.identify_notam_type(notam_number)
+        
+        enhanced_notam = notam_data.copy()
+        enhanced_notam.update(translated)
+        enhanced_notam.update(notam_type=notam_type, notam_number=notam_number)
+        
+        logger.info(f"NOTAM 번역 완료: {notam_number} ({notam_type})")
+        return enhanced_notam
+    
+    async def translate_single_notam_async(self, notam_data: Dict[str, Any],
+                                           concurrency: _AIMDConcurrencyLimiter) -> Dict[str, Any]:
+        """단일 NOTAM 번역 (비동기 병렬 처리용)"""
+        try:
+            translated = await self._translate_description_async(notam_data.get('description', ''), concurrency)
+            return self._build_translation_result(notam_data, translated)
+        except Exception as e:
+            logger.error(f"NOTAM 번역 중 오류: {str(e)}")
+            return self._failed_translation(notam_data, e)
+    
+    @staticmethod
+    def _failed_translation(notam_data: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """번역 실패 시 원본 데이터에 실패 표시를 붙인 결과"""
+        enhanced_notam = notam_data.copy()
+        enhanced_notam.update({
+            'korean_translation': '번역 실패',
+            'korean_summary': '요약 실패',
+            'english_translation': 'Translation failed',
+            'english_summary': 'Summary failed',
+            'notam_type': 'UNKNOWN',
+            'notam_number': 'UNKNOWN',
+            'e_section': '',
+            'error_message': str(error)
+        })
+        return enhanced_notam
     
     def create_summary(self, translation: str, language: str) -> str:
         """고급 요약 생성 (summary.py 기반)"""
@@ -450,43 +1043,37 @@ class ParallelHybridNOTAMTranslator:
             # 폴백: 간단한 키워드 기반 요약
             return self._create_simple_summary(translation, language)
     
+    def _build_korean_summary_prompt(self, translation: str) -> str:
+        """한국어 요약 프롬프트 생성"""
+        return self._build_prompt('summary_ko', f"번역된 NOTAM:\n{translation}")
+    
+    def _build_english_summary_prompt(self, translation: str) -> str:
+        """영어 요약 프롬프트 생성"""
+        return self._build_prompt('summary_en', f"NOTAM Translation:\n{translation}")
+    
+    async def create_summary_async(self, translation: str, language: str,
+                                   concurrency: _AIMDConcurrencyLimiter) -> str:
+        """create_summary의 비동기 버전"""
+        try:
+            if language == 'ko':
+                summary = await self._generate_content_async(
+                    'summary_ko', self._build_korean_summary_prompt(translation), concurrency
+                )
+                return self._post_process_korean_summary(summary, translation)
+            else:
+                summary = await self._generate_content_async(
+                    'summary_en', self._build_english_summary_prompt(translation), concurrency
+                )
+                return self._post_process_english_summary(summary, translation)
+        except Exception as e:
+            logger.error(f"요약 생성 중 오류: {str(e)}")
+            # 폴백: 간단한 키워드 기반 요약
+            return self._create_simple_summary(translation, language)
+    
     def _create_korean_summary(self, translation: str) -> str:
         """한국어 고급 요약 생성"""
         try:
-            prompt = f"""다음 NOTAM 번역을 한국어로 요약하되, 핵심 정보만 포함하도록 하세요:
-
-번역된 NOTAM:
-{translation}
-
-⚠️ 가장 중요한 규칙: ⚠️
-1. 절대로 다음 정보를 포함하지 마세요:
-   - 시간 정보 (날짜, 시간, 기간, UTC)
-   - 문서 참조 (AIRAC, AIP, AMDT, SUP)
-   - "새로운 정보", "정보 포함", "정보 변경" 등의 표현
-   - 공항명
-   - 좌표
-   - 불필요한 괄호나 특수문자
-   - 중복되는 단어나 구문
-
-2. 포함할 내용:
-   - 주요 변경사항 또는 영향
-   - 변경사항의 구체적 세부사항
-   - 변경 사유
-
-3. 간단명료하게 작성:
-   - 가능한 짧게 표현
-   - 직접적이고 능동적인 표현 사용
-   - 핵심 정보만 포함
-
-4. 활주로 방향 표시:
-   - 항상 "L/R" 형식을 사용하세요 (예: "활주로 15 L/R")
-   - "L/R"을 "좌/우"로 번역하지 마세요
-   - 활주로 번호와 L/R 사이에 공백을 유지하세요 (예: "활주로 15 L/R")
-
-핵심 정보를 간단히 요약해주세요."""
-
-            response = self.model.generate_content(prompt)
-            summary = response.text.strip()
+            summary = self._generate_content('summary_ko', self._build_korean_summary_prompt(translation))
             
             # 후처리: 불필요한 정보 제거
             summary = self._post_process_korean_summary(summary, translation)
@@ -500,40 +1087,7 @@ class ParallelHybridNOTAMTranslator:
     def _create_english_summary(self, translation: str) -> str:
         """영어 고급 요약 생성"""
         try:
-            prompt = f"""Summarize the following NOTAM translation in English, focusing on key information only:
-
-NOTAM Translation:
-{translation}
-
-⚠️ MOST IMPORTANT RULES: ⚠️
-1. NEVER include ANY of the following:
-   - Time information (dates, times, periods, UTC)
-   - Document references (AIRAC, AIP, AMDT, SUP)
-   - Phrases like "New information is available", "Information regarding", "Information about"
-   - Airport names
-   - Coordinates
-   - Unnecessary parentheses or special characters
-   - Redundant words and phrases
-
-2. Focus on:
-   - Key changes or impacts
-   - Specific details about changes
-   - Reasons for changes
-
-3. Keep it concise and clear:
-   - Make it as short as possible
-   - Use direct and active voice
-   - Include only essential information
-
-4. For runway directions:
-   - Always use "L/R" format (e.g., "RWY 15 L/R")
-   - Do not translate "L/R" to "LEFT/RIGHT" or "좌/우"
-   - Keep the space between runway number and L/R (e.g., "RWY 15 L/R")
-
-Provide a brief summary that captures the essential information."""
-
-            response = self.model.generate_content(prompt)
-            summary = response.text.strip()
+            summary = self._generate_content('summary_en', self._build_english_summary_prompt(translation))
             
             # 후처리: 불필요한 정보 제거
             summary = self._post_process_english_summary(summary, translation)
@@ -546,27 +1100,8 @@ Provide a brief summary that captures the essential information."""
     
     def _post_process_korean_summary(self, summary: str, translation: str) -> str:
         """한국어 요약 후처리"""
-        import re
-        
-        # 공항명 패턴 제거
-        airport_pattern = r'[가-힣]+(?:국제)?공항'
-        summary = re.sub(airport_pattern, '', summary)
-        
-        # 시간 정보 패턴 제거
-        time_patterns = [
-            r'\d{2}/\d{2}\s+\d{2}:\d{2}\s*-\s*\d{2}/\d{2}\s+\d{2}:\d{2}',
-            r'\(\d{2}/\d{2}\s+\d{2}:\d{2}\s*-\s*\d{2}/\d{2}\s+\d{2}:\d{2}\)',
-            r'\d{2}/\d{2}',
-            r'\d{2}:\d{2}',
-            r'\d{4}\s*UTC',
-            r'\d{4}년\s*\d{1,2}월\s*\d{1,2}일',
-            r'~까지',
-            r'부터',
-            r'까지'
-        ]
-        
-        for pattern in time_patterns:
-            summary = re.sub(pattern, '', summary)
+        # 공항명과 시간 정보 패턴 제거
+        summary = _KO_AIRPORT_OR_TIME_RE.sub('', summary)
         
         # 주기장 정보 특별 처리
         if '주기장' in summary or 'STANDS' in translation.upper() or 'STAND' in translation.upper():
@@ -574,15 +1109,8 @@ Provide a brief summary that captures the essential information."""
             all_numbers = []
             
             # 다양한 패턴으로 주기장 번호 추출
-            patterns = [
-                r'STANDS?\s*(?:NR\.)?\s*(\d+)(?:\s*(?:가|changing to|to)\s*(\d+))?,?\s*(?:,\s*(\d+))?',
-                r'주기장\s*(\d+)(?:\s*(?:에서|가|changing to|to)\s*(\d+))?,?\s*(?:,\s*(\d+))?',
-                r',\s*(\d+)(?:\s*closed)?'
-            ]
-            
-            for pattern in patterns:
-                matches = re.finditer(pattern, translation)
-                for match in matches:
+            for pattern in _STAND_PATTERNS:
+                for match in pattern.finditer(translation):
                     groups = match.groups()
                     all_numbers.extend([num for num in groups if num])
             
@@ -593,7 +1121,7 @@ Provide a brief summary that captures the essential information."""
                 if '운용 제한' in translation or '운항 제한' in translation:
                     summary += ", 운용 제한"
             else:
-                current_numbers = re.findall(r'\d+', summary)
+                current_numbers = _DIGITS_RE.findall(summary)
                 if current_numbers:
                     current_numbers = sorted(list(set(current_numbers)), key=int)
                     stands_text = ', '.join(current_numbers)
@@ -602,30 +1130,18 @@ Provide a brief summary that captures the essential information."""
                         summary += ", 운용 제한"
         
         # 불필요한 공백과 쉼표 정리
-        summary = re.sub(r'\s+', ' ', summary)
-        summary = re.sub(r',\s*,', ',', summary)
-        summary = re.sub(r'\s*,\s*$', '', summary)
+        summary = _WS_RE.sub(' ', summary)
+        summary = _EXTRA_COMMA_RE.sub(lambda match: ',' if summary[match.end():].strip() else '', summary)
         
         return summary.strip()
     
     def _post_process_english_summary(self, summary: str, translation: str) -> str:
         """영어 요약 후처리"""
-        import re
-        
         # 시간 정보 패턴 제거
-        time_patterns = [
-            r'\d{2}/\d{2}\s+\d{2}:\d{2}\s*-\s*\d{2}/\d{2}\s+\d{2}:\d{2}',
-            r'\(\d{2}/\d{2}\s+\d{2}:\d{2}\s*-\s*\d{2}/\d{2}\s+\d{2}:\d{2}\)',
-            r'\d{2}/\d{2}',
-            r'\d{2}:\d{2}',
-            r'\d{4}\s*UTC'
-        ]
-        
-        for pattern in time_patterns:
-            summary = re.sub(pattern, '', summary)
+        summary = _TIME_RE_EN.sub('', summary)
         
         # 불필요한 공백 정리
-        summary = re.sub(r'\s+', ' ', summary)
+        summary = _WS_RE.sub(' ', summary)
         
         return summary.strip()
     
@@ -666,67 +1182,99 @@ Provide a brief summary that captures the essential information."""
             else:
                 return "Aviation related NOTAM"
     
-    def process_notams_parallel(self, notams_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """병렬 처리로 NOTAM들을 처리합니다."""
+    async def process_notams_parallel_async(self, notams_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """asyncio로 NOTAM들을 동시에 처리합니다 (결과는 입력 순서 유지)."""
         if not notams_data:
             return []
         
-        logger.info(f"병렬 번역 시작: {len(notams_data)}개 NOTAM (최대 {self.max_workers}개 동시 처리)")
+        logger.info(f"병렬 번역 시작: {len(notams_data)}개 NOTAM (최대 {self.max_workers}개 동시 요청)")
         start_time = time.time()
         
-        results = []
+        # 동시 요청 수 제한 (AIMD로 조절, 분당 요청 수는 self._rate_limiter가 제한)
+        concurrency = _AIMDConcurrencyLimiter(self._concurrency, max(GEMINI_MAX_CONCURRENCY, self.max_workers))
         
-        # ThreadPoolExecutor를 사용한 병렬 처리
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # 모든 NOTAM에 대해 번역 작업 제출
-            future_to_notam = {
-                executor.submit(self.translate_single_notam, notam): notam 
-                for notam in notams_data
-            }
-            
-            # 완료된 작업들을 순서대로 수집
-            completed_count = 0
-            for future in as_completed(future_to_notam):
-                try:
-                    result = future.result()
-                    results.append(result)
-                    completed_count += 1
-                    
-                    logger.info(f"병렬 번역 진행: {completed_count}/{len(notams_data)} 완료")
-                    
-                except Exception as e:
-                    logger.error(f"병렬 번역 중 오류: {str(e)}")
-                    # 오류 발생 시 원본 데이터로 결과 생성
-                    original_notam = future_to_notam[future]
-                    error_result = original_notam.copy()
-                    error_result.update({
-                        'korean_translation': '번역 실패',
-                        'korean_summary': '요약 실패',
-                        'english_translation': 'Translation failed',
-                        'english_summary': 'Summary failed',
-                        'notam_type': 'UNKNOWN',
-                        'notam_number': 'UNKNOWN',
-                        'e_section': '',
-                        'error_message': str(e)
-                    })
-                    results.append(error_result)
-        
-        # 원래 순서대로 정렬 (필요한 경우)
-        # results.sort(key=lambda x: notams_data.index(x) if x in notams_data else 0)
+        # 같은 description은 Gemini를 한 번만 호출하고 결과를 공유 (입력 순서의 인덱스로 그룹화)
+        groups = {}
+        for idx, notam in enumerate(notams_data):
+            groups.setdefault(self.get_cache_key(notam.get('description', '')), []).append(idx)
+        if len(groups) < len(notams_data):
+            logger.info(f"중복 NOTAM 본문 제외: {len(notams_data)}개 중 {len(groups)}개만 번역 요청")
+        
+        results = [None] * len(notams_data)
+        completed_count = 0
+        
+        async def translate_group(description_key: str, indices: List[int]) -> None:
+            nonlocal completed_count
+            description = notams_data[indices[0]].get('description', '')
+            try:
+                # 그룹 키가 곧 description의 캐시 키이므로 다시 계산하지 않고 넘김
+                translated = await self._translate_description_async(description, concurrency, description_key)
+            except Exception as e:
+                logger.error(f"병렬 번역 중 오류: {str(e)}")
+                # 오류 발생 시 원본 데이터로 결과 생성
+                for idx in indices:
+                    results[idx] = self._failed_translation(notams_data[idx], e)
+            else:
+                for idx in indices:
+                    try:
+                        results[idx] = self._build_translation_result(notams_data[idx], translated)
+                    except Exception as e:
+                        logger.error(f"NOTAM 번역 중 오류: {str(e)}")
+                        results[idx] = self._failed_translation(notams_data[idx], e)
+            completed_count += len(indices)
+            logger.info(f"병렬 번역 진행: {completed_count}/{len(notams_data)} 완료")
+        
+        await asyncio.gather(*(translate_group(key, indices) for key, indices in groups.items()))
+        self._concurrency = concurrency.capacity
         
         end_time = time.time()
         processing_time = end_time - start_time
         
-        logger.info(f"병렬 번역 완료: {len(results)}개 NOTAM, {processing_time:.2f}초")
+        logger.info(f"병렬 번역 완료: {len(results)}개 NOTAM, {processing_time:.2f}초 (동시 요청 수 {int(self._concurrency)})")
         logger.info(f"평균 처리 시간: {processing_time/len(results):.2f}초/NOTAM")
         
         return results
+    
+    def process_notams_parallel(self, notams_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """병렬 처리로 NOTAM들을 처리합니다 (process_notams_parallel_async 동기 래퍼, 결과는 입력 순서 유지)."""
+        if not notams_data:
+            return []
+        # 이벤트 루프는 배치마다 만들고 닫지만 스레드 풀은 인스턴스의 것을 재사용
+        with asyncio.Runner() as runner:
+            return runner.run(self.process_notams_parallel_async(notams_data))
+    
+    def _get_executor(self) -> concurrent.futures.ThreadPoolExecutor:
+        """인스턴스 공용 스레드 풀 (처음 사용할 때 생성)"""
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix='notam-translator'
+                )
+            return self._executor
+    
+    async def _run_in_executor(self, func, *args):
+        """
+        동기 함수를 인스턴스 공용 스레드 풀에서 실행
+        루프의 기본 실행기(asyncio.to_thread)는 asyncio.Runner가 닫힐 때 함께 종료되므로 배치 간에 공유할 수 없음
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._get_executor(), functools.partial(func, *args))
+    
+    def close(self):
+        """공용 스레드 풀 종료 (이후 호출에서는 다시 생성)"""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+@functools.cache
+def _get_default_translator() -> ParallelHybridNOTAMTranslator:
+    """편의 함수용 번역기 (프로세스당 한 번만 생성)"""
+    return ParallelHybridNOTAMTranslator()
 
 # 편의 함수
 def translate_notams_parallel(notams_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    """병렬 NOTAM 번역 (원샷 함수)"""
-    translator = ParallelHybridNOTAMTranslator()
-    return translator.process_notams_parallel(notams_data)
+    """병렬 NOTAM 번역 (원샷 함수, results[i]는 notams_data[i]의 번역 결과)"""
+    return _get_default_translator().process_notams_parallel(notams_data)
 
 if __name__ == "__main__":
     # 테스트 코드
@@ -2,7 +2,7 @@ import os
 import re
 import pdfplumber
 import logging
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator
 
 class PDFConverter:
     """PDF를 텍스트로 변환하고 NOTAM을 분리하는 클래스"""
@@ -10,14 +10,19 @@ class PDFConverter:
     def __init__(self):
         self.logger = logging.getLogger(__name__)
     
-    def _extract_text_from_pdf(self, pdf_path: str) -> str:
-        """PDF에서 텍스트 추출"""
-        all_text = ""
-        with pdfplumber.open(pdf_path) as pdf:
+    def iter_convert_pdf_to_text(self, pdf_path: str) -> Iterator[str]:
+        """PDF 페이지별 텍스트를 하나씩 생성 (추출한 페이지의 레이아웃 캐시는 바로 해제)"""
+        # 큰 PDF의 read() 호출 수를 줄이기 위해 1 MiB 버퍼로 열기
+        with open(pdf_path, 'rb', buffering=1024 * 1024) as f, pdfplumber.open(f) as pdf:
             for page in pdf.pages:
                 page_text = page.extract_text()
+                page.flush_cache()
                 if page_text:
-                    all_text += page_text + "\n"
+                    yield page_text + "\n"
+    
+    def _extract_text_from_pdf(self, pdf_path: str) -> str:
+        """PDF에서 텍스트 추출"""
+        all_text = ''.join(self.iter_convert_pdf_to_text(pdf_path))
         
         # 인코딩 문제 패턴 제거
         all_text = self._clean_encoding_issues(all_text)
@@ -45,9 +50,8 @@ class PDFConverter:
             return 'package'
         return 'airport'
     
-    def _process_airport_notam(self, pdf_path: str, save_temp=True) -> str:
-        """공항 NOTAM 처리 (pdf_to_txt_test_airport.py 기반)"""
-        all_text = self._extract_text_from_pdf(pdf_path)
+    def _process_airport_notam(self, all_text: str) -> List[str]:
+        """공항 NOTAM 처리 (pdf_to_txt_test_airport.py 기반, all_text는 _extract_text_from_pdf 결과)"""
         
         def split_notams(text):
             """NOTAM 분리 함수 (pdf_to_txt_test_airport.py 기반)"""
@@ -95,20 +99,10 @@ class PDFConverter:
         # 필터링을 NOTAM 분리 후에 적용 (pdf_to_txt_test_airport.py와 동일)
         split_notams_list_cleaned = [remove_unwanted_lines_from_notam(notam) for notam in split_notams_list]
 
-        if save_temp:
-            base_name = os.path.splitext(os.path.basename(pdf_path))[0]
-            out_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'temp', base_name + "_split.txt")
-            os.makedirs(os.path.dirname(out_path), exist_ok=True)
-            
-            with open(out_path, "w", encoding="utf-8") as f:
-                for notam in split_notams_list_cleaned:
-                    f.write(notam + "\n" + ("="*60) + "\n")
-
-        return '\n\n'.join(split_notams_list_cleaned) + '\n'
+        return split_notams_list_cleaned
     
-    def _process_package_notam(self, pdf_path: str, save_temp=True) -> str:
-        """패키지 NOTAM 처리 (pdf_to_txt_test_package.py 기반)"""
-        all_text = self._extract_text_from_pdf(pdf_path)
+    def _process_package_notam(self, all_text: str) -> List[str]:
+        """패키지 NOTAM 처리 (pdf_to_txt_test_package.py 기반, all_text는 _extract_text_from_pdf 결과)"""
 
         def merge_notam_lines(text):
             """NOTAM 라인 병합 (pdf_to_txt_test_package.py 기반)"""
@@ -200,20 +194,22 @@ class PDFConverter:
             return '\n'.join([line for line in notam.split('\n') if not any(keyword in line for keyword in unwanted_keywords)])
         split_notams_list_cleaned = [remove_unwanted_lines_from_notam(notam) for notam in split_notams_list]
 
-        if save_temp:
-            base_name = os.path.splitext(os.path.basename(pdf_path))[0]
-            out_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'temp', base_name + "_split.txt")
-            os.makedirs(os.path.dirname(out_path), exist_ok=True)
-            
-            with open(out_path, "w", encoding="utf-8") as f:
-                for notam in split_notams_list_cleaned:
-                    f.write(notam + "\n" + ("="*60) + "\n")
-
-        return '\n\n'.join(split_notams_list_cleaned) + '\n'
+        return split_notams_list_cleaned
     
-    def convert_pdf_to_text(self, pdf_path: str, save_temp=True) -> str:
+    def save_split_notams(self, pdf_path: str, split_notams: List[str]):
+        """분리된 NOTAM을 temp 폴더의 _split.txt 파일로 저장"""
+        base_name = os.path.splitext(os.path.basename(pdf_path))[0]
+        out_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'temp', base_name + "_split.txt")
+        os.makedirs(os.path.dirname(out_path), exist_ok=True)
+        
+        # NOTAM마다 write하지 않고 전체 문자열을 만들어 한 번에 기록
+        separator = "\n" + ("="*60) + "\n"
+        with open(out_path, "w", encoding="utf-8") as f:
+            f.write(''.join(notam + separator for notam in split_notams))
+    
+    def split_pdf_notams(self, pdf_path: str) -> List[str]:
         """
-        PDF 파일을 텍스트로 변환하고, 유형을 자동 감지하여 적절한 처리 적용
+        PDF 파일에서 텍스트를 추출하고, 유형을 자동 감지하여 NOTAM 단위로 분리
         """
         try:
             self.logger.info(f"PDF 파일에서 텍스트 추출 시작: {pdf_path}")
@@ -222,23 +218,39 @@ class PDFConverter:
             
             if not all_text.strip():
                 self.logger.warning("추출된 텍스트가 비어있습니다.")
-                return ""
+                return []
             
             notam_type = self._detect_notam_type(all_text)
             self.logger.info(f"NOTAM 유형 감지: {notam_type}")
             
+            # 이미 추출한 텍스트를 그대로 사용 (PDF를 다시 파싱하지 않음)
             if notam_type == 'package':
                 self.logger.info("패키지 NOTAM 처리 시작")
-                result = self._process_package_notam(pdf_path, save_temp=save_temp)
+                split_notams = self._process_package_notam(all_text)
             else:
                 self.logger.info("공항 NOTAM 처리 시작")
-                result = self._process_airport_notam(pdf_path, save_temp=save_temp)
+                split_notams = self._process_airport_notam(all_text)
             
-            self.logger.info(f"NOTAM 처리 완료: {len(result)} 문자")
-            return result
+            self.logger.info(f"NOTAM 분리 완료: {len(split_notams)}개")
+            return split_notams
             
         except Exception as e:
             self.logger.error(f"PDF 변환 중 오류 발생: {str(e)}")
             import traceback
             self.logger.error(f"상세 오류: {traceback.format_exc()}")
             raise Exception(f"PDF 변환 중 오류가 발생했습니다: {str(e)}")
+    
+    def convert_pdf_to_text(self, pdf_path: str, save_temp=True) -> str:
+        """
+        PDF 파일을 텍스트로 변환하고, 유형을 자동 감지하여 적절한 처리 적용
+        """
+        split_notams = self.split_pdf_notams(pdf_path)
+        if not split_notams:
+            return ""
+        
+        if save_temp:
+            self.save_split_notams(pdf_path, split_notams)
+        
+        result = '\n\n'.join(split_notams) + '\n'
+        self.logger.info(f"NOTAM 처리 완료: {len(result)} 문자")
+        return result
@@ -31,7 +31,7 @@ def test_point_in_polygon():
     print("FIR 경계 정보:")
     for fir_code, boundary in boundary_db.fir_boundaries.items():
         print(f"  {fir_code}: {len(boundary)}개 좌표")
-        if boundary:
+        if len(boundary):
             print(f"    첫 번째 좌표: {boundary[0]}")
             print(f"    마지막 좌표: {boundary[-1]}")
     
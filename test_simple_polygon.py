@@ -52,7 +52,11 @@ def test_simple_polygon():
         print(f"  Ray Casting: {'✅ 내부' if in_polygon else '❌ 외부'}")
         
         # 간단한 알고리즘
-        in_simple = polygon_checker.is_point_in_polygon_simple((lat, lon), kzak_boundary)
+        # 날짜변경선에서 나뉜 하위 다각형 중 하나라도 포함하면 내부
+        in_simple = any(
+            polygon_checker.is_point_in_polygon_simple((lat, lon), part['lats'], part['lons'], part['bbox'])
+            for part in boundary_db.fir_polygons['KZAK']
+        )
         print(f"  Simple: {'✅ 내부' if in_simple else '❌ 외부'}")
 
 if __name__ == "__main__":
@@ -0,0 +1,46 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.fir_boundaries import fir_identifier, identify_fir_by_coordinate, identify_firs_by_coordinates
+
+# 날짜변경선(180도) 양쪽의 KZAK 내부 좌표 (위도, 경도)
+KZAK_POINTS = [
+    (20.0, 175.0),
+    (20.0, 179.9),
+    (20.0, -179.9),
+    (20.0, -175.0),
+]
+
+# 같은 위도대의 KZAK 외부 좌표 - 분할 전에는 -180~180 전체 경계 박스에 잘못 포함됨
+OUTSIDE_POINTS = [
+    (20.0, 125.0),
+    (20.0, -115.0),
+]
+
+
+@pytest.mark.parametrize('lat, lon', KZAK_POINTS)
+def test_kzak_both_sides_of_antimeridian(lat, lon):
+    assert fir_identifier.identify_fir_by_coordinate(lat, lon) == 'KZAK'
+    assert identify_fir_by_coordinate(lat, lon) == 'KZAK'
+
+
+@pytest.mark.parametrize('lat, lon', OUTSIDE_POINTS)
+def test_same_latitude_band_outside_kzak(lat, lon):
+    assert fir_identifier.identify_fir_by_coordinate(lat, lon) is None
+    assert identify_fir_by_coordinate(lat, lon) is None
+
+
+def test_kzak_parts_split_at_antimeridian():
+    # 하위 다각형마다 경도 범위가 180도를 넘지 않아야 함
+    for part in fir_identifier.boundary_db.fir_polygons['KZAK']:
+        min_lat, max_lat, min_lon, max_lon = part['bbox']
+        assert max_lon - min_lon < 180.0
+
+
+def test_batch_lookup_matches_point_lookup():
+    firs = identify_firs_by_coordinates(KZAK_POINTS + OUTSIDE_POINTS)
+    assert list(firs) == ['KZAK'] * len(KZAK_POINTS) + [None] * len(OUTSIDE_POINTS)
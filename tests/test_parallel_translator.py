@@ -0,0 +1,67 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.parallel_translator import AIRPORTS_CSV_PATH, ParallelHybridNOTAMTranslator
+
+NO_CURRENT_FOOTER = '******** NO CURRENT NOTAMS FOUND ********'
+
+
+@pytest.fixture
+def translator():
+    """Gemini/캐시 초기화 없이 번역 전후처리에 필요한 상태만 갖춘 번역기"""
+    translator = ParallelHybridNOTAMTranslator.__new__(ParallelHybridNOTAMTranslator)
+    translator.no_translate_terms, translator._term_re = \
+        ParallelHybridNOTAMTranslator._load_airport_codes_cached(AIRPORTS_CSV_PATH)
+    translator._models = {}
+    return translator
+
+
+@pytest.fixture
+def gemini_calls(translator, monkeypatch):
+    """Gemini 호출을 기록하고 처리된 텍스트를 그대로 돌려주는 통합 응답으로 대체"""
+    calls = []
+    
+    def fake_generate_content(kind, prompt, generation_config=None):
+        calls.append(kind)
+        body = prompt.rsplit('원문: ', 1)[-1]
+        return json.dumps({
+            'ko_translation': body,
+            'en_translation': body,
+            'ko_summary': body,
+            'en_summary': body,
+        })
+    
+    monkeypatch.setattr(translator, '_generate_content', fake_generate_content)
+    return calls
+
+
+def test_e_section_before_no_current_footer_is_translated(translator, gemini_calls):
+    description = f'E) RWY 15L/33R CLSD DUE TO MAINT\n{NO_CURRENT_FOOTER}'
+    
+    result = translator._request_description_translation(description)
+    
+    assert gemini_calls == ['complete']
+    assert 'NO CURRENT' not in result['e_section']
+    assert 'CLSD' in result['e_section']
+
+
+def test_no_current_footer_only_skips_translation(translator, gemini_calls):
+    result = translator._request_description_translation(NO_CURRENT_FOOTER)
+    
+    assert gemini_calls == []
+    assert result['korean_translation'] == '해당 없음'
+
+
+def test_source_private_use_characters_round_trip(translator):
+    # PDF 기호 글꼴에서 나온 사용자 정의 영역 글자가 토큰 복원 과정에서 다른 용어로 바뀌지 않아야 함
+    text = 'RWY 15L/33R  CLSD  RKSI'
+    
+    processed_text, terms = translator._preprocess_for_translation(text)
+    
+    assert 'RWY' not in processed_text
+    assert translator._postprocess_translation(processed_text, terms) == text